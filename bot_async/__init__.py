@@ -0,0 +1,5 @@
+from . import state_storage
+from . import loader
+from . import errors
+from . import services
+from . import handlers
@@ -0,0 +1,41 @@
+import asyncio
+
+from telebot.asyncio_filters import StateFilter
+from telebot.asyncio_helper import ApiTelegramException
+from telebot.types import BotCommand
+
+from bot_async import handlers
+from bot_async.loader import bot
+from config_data.config import DEFAULT_COMMANDS
+from logs.logging_config import log
+from site_API.async_core import async_client
+
+
+async def main() -> None:
+    """
+    Запускает асинхронный вариант бота: все обновления обрабатываются в одном цикле событий, а блокирующие
+    операции с базами данных выполняются в пуле потоков. Запуск: `python -m bot_async`.
+    """
+    bot.add_custom_filter(StateFilter(bot))
+    try:
+        await bot.set_my_commands([BotCommand(*elem) for elem in DEFAULT_COMMANDS])
+        # Получение обновлений долгим опросом невозможно, пока у бота установлен вебхук
+        await bot.remove_webhook()
+        await bot.infinity_polling(skip_pending=True)
+    finally:
+        await async_client.close()
+        await bot.close_session()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except ApiTelegramException as exc:
+        if exc.error_code == 401:
+            log.error("Неверно указан токен. Проверьте BOT_TOKEN.", exc_info=True)
+        else:
+            log.error(f"Ошибка при взаимодействии с Telegram API: {exc}", exc_info=True)
+    except KeyboardInterrupt:
+        pass
+    except Exception as exc:
+        log.error(f"Произошла непредвиденная ошибка {type(exc).__name__}: {exc}", exc_info=True)
@@ -0,0 +1,44 @@
+from functools import wraps
+from typing import Any, Callable
+
+from telebot.asyncio_helper import ApiTelegramException
+
+from bot_async.loader import bot
+from logs.exceptions import BotStatePaginationNotFoundError
+from services.services_logging import extract_ids, handle_exception
+from services.services_messages import SESSION_EXPIRED, error_text
+from states.search_fields import SearchStates
+
+
+def async_error_logger_bot(func: Callable) -> Callable:
+    """
+    Асинхронный вариант декоратора `services.services_logging.error_logger_bot` для обработчиков AsyncTeleBot:
+    логирует ошибку, отправляет пользователю сообщение об ошибке и удаляет сообщение, вызвавшее ошибку.
+    При истечении сессии отображения фильмов предлагает начать новый поиск.
+
+    Args:
+        func (Callable): Корутинная функция-обработчик команды бота.
+
+    Returns:
+        Callable: Корутинная обертка вокруг функции-обработчика.
+    """
+    @wraps(func)
+    async def wrapper(*args, **kwargs) -> Any | None:
+        chat_id, user_id, message_id = extract_ids(args)
+        try:
+            return await func(*args, **kwargs)
+        except BotStatePaginationNotFoundError as exc:
+            handle_exception(func, exc)
+            await bot.set_state(user_id, SearchStates.movie_name, chat_id)
+            await bot.send_message(chat_id, SESSION_EXPIRED, parse_mode="HTML")
+            await bot.delete_message(chat_id, message_id)
+        except Exception as exc:
+            handle_exception(func, exc)
+            await bot.send_message(chat_id, error_text(exc), parse_mode="HTML")
+            try:
+                await bot.delete_message(chat_id, message_id)
+            except ApiTelegramException:
+                handle_exception(func, exc)
+        return None
+
+    return wrapper
@@ -0,0 +1,433 @@
+import asyncio
+from typing import Any, Dict, List
+
+from telebot.types import CallbackQuery, Message
+
+from bot_async.errors import async_error_logger_bot
+from bot_async.loader import bot
+from bot_async.services import (
+    edit_description_page,
+    edit_movie_card,
+    load_saved_search,
+    send_menu_image,
+    send_movie_card,
+)
+from database.common.models_movies import MoviePostponed
+from keyboards.buttons.btns_for_movie_by_filters import btns_filters
+from keyboards.buttons.btns_for_postponed_movies import button_back_postponed, buttons_end_search
+from keyboards.inline.inline_keyboard import create_inline_keyboard
+from keyboards.inline.inline_movie_by_filters import select_filters_keyboard
+from keyboards.pagination.pagination_movies import create_paginator_movies
+from logs.exceptions import BotStatePaginationNotFoundError
+from logs.logging_config import log
+from services.services_database import search_for_movie, sending_to_pagination, toggle_movie_field_response
+from services.services_film_cache import resolve_movies, session_movies
+from services.services_messages import (
+    ALL_RESULTS_SHOWN,
+    ENTER_MOVIE_NAME,
+    INACTIVE_INPUT,
+    MOVIE_SEARCH_CAPTION,
+    NEW_MOVIE_NAME,
+    NOT_FOUND_MOVIE_NAME,
+    commands_text,
+    help_caption,
+    search_error_text,
+    start_caption,
+)
+from services.services_pagination_handlers import count_saved_calls
+from services.services_prefetch import prefetch_next_page, prefetcher
+from site_API.core import keep_ratio
+from site_API.site_api_handler import async_search_movies
+from states.search_fields import PaginationStates, SearchStates, StartStates
+
+
+# Команды, которые обрабатывает только синхронный вариант бота
+SYNC_ONLY_COMMANDS = ["movie_by_filters", "postponed_movies", "history"]
+
+SYNC_ONLY_TEXT = (
+    "🚧 <b>Команда временно недоступна</b>.\n\n"
+    "🔍 Воспользуйтесь поиском фильма по названию /movie_search или обратитесь в /help."
+)
+
+
+async def get_pagination_state(call: CallbackQuery) -> None:
+    """
+    Проверяет, что у пользователя есть состояние сессии отображения фильмов.
+
+    Args:
+        call (CallbackQuery): Объект, содержащий информацию о нажатой кнопке.
+
+    Raises:
+        BotStatePaginationNotFoundError: Если состояние пользователя отсутствует.
+    """
+    if not await bot.get_state(call.from_user.id, call.message.chat.id):
+        raise BotStatePaginationNotFoundError
+
+
+@bot.message_handler(commands=["movie_search"])
+@async_error_logger_bot
+async def menu_movie_search(message: Message) -> None:
+    """
+    Обработчик команды /movie_search (см. `handlers.custom_handlers.movie_search.menu_movie_search`).
+
+    Args:
+        message (Message): Объект, содержащий данные сообщения от пользователя.
+    """
+    user_id, chat_id = message.from_user.id, message.chat.id
+    prefetcher.drop(user_id, chat_id)
+    await bot.reset_data(user_id, chat_id)
+    await bot.set_state(user_id, SearchStates.movie_name, chat_id)
+
+    await send_menu_image(chat_id, "movie_search", MOVIE_SEARCH_CAPTION)
+    await bot.send_message(chat_id, ENTER_MOVIE_NAME, parse_mode="HTML")
+
+
+@bot.message_handler(state=SearchStates.movie_name, func=lambda message: not message.text.startswith("/"))
+@async_error_logger_bot
+async def search_movie_name(message: Message) -> None:
+    """
+    Обработчик ввода названия фильма (см. `handlers.custom_handlers.movie_search.search_movie_name`).
+    Запрос к API и удаление сообщений пользователя и предложения ввести название выполняются одновременно.
+
+    Args:
+        message (Message): Объект, содержащий данные сообщения от пользователя.
+            - message.text (str): Текст сообщения с названием фильма.
+    """
+    user_id, chat_id = message.from_user.id, message.chat.id
+    await bot.set_state(user_id, PaginationStates.movies, chat_id)
+    type_search = "movie_search"
+    deletions = (
+        bot.delete_message(chat_id, message.message_id - 1),
+        bot.delete_message(chat_id, message.message_id),
+    )
+
+    movie_info, limit = await asyncio.to_thread(load_saved_search, user_id, message.text, type_search)
+    if movie_info:
+        total_pages = 2
+        await asyncio.gather(*deletions)
+    else:
+        prefetcher.drop(user_id, chat_id)
+        search_result, *_ = await asyncio.gather(async_search_movies(message.text, type_search), *deletions)
+        error = search_result.error if search_result else "Не удалось выполнить поиск"
+        if error:
+            await bot.send_message(chat_id, search_error_text(error), parse_mode="HTML")
+            await bot.set_state(user_id, SearchStates.movie_name, chat_id)
+            log.info("При поисковом запросе возникла ошибка. Пользователю предложено создать новый запрос позже.")
+            return
+        if not search_result.movies:
+            await bot.reset_data(user_id, chat_id)
+            await bot.send_message(chat_id, NOT_FOUND_MOVIE_NAME, parse_mode="HTML")
+            await bot.set_state(user_id, SearchStates.movie_name, chat_id)
+            log.info("Поисковой запрос не выдал результатов. Пользователю предложено создать новый запрос.")
+            return
+        movie_info = await asyncio.to_thread(
+            search_for_movie,
+            user_id=user_id,
+            result_response=search_result.movies,
+            type_search=type_search,
+            text_search=message.text,
+            page_limit=search_result.limit,
+        )
+        total_pages, limit = search_result.pages, search_result.limit
+    if not movie_info:
+        return
+
+    async with bot.retrieve_data(user_id, chat_id) as data:
+        data.clear()
+        data["movie_info"] = session_movies(movie_info)
+        data["search"] = message.text
+        data["page"] = 1
+        data["pages"] = total_pages
+        data["limit"] = limit
+    await send_movie_card(chat_id, data["movie_info"], total_pages=total_pages)
+
+
+@bot.message_handler(commands=SYNC_ONLY_COMMANDS)
+@async_error_logger_bot
+async def sync_only_command(message: Message) -> None:
+    """
+    Обработчик команд, которые асинхронный вариант бота не поддерживает.
+
+    Args:
+        message (Message): Объект, содержащий данные сообщения от пользователя.
+    """
+    await bot.send_message(message.chat.id, SYNC_ONLY_TEXT, parse_mode="HTML")
+
+
+@bot.callback_query_handler(func=lambda call: call.data.split("#")[0] in ["movie", "back_movie"])
+@async_error_logger_bot
+async def pagination_browsing_movie(call: CallbackQuery) -> None:
+    """
+    Обработчик перелистывания фильмов (см. `handlers.pagination_state_handlers.pagination_handlers_movies`).
+    Карточка фильма заменяется на месте, а если это невозможно - новая карточка отправляется одновременно
+    с удалением предыдущей.
+
+    Args:
+        call (CallbackQuery): Объект, содержащий информацию о нажатой кнопке.
+    """
+    await get_pagination_state(call)
+    user_id, chat_id = call.from_user.id, call.message.chat.id
+    page = int(call.data.split("#")[1])
+
+    async with bot.retrieve_data(user_id, chat_id) as data:
+        data["is_description"] = False
+        movie_info = data.setdefault("movie_info", None)
+        total_pages = data.setdefault("pages", 1)
+        page_number = data.setdefault("page", 1)
+        if movie_info:
+            edited = await edit_movie_card(call.message, movie_info, page, total_pages, page_number)
+            count_saved_calls(data, edited, saved_calls=int(edited))
+    if not movie_info:
+        await bot.delete_message(chat_id, call.message.message_id)
+        return
+    prefetch_next_page(user_id, chat_id, data, page)
+
+
+@bot.callback_query_handler(func=lambda call: call.data.split("#")[0] == "show_description")
+@async_error_logger_bot
+async def pagination_show_full_description_movie(call: CallbackQuery) -> None:
+    """
+    Обработчик кнопки `Больше`: заменяет подпись карточки фильма полным описанием фильма, а если это
+    невозможно - отправляет описание одновременно с удалением карточки фильма.
+
+    Args:
+        call (CallbackQuery): Объект, содержащий информацию о нажатой кнопке.
+    """
+    await get_pagination_state(call)
+    user_id, chat_id = call.from_user.id, call.message.chat.id
+    page = int(call.data.split("#")[1])
+
+    async with bot.retrieve_data(user_id, chat_id) as data:
+        movie_info = data.setdefault("movie_info", None)
+        data["is_description"] = True
+        if movie_info:
+            edited = await edit_description_page(call.message, movie_info, page)
+            count_saved_calls(data, edited, saved_calls=int(edited))
+    if not movie_info:
+        await bot.delete_message(chat_id, call.message.message_id)
+
+
+def toggle_status(user_id: int, data: Dict[str, Any], page: int, status: str) -> List[Dict[str, Any]] | None:
+    """
+    Меняет статус фильма на противоположный в сессии и в базе данных. Если фильмы отображаются из раздела
+    отложенных фильмов, из которого фильм мог быть удален, перечитывает список фильмов этого раздела.
+    Выполняет запросы к базе данных, поэтому вызывается в пуле потоков.
+
+    Args:
+        user_id (int): Идентификатор пользователя.
+        data (Dict[str, Any]): Данные сессии пользователя.
+        page (int): Текущая страница в списке фильмов.
+        status (str): Статус фильма: "is_favorites" либо "is_viewed".
+
+    Returns:
+        List[Dict[str, Any]] | None: Обновленный список отложенных фильмов либо None, если он не изменился.
+    """
+    movie_info = data["movie_info"][page - 1]
+    movie_info[status] = not movie_info[status]
+    toggle_movie_field_response(user_id, resolve_movies([movie_info])[0], status)
+
+    if movie_info["type_search"] != "postponed_movies" or status != data.get("button_postponed"):
+        return None
+    state = MoviePostponed.is_favorites if status == "is_favorites" else MoviePostponed.is_viewed
+    user_movies = (
+        MoviePostponed.select()
+        .where((MoviePostponed.user_id == user_id) & state)
+        .order_by(MoviePostponed.id.desc())
+    )
+    return session_movies(sending_to_pagination(user_movies, type_search="postponed_movies"))
+
+
+@bot.callback_query_handler(func=lambda call: call.data.split("#")[0] in ["is_favorites", "is_viewed"])
+@async_error_logger_bot
+async def pagination_change_status_movie(call: CallbackQuery) -> None:
+    """
+    Обработчик кнопок "Не просмотрено" и "В избранное"
+    (см. `handlers.pagination_state_handlers.pagination_handlers_movies.pagination_change_status_movie`).
+
+    Args:
+        call (CallbackQuery): Объект, содержащий информацию о нажатой кнопке.
+    """
+    await get_pagination_state(call)
+    user_id, chat_id = call.from_user.id, call.message.chat.id
+    page = int(call.data.split("#")[1])
+    status = call.data.split("#")[0]
+
+    async with bot.retrieve_data(user_id, chat_id) as data:
+        is_description = data.setdefault("is_description", False)
+        total_pages = data.setdefault("pages", 1)
+        page_number = data.setdefault("page", 1)
+        if not data.setdefault("movie_info", None):
+            return
+        postponed = await asyncio.to_thread(toggle_status, user_id, data, page, status)
+        movie_info = data["movie_info"]
+        if postponed is not None:
+            data["movie_info"] = postponed
+
+        if movie_info[page - 1]["type_search"] == "postponed_movies" and postponed != []:
+            # Карточка заменяется на месте вместо обновления клавиатуры, отправки карточки и удаления сообщения
+            if postponed is not None:
+                movie_info, page = postponed, page - 1 if page > 1 else 0
+            data["is_description"] = False
+            edited = await edit_movie_card(call.message, movie_info, page, total_pages, page_number)
+            count_saved_calls(data, edited, saved_calls=2 if edited else 0)
+            return
+
+    if postponed == []:
+        text = "😔 К сожалению, у вас больше нет фильмов в этом разделе."
+        keyboard = create_inline_keyboard(button_back_postponed, buttons_per_row=1)
+        await asyncio.gather(
+            bot.send_message(chat_id, text, reply_markup=keyboard),
+            bot.delete_message(chat_id, call.message.message_id),
+        )
+        return
+    paginator = create_paginator_movies(
+        await asyncio.to_thread(resolve_movies, movie_info), page, total_pages, page_number, is_description
+    )
+    await bot.edit_message_reply_markup(chat_id, call.message.message_id, reply_markup=paginator.markup)
+
+
+@bot.callback_query_handler(func=lambda call: call.data in ["continue_search", "search_back"])
+@async_error_logger_bot
+async def pagination_continue_search_movie(call: CallbackQuery) -> None:
+    """
+    Обработчик кнопок `Дальше` и `Назад` для перехода между страницами результатов поиска
+    (см. `handlers.pagination_state_handlers.pagination_handlers_movies.pagination_continue_search_movie`).
+
+    Args:
+        call (CallbackQuery): Объект, содержащий информацию о нажатой кнопке.
+    """
+    await get_pagination_state(call)
+    user_id, chat_id = call.from_user.id, call.message.chat.id
+    step = 1 if call.data == "continue_search" else -1
+
+    async with bot.retrieve_data(user_id, chat_id) as data:
+        data.setdefault("search", None)
+        data["page"] = data.setdefault("page", 1) + step
+        data["is_description"] = False
+        type_search = "movie_search" if isinstance(data["search"], str) else "movie_by_filters"
+        limit = data.get("limit") or keep_ratio.base_limit
+
+        search_result = None
+        if step > 0:
+            search_result = await asyncio.to_thread(
+                prefetcher.take, user_id, chat_id, data["search"], type_search, data["page"], limit
+            )
+        if search_result is None:
+            search_result = await async_search_movies(data["search"], type_search, page=data["page"], limit=limit)
+        error = search_result.error if search_result else "Не удалось выполнить поиск"
+        if error:
+            data["page"] -= step
+        elif search_result.movies:
+            movie_info = await asyncio.to_thread(search_for_movie, user_id, search_result.movies, type_search)
+            data["movie_info"] = session_movies(movie_info)
+            data["pages"] = search_result.pages - data["page"]
+            data["total_pages"] = search_result.pages
+            page = len(data["movie_info"]) if step < 0 else 1
+            edited = await edit_movie_card(call.message, data["movie_info"], page, search_result.pages, data["page"])
+            count_saved_calls(data, edited, saved_calls=int(edited))
+
+    if error:
+        await bot.send_message(chat_id, search_error_text(error), parse_mode="HTML")
+        return
+    if not search_result.movies:
+        keyboard = create_inline_keyboard(buttons_end_search, buttons_per_row=1)
+        await asyncio.gather(
+            bot.send_message(chat_id, ALL_RESULTS_SHOWN, reply_markup=keyboard, parse_mode="HTML"),
+            bot.delete_message(chat_id, call.message.message_id),
+        )
+        return
+    prefetch_next_page(user_id, chat_id, data, page)
+
+
+@bot.callback_query_handler(func=lambda call: call.data == "new_search")
+@async_error_logger_bot
+async def menu_get_new_search(call: CallbackQuery) -> None:
+    """
+    Обработчик кнопки `Новый поиск`: предлагает задать новый поиск того же типа.
+
+    Args:
+        call (CallbackQuery): Объект, содержащий информацию о нажатой кнопке.
+    """
+    await get_pagination_state(call)
+    user_id, chat_id = call.from_user.id, call.message.chat.id
+    prefetcher.drop(user_id, chat_id)
+
+    data = await bot.get_data(user_id, chat_id)
+    await bot.reset_data(user_id, chat_id)
+    if isinstance(data.get("search"), dict):
+        await bot.set_state(user_id, SearchStates.query, chat_id)
+        await bot.add_data(user_id, chat_id, buttons_filters=btns_filters)
+        text = (
+            "✔️ Задайте <b><i>фильтры</i></b> с помощью кнопок ниже "
+            "либо сразу перейдите к <b><i>поиску</i></b>."
+        )
+        keyboard = select_filters_keyboard(btns_filters, buttons_per_row=2)
+    else:
+        await bot.set_state(user_id, SearchStates.movie_name, chat_id)
+        text, keyboard = NEW_MOVIE_NAME, None
+    await asyncio.gather(
+        bot.send_message(chat_id, text, reply_markup=keyboard, parse_mode="HTML"),
+        bot.delete_message(chat_id, call.message.message_id),
+    )
+
+
+@bot.message_handler(commands=["help"])
+@async_error_logger_bot
+async def menu_help(message: Message) -> None:
+    """
+    Обработчик команды /help (см. `handlers.default_handlers.help.menu_help`).
+
+    Args:
+        message (Message): Объект, содержащий данные сообщения от пользователя.
+    """
+    user_id, chat_id = message.from_user.id, message.chat.id
+    prefetcher.drop(user_id, chat_id)
+    await bot.reset_data(user_id, chat_id)
+    await send_menu_image(chat_id, "help", help_caption(message.chat.first_name))
+
+
+@bot.message_handler(commands=["start"])
+@async_error_logger_bot
+async def menu_start(message: Message) -> None:
+    """
+    Обработчик команды /start (см. `handlers.default_handlers.start.menu_start`).
+
+    Args:
+        message (Message): Объект, содержащий данные сообщения от пользователя.
+    """
+    user_id, chat_id = message.from_user.id, message.chat.id
+    prefetcher.drop(user_id, chat_id)
+    await bot.reset_data(user_id, chat_id)
+    await bot.set_state(user_id, StartStates.start, chat_id)
+    await send_menu_image(chat_id, "start", start_caption(message.chat.first_name))
+
+
+@bot.message_handler(state=StartStates.start, func=lambda message: not message.text.startswith("/"))
+@async_error_logger_bot
+async def list_commands(message: Message) -> None:
+    """
+    Обработчик сообщений, не являющихся командами, в состоянии `StartStates.start`: отправляет перечень команд.
+
+    Args:
+        message (Message): Объект, содержащий данные сообщения от пользователя.
+    """
+    chat_id = message.chat.id
+    await asyncio.gather(
+        bot.send_message(chat_id, commands_text(message.chat.first_name), parse_mode="HTML"),
+        bot.delete_message(chat_id, message.message_id),
+    )
+
+
+@bot.message_handler(func=lambda message: not message.text.startswith("/"))
+async def handler_any_text(message: Message) -> None:
+    """
+    Обработчик любого сообщения, не являющегося командой: сообщает, что строка ввода неактивна.
+
+    Args:
+        message (Message): Объект, содержащий данные сообщения от пользователя.
+    """
+    chat_id = message.chat.id
+    await asyncio.gather(
+        bot.send_message(chat_id, INACTIVE_INPUT, parse_mode="HTML"),
+        bot.delete_message(chat_id, message.message_id),
+    )
@@ -0,0 +1,15 @@
+from telebot import asyncio_helper
+from telebot.async_telebot import AsyncTeleBot
+
+from bot_async.state_storage import AsyncStateStorage
+from config_data.config import BOT_TOKEN, TELEGRAM_API_URL
+from loader import storage
+
+
+if TELEGRAM_API_URL:
+    asyncio_helper.API_URL = TELEGRAM_API_URL
+
+# Хранилище состояний общее с синхронным ботом: сервисы, которые используют синхронного бота, и асинхронные
+# обработчики работают с одними и теми же сессиями пользователей
+async_storage = AsyncStateStorage(storage)
+bot = AsyncTeleBot(token=BOT_TOKEN, state_storage=async_storage)
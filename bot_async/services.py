@@ -0,0 +1,294 @@
+import asyncio
+from contextlib import nullcontext
+from typing import Any, Dict, List, Tuple
+
+from telebot.asyncio_helper import ApiTelegramException
+from telebot.types import InlineKeyboardMarkup, InputMediaPhoto, Message
+
+from bot_async.loader import bot
+from config_data.config import IMAGE_EMPTY_POSTER
+from database.common.models_movies import BaseMovie
+from logs.logging_config import log
+from services.services_database import update_database, update_database_query
+from services.services_image_assets import MENU_IMAGES, image_assets
+from services.services_pagination_handlers import (
+    CAPTION_LIMIT,
+    is_message_error,
+    render_description_page,
+    render_movie_card,
+)
+from services.services_poster_cache import is_remote, poster_cache
+
+
+# Блокировки первой загрузки изображений меню (см. `ImageAssets.upload_lock`)
+upload_locks: Dict[str, asyncio.Lock] = {}
+
+
+async def send_menu_image(chat_id: int, image_name: str, caption: str) -> None:
+    """
+    Асинхронный вариант `services.services_image_assets.send_menu_image`: отправляет изображение меню
+    по идентификатору файла из реестра изображений меню, а при его отсутствии или устаревании загружает
+    изображение из файла.
+
+    Args:
+        chat_id (int): Идентификатор чата.
+        image_name (str): Название изображения из `MENU_IMAGES`.
+        caption (str): Подпись к изображению в формате HTML.
+    """
+    lock = nullcontext() if image_assets.per_chat else upload_locks.setdefault(image_name, asyncio.Lock())
+    for attempt in range(2):
+        async with lock:
+            file_id = await asyncio.to_thread(image_assets.get, chat_id, image_name)
+            if not file_id:
+                await upload_menu_image(chat_id, image_name, caption)
+                return
+        try:
+            await bot.send_photo(chat_id, file_id, caption=caption, parse_mode="HTML")
+        except ApiTelegramException as exc:
+            if exc.error_code != 400 or attempt:
+                raise
+            await asyncio.to_thread(image_assets.invalidate, chat_id, image_name, file_id)
+            log.warning(f"Telegram отклонил идентификатор файла изображения `{image_name}`: {exc.description}.")
+            continue
+        image_assets.count(uploaded=False)
+        return
+
+
+async def upload_menu_image(chat_id: int, image_name: str, caption: str) -> None:
+    """
+    Асинхронный вариант `services.services_image_assets.upload_menu_image`: загружает изображение меню из файла
+    и сохраняет его идентификатор файла в реестре изображений меню.
+
+    Args:
+        chat_id (int): Идентификатор чата.
+        image_name (str): Название изображения из `MENU_IMAGES`.
+        caption (str): Подпись к изображению в формате HTML.
+    """
+    try:
+        with open(MENU_IMAGES[image_name], "rb") as image:
+            sent_message = await bot.send_photo(chat_id, image, caption=caption, parse_mode="HTML")
+    except FileNotFoundError as exc:
+        log.error(f"Ошибка при обработке изображения: {type(exc).__name__} - {exc}.")
+        log.info("Пользователю отправлено сообщение без картинки.")
+        await bot.send_message(chat_id, caption, parse_mode="HTML")
+        return
+    image_assets.count(uploaded=True)
+    await asyncio.to_thread(image_assets.remember, chat_id, image_name, sent_message.photo[-1].file_id)
+
+
+async def send_cached_photo(chat_id: int, source: str, caption: str, markup: InlineKeyboardMarkup) -> Message:
+    """
+    Асинхронный вариант `services.services_pagination_handlers.send_cached_photo`: отправляет постер
+    по идентификатору файла из кэша постеров, а при его отсутствии или устаревании - из источника.
+
+    Args:
+        chat_id (int): Идентификатор чата.
+        source (str): URL постера либо путь к файлу изображения.
+        caption (str): Подпись к постеру в формате HTML.
+        markup (InlineKeyboardMarkup): Клавиатура под постером.
+
+    Returns:
+        Message: Отправленное сообщение.
+    """
+    file_id = await asyncio.to_thread(poster_cache.get, source)
+    if file_id:
+        try:
+            return await bot.send_photo(chat_id, file_id, caption=caption, reply_markup=markup, parse_mode="HTML")
+        except ApiTelegramException as exc:
+            if exc.error_code != 400:
+                raise
+            await asyncio.to_thread(poster_cache.invalidate, source, file_id)
+            log.warning(f"Telegram отклонил идентификатор файла постера: {exc.description}. Постер отправлен повторно.")
+
+    if is_remote(source):
+        sent_message = await bot.send_photo(chat_id, source, caption=caption, reply_markup=markup, parse_mode="HTML")
+    else:
+        with open(source, "rb") as image_file:
+            sent_message = await bot.send_photo(
+                chat_id, image_file, caption=caption, reply_markup=markup, parse_mode="HTML"
+            )
+    await asyncio.to_thread(poster_cache.remember, source, sent_message.photo[-1].file_id)
+    return sent_message
+
+
+async def send_movie_card(
+    chat_id: int,
+    movies_data: List[Dict[str, Any]],
+    current_page: int = 1,
+    total_pages: int = 1,
+    page_number: int = 1,
+) -> None:
+    """
+    Асинхронный вариант `services.services_pagination_handlers.send_movie_pagination`: отправляет в чат
+    карточку фильма с клавиатурой пагинации. Если постер отсутствует или Telegram не смог его загрузить,
+    отправляется карточка с пустым постером.
+
+    Args:
+        chat_id (int): Идентификатор чата.
+        movies_data (List[Dict[str, Any]]): Список фильмов из сессии пользователя.
+        current_page (int): Текущая страница в списке фильмов. По умолчанию равна 1.
+        total_pages (int): Общее количество страниц фильмов. По умолчанию равно 1.
+        page_number (int): Номер текущей страницы в результатах поиска. По умолчанию равен 1.
+    """
+    image, text, markup = await asyncio.to_thread(
+        render_movie_card, movies_data, current_page, total_pages, page_number
+    )
+    try:
+        if not image:
+            raise ValueError("Постер фильма отсутствует")
+        await send_cached_photo(chat_id, image, text, markup)
+    except (ApiTelegramException, ValueError) as exc:
+        await send_cached_photo(chat_id, IMAGE_EMPTY_POSTER, text, markup)
+        log.error(f"{type(exc).__name__}: Ошибка при отправке изображения через Telegram API - {exc}.")
+        log.info("В чат было направлено сообщение с пустым постером.")
+
+
+async def edit_cached_photo(message: Message, source: str, caption: str, markup: InlineKeyboardMarkup) -> None:
+    """
+    Асинхронный вариант `services.services_pagination_handlers.edit_cached_photo`: заменяет изображение
+    и подпись сообщения постером по идентификатору файла из кэша постеров, а при его отсутствии или
+    устаревании - из источника.
+
+    Args:
+        message (Message): Редактируемое сообщение с изображением.
+        source (str): URL постера либо путь к файлу изображения.
+        caption (str): Подпись к изображению в формате HTML.
+        markup (InlineKeyboardMarkup): Клавиатура под изображением.
+    """
+    chat_id, message_id = message.chat.id, message.message_id
+    file_id = await asyncio.to_thread(poster_cache.get, source)
+    if file_id:
+        try:
+            await bot.edit_message_media(
+                InputMediaPhoto(file_id, caption=caption, parse_mode="HTML"), chat_id, message_id, reply_markup=markup
+            )
+            return
+        except ApiTelegramException as exc:
+            if exc.error_code != 400 or is_message_error(exc):
+                raise
+            await asyncio.to_thread(poster_cache.invalidate, source, file_id)
+            log.warning(f"Telegram отклонил идентификатор файла постера: {exc.description}. Постер отправлен повторно.")
+
+    if is_remote(source):
+        edited = await bot.edit_message_media(
+            InputMediaPhoto(source, caption=caption, parse_mode="HTML"), chat_id, message_id, reply_markup=markup
+        )
+    else:
+        with open(source, "rb") as image_file:
+            edited = await bot.edit_message_media(
+                InputMediaPhoto(image_file, caption=caption, parse_mode="HTML"),
+                chat_id,
+                message_id,
+                reply_markup=markup,
+            )
+    await asyncio.to_thread(poster_cache.remember, source, edited.photo[-1].file_id)
+
+
+async def edit_movie_card(
+    message: Message,
+    movies_data: List[Dict[str, Any]],
+    current_page: int = 1,
+    total_pages: int = 1,
+    page_number: int = 1,
+) -> bool:
+    """
+    Асинхронный вариант `services.services_pagination_handlers.edit_movie_pagination`: заменяет сообщение
+    с изображением карточкой фильма на месте, а если это невозможно - отправляет карточку новым сообщением
+    одновременно с удалением предыдущего.
+
+    Args:
+        message (Message): Сообщение с клавиатурой пагинации, на кнопку которого нажал пользователь.
+        movies_data (List[Dict[str, Any]]): Список фильмов из сессии пользователя.
+        current_page (int): Текущая страница в списке фильмов. По умолчанию равна 1.
+        total_pages (int): Общее количество страниц фильмов. По умолчанию равно 1.
+        page_number (int): Номер текущей страницы в результатах поиска. По умолчанию равен 1.
+
+    Returns:
+        bool: True, если сообщение отредактировано на месте, False - если отправлено новое сообщение.
+    """
+    if message.content_type == "photo":
+        image, text, markup = await asyncio.to_thread(
+            render_movie_card, movies_data, current_page, total_pages, page_number
+        )
+        try:
+            try:
+                if not image:
+                    raise ValueError("Постер фильма отсутствует")
+                await edit_cached_photo(message, image, text, markup)
+            except (ApiTelegramException, ValueError) as exc:
+                if isinstance(exc, ApiTelegramException) and is_message_error(exc):
+                    raise
+                await edit_cached_photo(message, IMAGE_EMPTY_POSTER, text, markup)
+            return True
+        except ApiTelegramException as exc:
+            if "message is not modified" in str(exc.description):
+                return True
+            log.info(f"Карточка фильма отправлена новым сообщением: {exc.description}.")
+
+    await asyncio.gather(
+        send_movie_card(message.chat.id, movies_data, current_page, total_pages, page_number),
+        bot.delete_message(message.chat.id, message.message_id),
+    )
+    return False
+
+
+async def edit_description_page(message: Message, movies_data: List[Dict[str, Any]], current_page: int = 1) -> bool:
+    """
+    Асинхронный вариант `services.services_pagination_handlers.edit_description_pagination_page`: заменяет
+    подпись карточки фильма (либо текст сообщения) полным описанием фильма на месте, а если это невозможно -
+    отправляет описание новым сообщением одновременно с удалением предыдущего.
+
+    Args:
+        message (Message): Сообщение с клавиатурой пагинации, на кнопку которого нажал пользователь.
+        movies_data (List[Dict[str, Any]]): Список фильмов из сессии пользователя.
+        current_page (int): Текущая страница в списке фильмов. По умолчанию равна 1.
+
+    Returns:
+        bool: True, если сообщение отредактировано на месте, False - если отправлено новое сообщение.
+    """
+    text, markup = await asyncio.to_thread(render_description_page, movies_data, current_page)
+    chat_id, message_id = message.chat.id, message.message_id
+    if text:
+        try:
+            if message.content_type == "photo" and len(text) <= CAPTION_LIMIT:
+                await bot.edit_message_caption(text, chat_id, message_id, reply_markup=markup, parse_mode="HTML")
+                return True
+            if message.content_type == "text":
+                await bot.edit_message_text(text, chat_id, message_id, reply_markup=markup, parse_mode="HTML")
+                return True
+        except ApiTelegramException as exc:
+            if "message is not modified" in str(exc.description):
+                return True
+            log.info(f"Описание фильма отправлено новым сообщением: {exc.description}.")
+        await asyncio.gather(
+            bot.send_message(chat_id, text, reply_markup=markup, parse_mode="HTML"),
+            bot.delete_message(chat_id, message_id),
+        )
+    else:
+        await bot.delete_message(chat_id, message_id)
+    return False
+
+
+def load_saved_search(
+    user_id: int, text_search: str, type_search: str
+) -> Tuple[List[Dict[str, Any]] | None, int | None]:
+    """
+    Возвращает сохраненные результаты поиска пользователя по названию и обновляет дату поискового запроса.
+    Выполняет запросы к базе данных, поэтому вызывается в пуле потоков.
+
+    Args:
+        user_id (int): Идентификатор пользователя.
+        text_search (str): Текст поискового запроса.
+        type_search (str): Тип поиска.
+
+    Returns:
+        Tuple[List[Dict[str, Any]] | None, int | None]: Список фильмов для пагинации либо None, если поиск
+            не сохранен, и размер страницы запроса к API, с которым получена первая страница результатов.
+    """
+    user_movies = BaseMovie.select().where(
+        (BaseMovie.user_id == user_id) & (BaseMovie.text_search == text_search)
+    )
+    if not user_movies:
+        return None, None
+    movie_info = update_database(user_movies, type_search=type_search)
+    return movie_info, update_database_query(user_id, text_search)
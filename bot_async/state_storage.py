@@ -0,0 +1,84 @@
+import asyncio
+from typing import Any, Callable, Dict, Optional
+
+from telebot.asyncio_storage import StateStorageBase
+
+from states.state_storage import CompactStateStorage, MemoryStateStorage
+
+
+class AsyncStateDataContext:
+    """
+    Асинхронный контекстный менеджер `bot.retrieve_data`: возвращает данные сессии и сохраняет их при выходе.
+
+    Attributes:
+        storage (AsyncStateStorage): Хранилище состояний.
+        key (str): Ключ состояния.
+        data (Dict[str, Any] | None): Данные сессии.
+    """
+    def __init__(self, storage: "AsyncStateStorage", key: str) -> None:
+        self.storage = storage
+        self.key = key
+        self.data: Dict[str, Any] | None = None
+
+    async def __aenter__(self) -> Dict[str, Any]:
+        self.data = await self.storage.run(self.storage.storage.read_data, self.key)
+        return self.data
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        return await self.storage.run(self.storage.storage.write_data, self.key, self.data)
+
+
+class AsyncStateStorage(StateStorageBase):
+    """
+    Хранилище состояний AsyncTeleBot поверх хранилища состояний синхронного бота (`states.state_storage`):
+    оба варианта бота используют одни и те же ключи и формат данных сессий. Операции с хранилищем SQLite
+    выполняются в пуле потоков, чтобы не блокировать цикл событий, а операции с хранилищем в памяти -
+    непосредственно в цикле событий.
+
+    Attributes:
+        storage (CompactStateStorage): Хранилище состояний синхронного бота.
+    """
+    def __init__(self, storage: CompactStateStorage) -> None:
+        super().__init__()
+        self.storage = storage
+        self._blocking = not isinstance(storage, MemoryStateStorage)
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Выполняет операцию синхронного хранилища: в пуле потоков, если операция обращается к базе данных.
+
+        Args:
+            func (Callable): Метод синхронного хранилища.
+            *args: Позиционные аргументы метода.
+            **kwargs: Именованные аргументы метода.
+
+        Returns:
+            Any: Результат метода.
+        """
+        if self._blocking:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        return func(*args, **kwargs)
+
+    async def set_state(self, chat_id: int, user_id: int, state: Any, *args, **kwargs) -> bool:
+        return await self.run(self.storage.set_state, chat_id, user_id, state, *args, **kwargs)
+
+    async def get_state(self, chat_id: int, user_id: int, *args, **kwargs) -> Optional[str]:
+        return await self.run(self.storage.get_state, chat_id, user_id, *args, **kwargs)
+
+    async def delete_state(self, chat_id: int, user_id: int, *args, **kwargs) -> bool:
+        return await self.run(self.storage.delete_state, chat_id, user_id, *args, **kwargs)
+
+    async def set_data(self, chat_id: int, user_id: int, key: str, value: Any, *args, **kwargs) -> bool:
+        return await self.run(self.storage.set_data, chat_id, user_id, key, value, *args, **kwargs)
+
+    async def get_data(self, chat_id: int, user_id: int, *args, **kwargs) -> Dict[str, Any]:
+        return await self.run(self.storage.get_data, chat_id, user_id, *args, **kwargs)
+
+    async def reset_data(self, chat_id: int, user_id: int, *args, **kwargs) -> bool:
+        return await self.run(self.storage.reset_data, chat_id, user_id, *args, **kwargs)
+
+    async def save(self, chat_id: int, user_id: int, data: Dict[str, Any], *args, **kwargs) -> bool:
+        return await self.run(self.storage.save, chat_id, user_id, data, *args, **kwargs)
+
+    def get_interactive_data(self, chat_id: int, user_id: int, *args, **kwargs) -> AsyncStateDataContext:
+        return AsyncStateDataContext(self, self.storage.key(chat_id, user_id, *args, **kwargs))
@@ -21,6 +21,41 @@ if not BOT_TOKEN:
     log.error("Отсутствует BOT_TOKEN. Программа завершила работу.")
     exit("Отсутствует BOT_TOKEN. Пожалуйста, укажите BOT_TOKEN в файле .env")
 
+# Адрес методов Telegram Bot API в формате "http://host:port/bot{0}/{1}" (локальный сервер Bot API
+# или заглушка stub_api.telegram). По умолчанию используется https://api.telegram.org
+TELEGRAM_API_URL = os.getenv("TELEGRAM_API_URL")
+# Планировщик исходящих запросов к Telegram Bot API (ограничение частоты запросов, фоновое удаление сообщений)
+TELEGRAM_SCHEDULER = os.getenv("TELEGRAM_SCHEDULER", "true").lower() == "true"
+# Общее ограничение частоты сообщений бота (в секунду) и допустимый всплеск
+TELEGRAM_GLOBAL_RATE = float(os.getenv("TELEGRAM_GLOBAL_RATE", 30))
+TELEGRAM_GLOBAL_BURST = int(os.getenv("TELEGRAM_GLOBAL_BURST", 30))
+# Ограничение частоты сообщений в одном чате (в секунду) и допустимый всплеск
+TELEGRAM_CHAT_RATE = float(os.getenv("TELEGRAM_CHAT_RATE", 1))
+TELEGRAM_CHAT_BURST = int(os.getenv("TELEGRAM_CHAT_BURST", 3))
+# Максимальное количество повторов запроса, отклоненного Telegram по частоте (ответ 429 с retry_after)
+TELEGRAM_MAX_RETRIES = int(os.getenv("TELEGRAM_MAX_RETRIES", 3))
+# Максимальное время ожидания очереди на отправку сообщения в секундах
+TELEGRAM_QUEUE_TIMEOUT = float(os.getenv("TELEGRAM_QUEUE_TIMEOUT", 30))
+
+# Количество процессов-обработчиков обновлений: при значении больше 1 бот запускается в режиме супервизора
+BOT_WORKERS = int(os.getenv("BOT_WORKERS", 1))
+# Максимальное количество обновлений в очереди каждого процесса-обработчика
+BOT_WORKER_QUEUE_SIZE = int(os.getenv("BOT_WORKER_QUEUE_SIZE", 100))
+
+# Публичный адрес вебхука (например, "https://example.com/telegram/webhook"): если указан, бот получает
+# обновления через вебхук вместо долгого опроса. Путь адреса совпадает с путем, который принимает сервер вебхука
+WEBHOOK_URL = os.getenv("WEBHOOK_URL")
+# Адрес и порт, на которых сервер вебхука принимает обновления от обратного прокси
+WEBHOOK_HOST = os.getenv("WEBHOOK_HOST", "127.0.0.1")
+WEBHOOK_PORT = int(os.getenv("WEBHOOK_PORT", 8080))
+# Секретный токен, который Telegram передает в заголовке X-Telegram-Bot-Api-Secret-Token
+WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET")
+# Количество потоков-обработчиков обновлений вебхука и размер очереди каждого потока
+WEBHOOK_WORKERS = int(os.getenv("WEBHOOK_WORKERS", 4))
+WEBHOOK_QUEUE_SIZE = int(os.getenv("WEBHOOK_QUEUE_SIZE", 100))
+# Время ожидания места в заполненной очереди, после которого обновление отклоняется и Telegram повторяет его позже
+WEBHOOK_ENQUEUE_TIMEOUT = float(os.getenv("WEBHOOK_ENQUEUE_TIMEOUT", 1))
+
 
 # Команды бота по умолчанию
 DEFAULT_COMMANDS = (
@@ -35,6 +70,33 @@ DEFAULT_COMMANDS = (
 # Пути к базам данных
 DB_PATH_IMAGES = "./database/database_images.db"
 DB_PATH_MOVIES = "./database/database_movies.db"
+DB_PATH_API_CACHE = "./database/database_api_cache.db"
+DB_PATH_STATES = "./database/database_states.db"
+
+# Параметры подключений к базам данных SQLite: журнал WAL (чтение не блокируется записью), синхронизация
+# NORMAL (достаточна для WAL), размер отображения файла в память и кэша страниц (отрицательное значение - в КиБ)
+DB_PRAGMAS = {
+    "journal_mode": os.getenv("DB_JOURNAL_MODE", "wal"),
+    "synchronous": os.getenv("DB_SYNCHRONOUS", "normal"),
+    "mmap_size": int(os.getenv("DB_MMAP_SIZE", 64 * 1024 * 1024)),
+    "cache_size": int(os.getenv("DB_CACHE_SIZE", -16 * 1024)),
+}
+# Время ожидания снятия блокировки базы данных другим подключением в секундах
+DB_BUSY_TIMEOUT = float(os.getenv("DB_BUSY_TIMEOUT", 10))
+
+# Хранилище состояний пользователей: "sqlite" (в базе данных, сессии сохраняются между перезапусками)
+# либо "memory" (в памяти процесса)
+STATE_STORAGE = os.getenv("STATE_STORAGE", "sqlite")
+# Время жизни сессии пользователя без обращений в секундах
+STATE_TTL = float(os.getenv("STATE_TTL", 2 * 24 * 60 * 60))
+# Максимальный объем данных сессий в памяти процесса в байтах (для хранилища "memory")
+STATE_MEMORY_LIMIT = int(os.getenv("STATE_MEMORY_LIMIT", 64 * 1024 * 1024))
+# Максимальное количество фильмов в общем для всех сессий кэше данных фильмов
+FILM_CACHE_SIZE = int(os.getenv("FILM_CACHE_SIZE", 20000))
+# Хранить идентификаторы файлов изображений меню отдельно для каждого чата (по умолчанию общие для всех чатов)
+IMAGE_CACHE_PER_CHAT = os.getenv("IMAGE_CACHE_PER_CHAT", "false").lower() == "true"
+# Максимальное количество идентификаторов файлов постеров в памяти процесса (все постеры хранятся в базе данных)
+POSTER_CACHE_SIZE = int(os.getenv("POSTER_CACHE_SIZE", 20000))
 
 # Пути к изображениям
 IMAGE_HELP = "./img/help.jpg"
@@ -57,9 +119,60 @@ class SiteSettings(BaseSettings):
     Атрибуты:
         api_key (SecretStr): API ключ для доступа к внешним сервисам.
         host_api (str): Базовый URL для доступа к API.
+        api_timeout (float): Таймаут запроса к API в секундах.
+        api_pool_connections (int): Количество пулов соединений (по одному на хост), хранимых клиентом API.
+        api_pool_maxsize (int): Максимальное количество соединений с одним хостом.
+        api_pool_block (bool): Ожидать освобождения соединения при исчерпании пула вместо открытия нового.
+        api_cache_size (int): Максимальное количество ответов API в кэше (LRU).
+        api_cache_ttl_search (int): Время жизни в секундах кэшированных ответов поиска по названию.
+        api_cache_ttl_filters (int): Время жизни в секундах кэшированных ответов поиска по фильтрам.
+        api_cache_persist (bool): Сохранять кэш ответов API в базе данных SQLite между перезапусками.
+        api_rate_limit (float): Средняя допустимая частота запросов к API (запросов в секунду).
+        api_rate_burst (int): Допустимое количество запросов к API в кратковременном всплеске.
+        api_daily_quota (int): Суточный лимит запросов для ключа API.
+        api_quota_reserve (int): Остаток суточного лимита, при котором бот отвечает только из кэша.
+        api_connect_timeout (float): Таймаут установки соединения с API в секундах.
+        api_max_retries (int): Количество повторов запроса к API при сбое соединения или ошибке сервера.
+        api_backoff_base (float): Базовая задержка перед повтором запроса в секундах (удваивается с каждым повтором).
+        api_backoff_max (float): Максимальная задержка перед повтором запроса в секундах.
+        api_breaker_threshold (int): Количество сбоев подряд, после которого запросы к API временно прекращаются.
+        api_breaker_reset (float): Время в секундах, через которое выполняется пробный запрос к API.
+        api_search_limit (int): Размер страницы запроса поиска фильмов по умолчанию.
+        api_search_max_limit (int): Максимальный размер страницы запроса при адаптивном увеличении.
+        api_search_target (int): Желаемое количество фильмов на странице после отбора фильмов без описания
+            и не совпадающих с поисковым запросом.
+        api_prefetch_cards (int): Количество последних карточек страницы, при просмотре которых следующая страница
+            результатов поиска загружается в фоне.
+        api_prefetch_workers (int): Количество потоков фоновой загрузки страниц результатов поиска.
+        api_prefetch_sessions (int): Максимальное количество сессий с загруженной в фоне страницей (страницы
+            давно не использованных сессий удаляются).
     """
     api_key: SecretStr = os.getenv("API_KEY", None)
     host_api: str = os.getenv("API_URL", None)
+    api_timeout: float = float(os.getenv("API_TIMEOUT", 10))
+    api_pool_connections: int = int(os.getenv("API_POOL_CONNECTIONS", 4))
+    api_pool_maxsize: int = int(os.getenv("API_POOL_MAXSIZE", 16))
+    api_pool_block: bool = os.getenv("API_POOL_BLOCK", "true").lower() == "true"
+    api_cache_size: int = int(os.getenv("API_CACHE_SIZE", 1000))
+    api_cache_ttl_search: int = int(os.getenv("API_CACHE_TTL_SEARCH", 6 * 60 * 60))
+    api_cache_ttl_filters: int = int(os.getenv("API_CACHE_TTL_FILTERS", 60 * 60))
+    api_cache_persist: bool = os.getenv("API_CACHE_PERSIST", "false").lower() == "true"
+    api_rate_limit: float = float(os.getenv("API_RATE_LIMIT", 5))
+    api_rate_burst: int = int(os.getenv("API_RATE_BURST", 10))
+    api_daily_quota: int = int(os.getenv("API_DAILY_QUOTA", 200))
+    api_quota_reserve: int = int(os.getenv("API_QUOTA_RESERVE", 10))
+    api_connect_timeout: float = float(os.getenv("API_CONNECT_TIMEOUT", 3))
+    api_max_retries: int = int(os.getenv("API_MAX_RETRIES", 2))
+    api_backoff_base: float = float(os.getenv("API_BACKOFF_BASE", 0.3))
+    api_backoff_max: float = float(os.getenv("API_BACKOFF_MAX", 2))
+    api_breaker_threshold: int = int(os.getenv("API_BREAKER_THRESHOLD", 5))
+    api_breaker_reset: float = float(os.getenv("API_BREAKER_RESET", 30))
+    api_search_limit: int = int(os.getenv("API_SEARCH_LIMIT", 15))
+    api_search_max_limit: int = int(os.getenv("API_SEARCH_MAX_LIMIT", 50))
+    api_search_target: int = int(os.getenv("API_SEARCH_TARGET", 10))
+    api_prefetch_cards: int = int(os.getenv("API_PREFETCH_CARDS", 3))
+    api_prefetch_workers: int = int(os.getenv("API_PREFETCH_WORKERS", 2))
+    api_prefetch_sessions: int = int(os.getenv("API_PREFETCH_SESSIONS", 1000))
 
     def __init__(self, **kwargs):
         """
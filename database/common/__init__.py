@@ -1,2 +1,4 @@
+from . import model_api_cache
 from . import model_images
 from . import models_movies
+from . import model_states
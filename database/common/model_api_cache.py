@@ -0,0 +1,56 @@
+from peewee import CharField, DateField, FloatField, IntegerField, Model, SqliteDatabase, TextField
+
+from config_data.config import DB_BUSY_TIMEOUT, DB_PRAGMAS, DB_PATH_API_CACHE
+
+
+db_api_cache = SqliteDatabase(DB_PATH_API_CACHE, pragmas=DB_PRAGMAS, timeout=DB_BUSY_TIMEOUT)
+
+
+class ApiResponse(Model):
+    """
+    Модель, представляющая сохраненный ответ API Кинопоиск.
+
+    Attributes:
+        key (CharField): Канонический ключ запроса (конечная точка API и параметры запроса).
+        endpoint (CharField): Конечная точка API.
+        payload (TextField): JSON-ответ API.
+        created_at (FloatField): Время получения ответа (Unix time).
+    """
+    key = CharField(primary_key=True)
+    endpoint = CharField()
+    payload = TextField()
+    created_at = FloatField()
+
+    class Meta:
+        """
+        Метаданные для модели ApiResponse.
+
+        Attributes:
+            database (SqliteDatabase): База данных, используемая для хранения данной модели.
+            table_name (str): Имя таблицы в базе данных, соответствующей данной модели.
+        """
+        database = db_api_cache
+        table_name = "api_responses"
+
+
+class ApiQuota(Model):
+    """
+    Модель, представляющая расход суточного лимита запросов к API Кинопоиск.
+
+    Attributes:
+        day (DateField): Дата, за которую учитываются запросы.
+        used (IntegerField): Количество запросов к API, выполненных за эту дату.
+    """
+    day = DateField(primary_key=True)
+    used = IntegerField(default=0)
+
+    class Meta:
+        """
+        Метаданные для модели ApiQuota.
+
+        Attributes:
+            database (SqliteDatabase): База данных, используемая для хранения данной модели.
+            table_name (str): Имя таблицы в базе данных, соответствующей данной модели.
+        """
+        database = db_api_cache
+        table_name = "api_quota"
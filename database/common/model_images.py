@@ -1,9 +1,9 @@
-from peewee import CharField, Model, SqliteDatabase
+from peewee import CharField, Model, SqliteDatabase, TextField
 
-from config_data.config import DB_PATH_IMAGES
+from config_data.config import DB_BUSY_TIMEOUT, DB_PRAGMAS, DB_PATH_IMAGES
 
 
-db_image = SqliteDatabase(DB_PATH_IMAGES)
+db_image = SqliteDatabase(DB_PATH_IMAGES, pragmas=DB_PRAGMAS, timeout=DB_BUSY_TIMEOUT)
 
 
 class ImageFile(Model):
@@ -12,17 +12,41 @@ class ImageFile(Model):
 
     Attributes:
         chat_id (CharField): Идентификатор чата, к которому привязано изображение.
-        image_name (CharField): Уникальное имя изображения.
+        image_name (CharField): Имя изображения, уникальное в пределах чата.
         file_id (CharField): Идентификатор файла изображения.
     """
     chat_id = CharField()
-    image_name = CharField(unique=True)
+    image_name = CharField()
     file_id = CharField()
 
     class Meta:
         """
         Метаданные для модели ImageFile.
 
+        Attributes:
+            database (SqliteDatabase): База данных, используемая для хранения данной модели.
+            indexes (tuple): Уникальный индекс (chat_id, image_name): одно изображение хранится для каждого чата.
+        """
+        database = db_image
+        indexes = ((("chat_id", "image_name"), True),)
+
+
+class PosterFile(Model):
+    """
+    Модель, представляющая постер фильма, загруженный в Telegram: общий для всех чатов идентификатор файла,
+    по которому постер отправляется повторно без загрузки по URL.
+
+    Attributes:
+        poster_url (TextField): URL постера фильма (уникальный).
+        file_id (CharField): Идентификатор файла постера в Telegram.
+    """
+    poster_url = TextField(unique=True)
+    file_id = CharField()
+
+    class Meta:
+        """
+        Метаданные для модели PosterFile.
+
         Attributes:
             database (SqliteDatabase): База данных, используемая для хранения данной модели.
         """
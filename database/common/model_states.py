@@ -0,0 +1,33 @@
+from peewee import BlobField, CharField, FloatField, Model, SqliteDatabase
+
+from config_data.config import DB_BUSY_TIMEOUT, DB_PRAGMAS, DB_PATH_STATES
+
+
+db_states = SqliteDatabase(DB_PATH_STATES, pragmas=DB_PRAGMAS, timeout=DB_BUSY_TIMEOUT)
+
+
+class UserState(Model):
+    """
+    Модель, представляющая состояние пользователя в чате и данные его сессии.
+
+    Attributes:
+        key (CharField): Ключ состояния (префикс, идентификатор чата и идентификатор пользователя).
+        state (CharField, optional): Название текущего состояния пользователя.
+        data (BlobField): Данные сессии, сериализованные pickle и сжатые zlib.
+        updated_at (FloatField): Время последнего изменения записи (Unix time).
+    """
+    key = CharField(primary_key=True)
+    state = CharField(null=True)
+    data = BlobField()
+    updated_at = FloatField(index=True)
+
+    class Meta:
+        """
+        Метаданные для модели UserState.
+
+        Attributes:
+            database (SqliteDatabase): База данных, используемая для хранения данной модели.
+            table_name (str): Имя таблицы в базе данных, соответствующей данной модели.
+        """
+        database = db_states
+        table_name = "user_states"
@@ -5,14 +5,16 @@ from peewee import (
     BooleanField,
     CharField,
     DateField,
+    DateTimeField,
+    IntegerField,
     Model,
     SqliteDatabase,
     TextField,
 )
 
-from config_data.config import DB_PATH_MOVIES
+from config_data.config import DB_BUSY_TIMEOUT, DB_PRAGMAS, DB_PATH_MOVIES
 
-db = SqliteDatabase(DB_PATH_MOVIES)
+db = SqliteDatabase(DB_PATH_MOVIES, pragmas=DB_PRAGMAS, timeout=DB_BUSY_TIMEOUT)
 
 
 class BaseModel(Model):
@@ -45,9 +47,12 @@ class QueryString(BaseModel):
     Attributes:
         type_search (CharField): Тип поискового запроса (например, `movies_search` либо `movies_by_filters`).
         text_search (CharField, optional): Текст поискового запроса на основе введенных пользователем данных.
+        page_limit (IntegerField, optional): Размер страницы запроса к API, с которым получена первая страница
+            результатов. С ним же запрашиваются следующие страницы сохраненного поиска.
     """
     type_search = CharField()
     text_search = TextField(default="")
+    page_limit = IntegerField(null=True)
 
     class Meta:
         """
@@ -55,17 +60,25 @@ class QueryString(BaseModel):
 
         Attributes:
             table_name (str): Имя таблицы в базе данных, соответствующей данной модели.
+            indexes (tuple): Составные индексы для выборки истории запросов пользователя по дате, типу
+                и тексту поискового запроса.
         """
 
         table_name = "query_string"
+        indexes = (
+            (("user_id", "date_search"), False),
+            (("user_id", "type_search"), False),
+            (("user_id", "text_search"), False),
+        )
 
 
-class CommonMovieFields(BaseModel):
+class Film(Model):
     """
-    Общие поля для моделей фильмов. Наследуется от BaseModel.
+    Модель общего каталога фильмов: данные фильма хранятся один раз для всех пользователей и поисковых запросов,
+    а записи пользователей ссылаются на фильм по идентификатору Кинопоиск.
 
     Attributes:
-        movie_id (CharField): Идентификатор фильма.
+        movie_id (CharField): Идентификатор фильма на Кинопоиске (первичный ключ).
         name_movie (TextField, optional): Название фильма.
         alternative_name (CharField, optional): Альтернативное название фильма.
         type_movie (CharField, optional): Тип фильма (например, фильм, сериал).
@@ -77,12 +90,10 @@ class CommonMovieFields(BaseModel):
         short_description (TextField, optional): Краткое описание фильма.
         description (TextField, optional): Полное описание фильма.
         poster (TextField, optional): Ссылка на постер фильма.
-        is_series (BooleanField): Является ли фильм сериалом. По умолчанию False.
-        is_viewed (BooleanField): Просмотрен ли фильм. По умолчанию False.
-        is_favorites (BooleanField): Является ли фильм избранным. По умолчанию False.
+        is_series (BooleanField): Является ли фильм сериалом.
+        updated_at (DateTimeField): Дата и время последнего обновления данных фильма.
     """
-
-    movie_id = CharField()
+    movie_id = CharField(primary_key=True)
     name_movie = TextField(null=True)
     alternative_name = CharField(null=True)
     type_movie = CharField(null=True)
@@ -95,6 +106,32 @@ class CommonMovieFields(BaseModel):
     description = TextField(null=True)
     poster = TextField(null=True)
     is_series = BooleanField(null=True)
+    updated_at = DateTimeField(default=datetime.now)
+
+    class Meta:
+        """
+        Метаданные для модели Film.
+
+        Attributes:
+            database (SqliteDatabase): База данных, используемая для хранения данной модели.
+            table_name (str): Имя таблицы в базе данных, соответствующей данной модели.
+        """
+        database = db
+        table_name = "films"
+
+
+class CommonMovieFields(BaseModel):
+    """
+    Общие поля для моделей фильмов пользователя. Наследуется от BaseModel. Данные фильма хранятся
+    в каталоге Film.
+
+    Attributes:
+        movie_id (CharField): Идентификатор фильма (ссылка на Film.movie_id).
+        is_viewed (BooleanField): Просмотрен ли фильм. По умолчанию False.
+        is_favorites (BooleanField): Является ли фильм избранным. По умолчанию False.
+    """
+
+    movie_id = CharField()
     is_viewed = BooleanField(default=False)
     is_favorites = BooleanField(default=False)
 
@@ -125,8 +162,14 @@ class BaseMovie(CommonMovieFields):
 
         Attributes:
             table_name (str): Имя таблицы в базе данных, соответствующей данной модели.
+            indexes (tuple): Составные индексы для выборки фильмов пользователя по тексту поискового запроса
+                и по идентификатору фильма.
         """
         table_name = "base_movies"
+        indexes = (
+            (("user_id", "text_search"), False),
+            (("user_id", "movie_id"), False),
+        )
 
 
 class MoviePostponed(CommonMovieFields):
@@ -140,5 +183,7 @@ class MoviePostponed(CommonMovieFields):
 
         Attributes:
             table_name (str): Имя таблицы в базе данных, соответствующей данной модели.
+            indexes (tuple): Уникальный индекс: фильм хранится у пользователя в единственном экземпляре.
         """
         table_name = "movies_postponed"
+        indexes = ((("user_id", "movie_id"), True),)
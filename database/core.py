@@ -1,15 +1,20 @@
 from .utils.CRUD_movies import CRUDInterface
-from .common.models_movies import db, BaseMovie, QueryString, MoviePostponed
+from .utils.migrations import migrate_images_db, migrate_movies_db
+from .utils.query_plans import check_query_plans
+from .common.models_movies import db, BaseMovie, Film, QueryString, MoviePostponed
 from .utils.CRUD_images import CRUDInterfaceImage
-from .common.model_images import ImageFile
+from .common.model_images import ImageFile, PosterFile
 from database.common.model_images import db_image
 
 
 db.connect()
-db.create_tables([QueryString, BaseMovie, MoviePostponed])
+migrate_movies_db()
+db.create_tables([QueryString, Film, BaseMovie, MoviePostponed])
+check_query_plans()
 
 db_image.connect()
-db_image.create_tables([ImageFile])
+migrate_images_db()
+db_image.create_tables([ImageFile, PosterFile])
 
 crud = CRUDInterface
 crud_images = CRUDInterfaceImage
@@ -2,7 +2,7 @@ from typing import Callable
 
 from peewee import DoesNotExist
 
-from ..common.model_images import ImageFile
+from ..common.model_images import ImageFile, PosterFile
 
 
 def _save_file_id(chat_id: int, image_name: str, file_id: str) -> None:
@@ -12,7 +12,7 @@ def _save_file_id(chat_id: int, image_name: str, file_id: str) -> None:
 
     Args:
         chat_id (str): Идентификатор чата, к которому привязано изображение.
-        image_name (str): Уникальное имя изображения.
+        image_name (str): Имя изображения.
         file_id (str): Идентификатор файла изображения.
     """
     ImageFile.insert(
@@ -26,7 +26,7 @@ def _get_file_id(chat_id: int, image_name: str) -> str | None:
 
     Args:
         chat_id (str): Идентификатор чата, к которому привязано изображение.
-        image_name (str): Уникальное имя изображения.
+        image_name (str): Имя изображения.
 
     Returns:
         str | None: Идентификатор файла изображения, если запись найдена; иначе None.
@@ -43,6 +43,58 @@ def _get_file_id(chat_id: int, image_name: str) -> str | None:
         return None
 
 
+def _delete_file_id(chat_id: int | str, image_name: str, file_id: str) -> None:
+    """
+    Удаляет устаревший идентификатор файла изображения, если запись не была заменена новым идентификатором.
+
+    Args:
+        chat_id (int | str): Идентификатор чата, к которому привязано изображение.
+        image_name (str): Имя изображения.
+        file_id (str): Устаревший идентификатор файла изображения.
+    """
+    ImageFile.delete().where(
+        (ImageFile.chat_id == chat_id) & (ImageFile.image_name == image_name) & (ImageFile.file_id == file_id)
+    ).execute()
+
+
+def _save_poster_file_id(poster_url: str, file_id: str) -> None:
+    """
+    Сохраняет идентификатор файла постера фильма в Telegram. Существующая запись для URL постера заменяется.
+
+    Args:
+        poster_url (str): URL постера фильма.
+        file_id (str): Идентификатор файла постера в Telegram.
+    """
+    PosterFile.insert(poster_url=poster_url, file_id=file_id).on_conflict_replace().execute()
+
+
+def _get_poster_file_id(poster_url: str) -> str | None:
+    """
+    Извлекает идентификатор файла постера фильма в Telegram по URL постера.
+
+    Args:
+        poster_url (str): URL постера фильма.
+
+    Returns:
+        str | None: Идентификатор файла постера, если запись найдена; иначе None.
+    """
+    try:
+        return PosterFile.get(PosterFile.poster_url == poster_url).file_id
+    except DoesNotExist:
+        return None
+
+
+def _delete_poster_file_id(poster_url: str, file_id: str) -> None:
+    """
+    Удаляет устаревший идентификатор файла постера, если запись не была заменена новым идентификатором.
+
+    Args:
+        poster_url (str): URL постера фильма.
+        file_id (str): Устаревший идентификатор файла постера.
+    """
+    PosterFile.delete().where((PosterFile.poster_url == poster_url) & (PosterFile.file_id == file_id)).execute()
+
+
 class CRUDInterfaceImage:
     """
     Интерфейс для работы с изображениями в базе данных. Предоставляет методы для сохранения и извлечения
@@ -51,6 +103,10 @@ class CRUDInterfaceImage:
     Методы:
         get_image() -> callable: Возвращает функцию для извлечения идентификаторов файлов изображений.
         save_image() -> callable: Возвращает функцию для сохранения идентификаторов файлов изображений.
+        delete_image() -> callable: Возвращает функцию для удаления устаревших идентификаторов файлов изображений.
+        get_poster() -> callable: Возвращает функцию для извлечения идентификаторов файлов постеров.
+        save_poster() -> callable: Возвращает функцию для сохранения идентификаторов файлов постеров.
+        delete_poster() -> callable: Возвращает функцию для удаления устаревших идентификаторов файлов постеров.
     """
     @staticmethod
     def get_image() -> Callable:
@@ -71,3 +127,43 @@ class CRUDInterfaceImage:
             callable: Функция для сохранения идентификаторов файлов изображений.
         """
         return _save_file_id
+
+    @staticmethod
+    def delete_image() -> Callable:
+        """
+        Возвращает функцию для удаления устаревших идентификаторов файлов изображений.
+
+        Returns:
+            callable: Функция для удаления идентификатора файла изображения.
+        """
+        return _delete_file_id
+
+    @staticmethod
+    def get_poster() -> Callable:
+        """
+        Возвращает функцию для извлечения идентификаторов файлов постеров фильмов.
+
+        Returns:
+            callable: Функция для получения идентификаторов файлов постеров по URL постера.
+        """
+        return _get_poster_file_id
+
+    @staticmethod
+    def save_poster() -> Callable:
+        """
+        Возвращает функцию для сохранения идентификаторов файлов постеров фильмов.
+
+        Returns:
+            callable: Функция для сохранения идентификаторов файлов постеров.
+        """
+        return _save_poster_file_id
+
+    @staticmethod
+    def delete_poster() -> Callable:
+        """
+        Возвращает функцию для удаления устаревших идентификаторов файлов постеров фильмов.
+
+        Returns:
+            callable: Функция для удаления идентификатора файла постера.
+        """
+        return _delete_poster_file_id
@@ -1,17 +1,18 @@
 from typing import List, Dict, TypeVar
 
-from peewee import ModelSelect, SqliteDatabase
+from peewee import Model, ModelSelect, SqliteDatabase
 
 from ..common.models_movies import BaseModel
 
 
 T = TypeVar("T", bound=BaseModel)
+M = TypeVar("M", bound=Model)
 
 
 def _store_data(db: SqliteDatabase, model: T, data: List[Dict]) -> None:
     """
-    Сохраняет данные в базу данных, используя указанную модель. Использует транзакции для обеспечения целостности
-    данных.
+    Сохраняет данные в базу данных, используя указанную модель, одним запросом INSERT для всех записей.
+    Использует транзакции для обеспечения целостности данных.
 
     Args:
         db (SqliteDatabase): Экземпляр базы данных для выполнения операций.
@@ -20,7 +21,26 @@ def _store_data(db: SqliteDatabase, model: T, data: List[Dict]) -> None:
             запись.
     """
     with db.atomic():
-        model.insert_many(*data).execute()
+        model.insert_many(data).execute()
+
+
+def _store_or_update_data(db: SqliteDatabase, model: M, data: List[Dict]) -> None:
+    """
+    Сохраняет данные в базу данных одним запросом INSERT для всех записей. Записи, первичный ключ которых
+    уже есть в таблице, обновляются переданными значениями (INSERT ... ON CONFLICT DO UPDATE).
+
+    Args:
+        db (SqliteDatabase): Экземпляр базы данных для выполнения операций.
+        model (M): Модель, в которую будут сохраняться данные.
+        data (List[Dict]): Список словарей, содержащих данные для вставки или обновления. Каждый словарь
+            представляет собой одну запись.
+    """
+    primary_key = model._meta.primary_key
+    with db.atomic():
+        model.insert_many(data).on_conflict(
+            conflict_target=[primary_key],
+            preserve=[field for field in model._meta.sorted_fields if field is not primary_key],
+        ).execute()
 
 
 def _retrieve_all_data(db: SqliteDatabase, model: T, *columns: str) -> ModelSelect:
@@ -47,6 +67,7 @@ class CRUDInterface:
 
     Методы:
         create() -> callable: Возвращает функцию для сохранения данных в базу данных.
+        upsert() -> callable: Возвращает функцию для сохранения или обновления данных в базе данных.
         retrieve() -> callable: Возвращает функцию для извлечения данных из базы данных.
     """
 
@@ -60,6 +81,16 @@ class CRUDInterface:
         """
         return _store_data
 
+    @staticmethod
+    def upsert() -> callable:
+        """
+        Возвращает функцию для сохранения или обновления данных в базе данных.
+
+        Returns:
+            callable: Функция для сохранения или обновления данных.
+        """
+        return _store_or_update_data
+
     @staticmethod
     def retrieve() -> callable:
         """
@@ -1 +1,3 @@
 from . import CRUD_movies
+from . import migrations
+from . import query_plans
@@ -0,0 +1,127 @@
+from typing import Callable, List
+
+from peewee import SqliteDatabase, fn
+from playhouse.migrate import SqliteMigrator, migrate
+
+from logs.logging_config import log
+from ..common.model_images import db_image
+from ..common.models_movies import db, Film, MoviePostponed, QueryString
+
+# Столбцы с данными фильма, перенесенные из таблиц фильмов пользователей в каталог `films`.
+FILM_COLUMNS = (
+    "name_movie", "alternative_name", "type_movie", "year", "countries", "genre", "rating", "age_rating",
+    "short_description", "description", "poster", "is_series",
+)
+
+
+def _dedupe_postponed_movies() -> None:
+    """
+    Удаляет повторные записи фильма у пользователя в таблице `movies_postponed` перед созданием уникального
+    индекса (user_id, movie_id). Сохраняется самая ранняя запись: именно ее статусы бот читал и изменял.
+    """
+    if not MoviePostponed.table_exists():
+        return
+    keep = MoviePostponed.select(fn.MIN(MoviePostponed.id)).group_by(
+        MoviePostponed.user_id, MoviePostponed.movie_id
+    )
+    removed = MoviePostponed.delete().where(MoviePostponed.id.not_in(keep)).execute()
+    if removed:
+        log.info(f"Удалено повторных записей отложенных фильмов: {removed}.")
+
+
+def _fold_movies_into_catalog() -> None:
+    """
+    Переносит данные фильмов из таблиц `movies_postponed` и `base_movies` в общий каталог `films` и удаляет
+    из этих таблиц столбцы с данными фильма. Для фильма, сохраненного несколько раз, в каталоге остаются
+    данные самой поздней записи `base_movies`, а если таких нет, то самой поздней записи `movies_postponed`.
+    """
+    tables = [
+        table for table in ("movies_postponed", "base_movies")
+        if "name_movie" in {column.name for column in db.get_columns(table)}
+    ]
+    if not tables:
+        return
+
+    db.create_tables([Film])
+    columns = ", ".join(FILM_COLUMNS)
+    for table in tables:
+        db.execute_sql(
+            f"INSERT OR REPLACE INTO films (movie_id, {columns}, updated_at) "
+            f"SELECT movie_id, {columns}, date_search FROM {table} ORDER BY id"
+        )
+
+    migrator = SqliteMigrator(db)
+    migrate(*[migrator.drop_column(table, column) for table in tables for column in FILM_COLUMNS])
+    log.info(f"В каталог фильмов перенесено фильмов: {Film.select().count()}.")
+
+
+def _add_query_page_limit() -> None:
+    """
+    Добавляет в таблицу `query_string` столбец `page_limit` с размером страницы запроса к API. У сохраненных
+    ранее поисков размер страницы не известен, и их следующие страницы запрашиваются с базовым размером.
+    """
+    if not QueryString.table_exists():
+        return
+    if "page_limit" in {column.name for column in db.get_columns("query_string")}:
+        return
+    migrate(SqliteMigrator(db).add_column("query_string", "page_limit", QueryString.page_limit))
+
+
+# Миграции базы данных фильмов: миграция с индексом i переводит схему на версию i + 1.
+# Индексы моделей создаются после миграций при вызове `db.create_tables`.
+MIGRATIONS: List[Callable[[], None]] = [
+    _dedupe_postponed_movies,
+    _fold_movies_into_catalog,
+    _add_query_page_limit,
+]
+
+
+def _drop_image_name_unique_index() -> None:
+    """
+    Удаляет уникальный индекс по имени изображения в таблице `imagefile`: при хранении идентификаторов файлов
+    для каждого чата (`IMAGE_CACHE_PER_CHAT=true`) запись изображения для нового чата заменяла запись другого чата.
+    Уникальность (chat_id, image_name) обеспечивает индекс модели ImageFile.
+    """
+    if "imagefile_image_name" in {index.name for index in db_image.get_indexes("imagefile")}:
+        migrate(SqliteMigrator(db_image).drop_index("imagefile", "imagefile_image_name"))
+
+
+# Миграции базы данных изображений: миграция с индексом i переводит схему на версию i + 1.
+IMAGE_MIGRATIONS: List[Callable[[], None]] = [
+    _drop_image_name_unique_index,
+]
+
+
+def _apply_migrations(database: SqliteDatabase, migrations: List[Callable[[], None]], name: str) -> None:
+    """
+    Выполняет недостающие миграции базы данных. Версия схемы хранится в `PRAGMA user_version`; каждая миграция
+    выполняется в отдельной транзакции вместе с обновлением версии. После миграций файл базы данных сжимается
+    (VACUUM), чтобы освободить место, занятое удаленными данными.
+
+    Args:
+        database (SqliteDatabase): База данных.
+        migrations (List[Callable[[], None]]): Миграции базы данных по порядку версий схемы.
+        name (str): Название базы данных для журнала.
+    """
+    version = database.pragma("user_version")
+    for target, migration in enumerate(migrations[version:], start=version + 1):
+        with database.atomic():
+            migration()
+            database.pragma("user_version", target)
+        log.info(f"База данных {name} обновлена до версии схемы {target}.")
+    if version < len(migrations):
+        database.execute_sql("VACUUM")
+
+
+def migrate_movies_db() -> None:
+    """
+    Приводит существующий файл базы данных фильмов к текущей схеме (см. `_apply_migrations`).
+    """
+    _apply_migrations(db, MIGRATIONS, "фильмов")
+
+
+def migrate_images_db() -> None:
+    """
+    Приводит существующий файл базы данных изображений к текущей схеме (см. `_apply_migrations`).
+    """
+    _apply_migrations(db_image, IMAGE_MIGRATIONS, "изображений")
@@ -0,0 +1,70 @@
+from datetime import datetime
+from typing import Dict, List
+
+from peewee import Query
+
+from logs.logging_config import log
+from ..common.models_movies import db, BaseMovie, Film, MoviePostponed, QueryString
+
+
+def hot_queries() -> Dict[str, Query]:
+    """
+    Формирует частые запросы бота к базе данных фильмов с произвольными значениями параметров.
+
+    Returns:
+        Dict[str, Query]: Запросы по их названиям.
+    """
+    user_id, movie_id, text_search = "0", "0", ""
+    return {
+        "postponed_by_movie": MoviePostponed.select().where(
+            (MoviePostponed.user_id == user_id) & (MoviePostponed.movie_id == movie_id)
+        ),
+        "postponed_by_movie_ids": MoviePostponed.select().where(
+            (MoviePostponed.user_id == user_id) & (MoviePostponed.movie_id.in_([movie_id]))
+        ),
+        "postponed_by_user": MoviePostponed.select()
+        .where((MoviePostponed.user_id == user_id) & MoviePostponed.is_favorites)
+        .order_by(MoviePostponed.id.desc()),
+        "base_by_text_search": BaseMovie.select().where(
+            (BaseMovie.user_id == user_id) & (BaseMovie.text_search == text_search)
+        ),
+        "base_by_movie": BaseMovie.select().where(
+            (BaseMovie.user_id == user_id) & (BaseMovie.movie_id == movie_id)
+        ),
+        "films_by_movie_ids": Film.select().where(Film.movie_id.in_([movie_id])),
+        "history_by_date": QueryString.select().where(
+            (QueryString.user_id == user_id) & (QueryString.date_search >= datetime.now())
+        ),
+        "history_by_type": QueryString.select().where(
+            (QueryString.user_id == user_id) & (QueryString.type_search == "movie_search")
+        ),
+        "history_by_text_search": QueryString.delete().where(
+            (QueryString.user_id == user_id) & (QueryString.text_search == text_search)
+        ),
+    }
+
+
+def find_full_scans() -> Dict[str, List[str]]:
+    """
+    Проверяет планы выполнения частых запросов (EXPLAIN QUERY PLAN) и находит запросы, выполняемые полным
+    просмотром таблицы вместо поиска по индексу.
+
+    Returns:
+        Dict[str, List[str]]: Названия запросов с полным просмотром таблицы и соответствующие строки плана.
+    """
+    full_scans = {}
+    for name, query in hot_queries().items():
+        sql, params = query.sql()
+        plan = [row[-1] for row in db.execute_sql(f"EXPLAIN QUERY PLAN {sql}", params)]
+        scans = [detail for detail in plan if detail.startswith("SCAN") and "INDEX" not in detail]
+        if scans:
+            full_scans[name] = scans
+    return full_scans
+
+
+def check_query_plans() -> None:
+    """
+    Записывает в журнал ошибку для каждого частого запроса, который выполняется полным просмотром таблицы.
+    """
+    for name, scans in find_full_scans().items():
+        log.error(f"Запрос {name} выполняется без индекса: {'; '.join(scans)}")
@@ -3,7 +3,7 @@ from datetime import datetime, timedelta
 from peewee import fn
 from telebot.types import Message, CallbackQuery
 
-from config_data.config import DATE_FORMAT, DATE_FORMAT_STRING, IMAGE_HISTORY
+from config_data.config import DATE_FORMAT, DATE_FORMAT_STRING
 
 from keyboards.inline.inline_history import (
     history_clear_select,
@@ -27,14 +27,15 @@ from services.services_history import (
     history_query_type_clear
 )
 
+from services.services_image_assets import send_menu_image
 from services.services_logging import error_logger_bot
+from services.services_prefetch import prefetcher
 
 from logs.logging_config import log
 
 from loader import bot
 from states.search_fields import HistoryStates, PaginationStates
 from database.common.models_movies import BaseMovie, QueryString
-from database.core import crud_images
 
 
 @bot.message_handler(commands=["history"])
@@ -46,7 +47,7 @@ def menu_history(message: Message) -> None:
     Действия:
         - Выполняет сброс состояния и всех данных, связанных с текущей сессией пользователя.
         - Устанавливает состояние пользователя `HistoryStates.query`.
-        - Сохраняет изображение для команды `history` в базе данных ImageFile для быстрого к нему доступа
+        - Сохраняет изображение для команды `history` в реестре изображений меню для быстрого к нему доступа
         при повторном использовании.
         - Проверяет наличие истории запросов в базе данных BaseMovie.
         - Отправляет сообщение с изображением и сообщение в чат с инлайн-клавиатурой.
@@ -60,36 +61,11 @@ def menu_history(message: Message) -> None:
         FileNotFoundError: Если файл изображения не найден, отправляется сообщение с ошибкой.
     """
     user_id, chat_id = message.from_user.id, message.chat.id
+    prefetcher.drop(user_id, chat_id)
     bot.reset_data(user_id, chat_id)
     bot.set_state(user_id, HistoryStates.query, chat_id)
 
-    db_get_image = crud_images.get_image()
-    db_save = crud_images.save_image()
-    image_name = "history"
-    file_id = db_get_image(chat_id, image_name)
-
-    caption = "📚 <b>Управление историей поисковых запросов</b>."
-
-    try:
-        if file_id:
-            bot.send_photo(
-                chat_id,
-                file_id,
-                caption=caption,
-                parse_mode="HTML",
-            )
-        else:
-            with open(IMAGE_HISTORY, "rb") as image:
-                sent_message = bot.send_photo(
-                    chat_id,
-                    image,
-                    caption=caption,
-                    parse_mode="HTML",
-                )
-                db_save(chat_id, image_name, sent_message.photo[-1].file_id)
-    except FileNotFoundError as exc:
-        log.error(f"Ошибка при обработке изображения: {type(exc)} - {exc}")
-        bot.send_message(chat_id, caption, parse_mode="HTML")
+    send_menu_image(chat_id, "history", "📚 <b>Управление историей поисковых запросов</b>.")
 
     user = BaseMovie.get_or_none(BaseMovie.user_id == user_id)
     if user is None:
@@ -3,8 +3,6 @@ from datetime import datetime
 from telebot.util import content_type_media
 from telebot.types import Message, CallbackQuery
 
-from config_data.config import IMAGE_MOVIE_BY_FILTERS
-
 from keyboards.inline.inline_keyboard import create_inline_keyboard
 from keyboards.inline.inline_movie_by_filters import (
     select_filters_keyboard,
@@ -43,14 +41,16 @@ from services.services_database import (
     update_database,
     update_database_query
 )
+from services.services_film_cache import session_movies
+from services.services_image_assets import send_menu_image
 from services.services_logging import error_logger_bot
+from services.services_prefetch import prefetcher
 
 from logs.logging_config import log
 
 from loader import bot
 from states.search_fields import SearchStates, PaginationStates
 from database.common.models_movies import BaseMovie
-from database.core import crud_images
 
 
 @bot.message_handler(commands=["movie_by_filters"])
@@ -62,7 +62,7 @@ def menu_movie_by_filters(message: Message) -> None:
     Действия:
         - Выполняет сброс состояния и всех данных, связанных с текущей сессией пользователя.
         - Устанавливает состояние пользователя на `SearchStates.query`.
-        - Сохраняет изображение для команды `movie_by_filters` в базе данных ImageFile для быстрого к нему доступа
+        - Сохраняет изображение для команды `movie_by_filters` в реестре изображений меню для быстрого к нему доступа
         при повторном использовании.
         - Отправляет в чат изображение с пояснительным текстом и инлайн-клавиатуру для выбора фильтров.
 
@@ -74,35 +74,11 @@ def menu_movie_by_filters(message: Message) -> None:
         FileNotFoundError: Если файл изображения не найден, отправляется сообщение с ошибкой.
     """
     user_id, chat_id = message.from_user.id, message.chat.id
+    prefetcher.drop(user_id, chat_id)
     bot.reset_data(user_id, chat_id)
     bot.set_state(user_id, SearchStates.query, chat_id)
 
-    db_get_image = crud_images.get_image()
-    db_save = crud_images.save_image()
-
-    image_name = "movie_by_filters"
-    file_id = db_get_image(chat_id, image_name)
-    caption = "🔍 <b>Поиск фильма <i>по фильтрам</i></b>."
-    try:
-        if file_id:
-            bot.send_photo(
-                chat_id,
-                file_id,
-                caption=caption,
-                parse_mode="HTML",
-            )
-        else:
-            with open(IMAGE_MOVIE_BY_FILTERS, "rb") as image:
-                sent_message = bot.send_photo(
-                    chat_id,
-                    image,
-                    caption=caption,
-                    parse_mode="HTML",
-                )
-                db_save(chat_id, image_name, sent_message.photo[-1].file_id)
-    except FileNotFoundError as exc:
-        log.error(f"Ошибка при обработке изображения: {type(exc)} - {exc}")
-        bot.send_message(chat_id, caption, parse_mode="HTML")
+    send_menu_image(chat_id, "movie_by_filters", "🔍 <b>Поиск фильма <i>по фильтрам</i></b>.")
 
     text = (
         "✔️ Задайте <b><i>фильтры</i></b> с помощью кнопок ниже "
@@ -205,12 +181,12 @@ def movie_setting_type(call: CallbackQuery) -> None:
         data.setdefault("type", [])
         data.setdefault("selected_type", ["фильм, сериал"])
 
-    if len(data["type"]) > 0:
-        letter = set_letter(data["type"], letter="")
-        text = f"📌 Задан{letter} <b><i>тип{letter}</i></b>: <i>{', '.join(data['selected_type'])}</i>"
-    else:
-        text = "✖️ <b><i>Тип</i></b> не был задан.\n\n📌 По умолчанию выбраны <i>фильм, сериал</i>."
-        data["type"] = ["movie", "tv-series"]
+        if len(data["type"]) > 0:
+            letter = set_letter(data["type"], letter="")
+            text = f"📌 Задан{letter} <b><i>тип{letter}</i></b>: <i>{', '.join(data['selected_type'])}</i>"
+        else:
+            text = "✖️ <b><i>Тип</i></b> не был задан.\n\n📌 По умолчанию выбраны <i>фильм, сериал</i>."
+            data["type"] = ["movie", "tv-series"]
 
     keyboard = select_filters_keyboard(data["buttons_filters"], buttons_per_row=3)
     bot.send_message(chat_id, text, reply_markup=keyboard, parse_mode="HTML")
@@ -736,8 +712,9 @@ def movie_setting_type_or_direction_sort(call: CallbackQuery) -> None:
         keyboard = create_inline_keyboard(data["buttons_sorting"], buttons_per_row=1)
     else:
         bot.set_state(user_id, SearchStates.query, chat_id)
-        data.setdefault("buttons_filters", btns_filters.copy())
-        data["buttons_filters"].pop("sort_filter", None)
+        with bot.retrieve_data(user_id, chat_id) as data:
+            data.setdefault("buttons_filters", btns_filters.copy())
+            data["buttons_filters"].pop("sort_filter", None)
         sorting = f'{buttons_sort_type[data["type_sort"]]}, {data["text_sort"]}'
         text_add = ""
         keyboard = select_filters_keyboard(data["buttons_filters"], buttons_per_row=3)
@@ -837,12 +814,11 @@ def search_universal_movies(call: CallbackQuery) -> None:
             (BaseMovie.user_id == user_id) & (BaseMovie.text_search == text_search)
         )
         if user_movies:
-            total_pages = 2
             movie_info = update_database(user_movies, type_search)
-            update_database_query(user_id, text_search, type_search)
+            total_pages, limit = 2, update_database_query(user_id, text_search, type_search)
             bot.delete_message(chat_id, call.message.message_id)
         else:
-            movie_info, total_pages = run_search_query(
+            movie_info, total_pages, limit = run_search_query(
                 call,
                 search_criteria=filters_false,
                 type_search=type_search,
@@ -854,9 +830,10 @@ def search_universal_movies(call: CallbackQuery) -> None:
         data["search"] = filters_false
         data["page"] = 1
         data["pages"] = total_pages
-        data["movie_info"] = movie_info
+        data["limit"] = limit
+        data["movie_info"] = session_movies(movie_info)
         send_movie_pagination(
             chat_id,
-            movies_data=movie_info,
+            movies_data=data["movie_info"],
             total_pages=total_pages,
         )
@@ -1,6 +1,5 @@
 from telebot.types import Message
 
-from config_data.config import IMAGE_MOVIE_SEARCH
 from loader import bot
 
 from services.services_api import run_search_query
@@ -9,13 +8,14 @@ from services.services_database import (
     update_database,
     update_database_query
 )
+from services.services_film_cache import session_movies
+from services.services_image_assets import send_menu_image
 from services.services_logging import error_logger_bot
-
-from logs.logging_config import log
+from services.services_messages import ENTER_MOVIE_NAME, MOVIE_SEARCH_CAPTION
+from services.services_prefetch import prefetcher
 
 from states.search_fields import SearchStates, PaginationStates
 
-from database.core import crud_images
 from database.common.models_movies import BaseMovie
 
 
@@ -28,7 +28,7 @@ def menu_movie_search(message: Message) -> None:
     Действия:
         - Выполняет сброс состояния и всех данных, связанных с текущей сессией пользователя.
         - Устанавливает состояние пользователя `SearchStates.movie_name`.
-        - Сохраняет изображение для команды `movie_search` в базе данных ImageFile для быстрого
+        - Сохраняет изображение для команды `movie_search` в реестре изображений меню для быстрого
         к нему доступа при повторном использовании.
         - Отправляет в чат сообщения с изображением и предложением ввода названия фильма
         в строку ввода.
@@ -41,38 +41,13 @@ def menu_movie_search(message: Message) -> None:
         FileNotFoundError: Если файл изображения не найден, отправляется сообщение с ошибкой.
     """
     user_id, chat_id = message.from_user.id, message.chat.id
+    prefetcher.drop(user_id, chat_id)
     bot.reset_data(user_id, chat_id)
     bot.set_state(user_id, SearchStates.movie_name, chat_id)
 
-    db_get_image = crud_images.get_image()
-    db_save = crud_images.save_image()
-
-    image_name = "movie_search"
-    file_id = db_get_image(chat_id, image_name)
-    caption = "🔍 <b>Поиск фильма <i>по названию</i>.</b>"
-    try:
-        if file_id:
-            bot.send_photo(
-                chat_id,
-                file_id,
-                caption=caption,
-                parse_mode="HTML",
-            )
-        else:
-            with open(IMAGE_MOVIE_SEARCH, "rb") as image:
-                sent_message = bot.send_photo(
-                    chat_id,
-                    image,
-                    caption=caption,
-                    parse_mode="HTML",
-                )
-                db_save(chat_id, image_name, sent_message.photo[-1].file_id)
-    except FileNotFoundError as exc:
-        log.error(f"Ошибка при обработке изображения: {type(exc)} - {exc}")
-        bot.send_message(chat_id, caption, parse_mode="HTML")
-
-    text = "✍️ Введите <b><i>название</i></b> фильма 🎬 в строку ввода."
-    bot.send_message(chat_id, text, parse_mode="HTML")
+    send_menu_image(chat_id, "movie_search", MOVIE_SEARCH_CAPTION)
+
+    bot.send_message(chat_id, ENTER_MOVIE_NAME, parse_mode="HTML")
 
 
 @bot.message_handler(
@@ -120,11 +95,10 @@ def search_movie_name(message: Message) -> None:
 
     if user_movies:
         movie_info = update_database(user_movies, type_search=type_search)
-        update_database_query(user_id, message.text)
-        total_pages = 2
+        total_pages, limit = 2, update_database_query(user_id, message.text)
         bot.delete_message(chat_id, message.message_id)
     else:
-        movie_info, total_pages = run_search_query(
+        movie_info, total_pages, limit = run_search_query(
             message,
             search_criteria=message.text,
             type_search=type_search,
@@ -135,9 +109,10 @@ def search_movie_name(message: Message) -> None:
 
     with bot.retrieve_data(message.from_user.id, message.chat.id) as data:
         data.clear()
-        data["movie_info"] = movie_info
+        data["movie_info"] = session_movies(movie_info)
         data["search"] = message.text
         data["page"] = 1
         data["pages"] = total_pages
+        data["limit"] = limit
 
         send_movie_pagination(chat_id, data["movie_info"], total_pages=total_pages)
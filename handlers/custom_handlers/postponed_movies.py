@@ -1,19 +1,18 @@
 from telebot.types import Message, CallbackQuery
 
-from config_data.config import IMAGE_POSTPONED_MOVIES
 from loader import bot
 
 from services.services_utils import set_ids
 from services.services_database import sending_to_pagination
+from services.services_film_cache import session_movies
 from services.services_pagination_handlers import send_movie_pagination
+from services.services_image_assets import send_menu_image
 from services.services_logging import error_logger_bot
+from services.services_prefetch import prefetcher
 from services.services_postponed_movies import data_postponed
 
-from logs.logging_config import log
-
 from states.search_fields import PostponedStates
 
-from database.core import crud_images
 from database.common.models_movies import MoviePostponed
 
 from keyboards.buttons.btns_for_postponed_movies import buttons_postponed
@@ -30,7 +29,7 @@ def menu_postponed_movies(message_or_call: Message | CallbackQuery) -> None:
     Действия:
         - Выполняет сброс состояния и всех данных, связанных с текущей сессией пользователя.
         - Устанавливает состояние пользователя `PostponedStates.postponed`.
-        - Сохраняет изображение для команды `postponed_movies` в базе данных ImageFile для быстрого
+        - Сохраняет изображение для команды `postponed_movies` в реестре изображений меню для быстрого
         к нему доступа при повторном использовании.
         - Проверяет наличие отложенных фильмов в базе данных MoviesPostponed.
         - Отправляет в чат сообщение с изображением и сообщение с инлайн-клавиатурой отложенных фильмов,
@@ -46,36 +45,12 @@ def menu_postponed_movies(message_or_call: Message | CallbackQuery) -> None:
     """
     chat_id, user_id, message_id = set_ids(message_or_call)
 
+    prefetcher.drop(user_id, chat_id)
     bot.reset_data(user_id, chat_id)
     bot.set_state(user_id, PostponedStates.postponed, chat_id)
 
     if isinstance(message_or_call, Message):
-        db_get_image = crud_images.get_image()
-        db_save = crud_images.save_image()
-
-        image_name = "postponed_movies"
-        file_id = db_get_image(chat_id, image_name)
-        caption = "📌 <b>Ваши избранные и просмотренные фильмы.</b>"
-        try:
-            if file_id:
-                bot.send_photo(
-                    chat_id,
-                    file_id,
-                    caption=caption,
-                    parse_mode="HTML",
-                )
-            else:
-                with open(IMAGE_POSTPONED_MOVIES, "rb") as image:
-                    sent_message = bot.send_photo(
-                        chat_id,
-                        image,
-                        caption=caption,
-                        parse_mode="HTML",
-                    )
-                    db_save(chat_id, image_name, sent_message.photo[-1].file_id)
-        except FileNotFoundError as exc:
-            log.error(f"Ошибка при обработке изображения: {type(exc)} - {exc}")
-            bot.send_message(chat_id, caption, parse_mode="HTML")
+        send_menu_image(chat_id, "postponed_movies", "📌 <b>Ваши избранные и просмотренные фильмы.</b>")
 
     user_movies = MoviePostponed.select().where(MoviePostponed.user_id == user_id)
     if not user_movies.exists():
@@ -142,8 +117,8 @@ def select_postponed(call: CallbackQuery) -> None:
     bot.set_state(user_id, states, chat_id)
 
     with bot.retrieve_data(user_id, chat_id) as data:
-        data["movie_info"] = sending_to_pagination(
-            user_movies, type_search="postponed_movies"
+        data["movie_info"] = session_movies(
+            sending_to_pagination(user_movies, type_search="postponed_movies")
         )
         data["button_postponed"] = status
     send_movie_pagination(chat_id, data["movie_info"], total_pages=1)
@@ -7,6 +7,7 @@ from services.services_logging import error_logger_bot
 
 from database.common.models_movies import BaseMovie
 from services.services_database import sending_to_pagination
+from services.services_film_cache import session_movies
 
 from services.services_pagination_handlers import (
     send_movie_pagination,
@@ -101,8 +102,8 @@ def pagination_select_history_query(call: CallbackQuery) -> None:
             (BaseMovie.user_id == user_id) & (BaseMovie.text_search == text_search)
         )
 
-        data["movie_info"] = sending_to_pagination(
-            count_request_movies, type_search="apply_filters"
+        data["movie_info"] = session_movies(
+            sending_to_pagination(count_request_movies, type_search="apply_filters")
         )
         bot.delete_message(chat_id, call.message.message_id)
         send_movie_pagination(chat_id, data["movie_info"], total_pages=1)
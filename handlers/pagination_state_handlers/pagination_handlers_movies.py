@@ -4,6 +4,7 @@ from loader import bot
 
 from logs.exceptions import BotStatePaginationNotFoundError
 from services.services_logging import error_logger_bot
+from services.services_messages import ALL_RESULTS_SHOWN, NEW_MOVIE_NAME, search_error_text
 
 from database.common.models_movies import MoviePostponed
 from services.services_database import (
@@ -11,6 +12,9 @@ from services.services_database import (
     search_for_movie,
     sending_to_pagination,
 )
+from services.services_film_cache import resolve_movies, session_movies
+from services.services_prefetch import prefetch_next_page, prefetcher
+from site_API.core import keep_ratio
 from site_API.site_api_handler import search_movies
 
 from keyboards.buttons.btns_for_movie_by_filters import btns_filters
@@ -19,8 +23,9 @@ from keyboards.inline.inline_keyboard import create_inline_keyboard
 from keyboards.inline.inline_movie_by_filters import select_filters_keyboard
 
 from services.services_pagination_handlers import (
-    send_movie_pagination,
-    send_description_pagination_page,
+    count_saved_calls,
+    edit_description_pagination_page,
+    edit_movie_pagination,
     get_check_status,
 )
 
@@ -39,8 +44,8 @@ def pagination_browsing_movie(call: CallbackQuery) -> None:
     Действия:
         - Если какое-либо состояние отсутствует, выводит сообщение пользователю о прекращении сессии отображения
         фильмов и предлагает осуществить поиск по названию фильмов либо вызвать команду `help`.
-        - Выводит заданный перечень фильмов в виде пагинации.
-        - Удаляет сообщение, вызвавшее запрос.
+        - Заменяет карточку фильма в сообщении, вызвавшем запрос, на карточку выбранного фильма. Если сообщение
+        не может быть отредактировано, выводит карточку новым сообщением и удаляет сообщение, вызвавшее запрос.
         - В случае отсутствия сохраненных данных по запросу фильмов в чат отправляется сообщение с предложением
         осуществить новый поиск фильмов по названию или вызвать команду `help`.
 
@@ -66,9 +71,13 @@ def pagination_browsing_movie(call: CallbackQuery) -> None:
         movie_info = data.setdefault("movie_info", None)
         total_pages = data.setdefault("pages", 1)
         page_number = data.setdefault("page", 1)
+        if movie_info:
+            edited = edit_movie_pagination(call.message, movie_info, page, total_pages, page_number)
+            count_saved_calls(data, edited, saved_calls=int(edited))
     if movie_info:
-        send_movie_pagination(chat_id, movie_info, page, total_pages, page_number)
-    bot.delete_message(chat_id, call.message.message_id)
+        prefetch_next_page(user_id, chat_id, data, page)
+    else:
+        bot.delete_message(chat_id, call.message.message_id)
 
 
 @bot.callback_query_handler(
@@ -83,8 +92,9 @@ def pagination_show_full_description_movie(call: CallbackQuery) -> None:
     Действия:
         - Если какое-либо состояние отсутствует, выводит сообщение пользователю о прекращении сессии отображения
         фильмов и предлагает осуществить поиск по названию фильмов либо вызвать команду `help`.
-        - Выводит описание полное фильма в интерфейсе пагинации.
-        - Удаляет сообщение, вызвавшее запрос.
+        - Заменяет подпись карточки фильма в сообщении, вызвавшем запрос, на полное описание фильма. Если описание
+        не помещается в подпись или сообщение не может быть отредактировано, выводит описание новым сообщением
+        и удаляет сообщение, вызвавшее запрос.
         - В случае отсутствия сохраненных данных по запросу фильмов в чат отправляется сообщение с предложением
         осуществить новый поиск фильмов по названию или вызвать команду `help`.
 
@@ -106,9 +116,11 @@ def pagination_show_full_description_movie(call: CallbackQuery) -> None:
     with bot.retrieve_data(user_id, chat_id) as data:
         movie_info = data.setdefault("movie_info", None)
         data["is_description"] = True
-    if movie_info:
-        send_description_pagination_page(chat_id, movie_info, page)
-    bot.delete_message(chat_id, call.message.message_id)
+        if movie_info:
+            edited = edit_description_pagination_page(call.message, movie_info, page)
+            count_saved_calls(data, edited, saved_calls=int(edited))
+    if not movie_info:
+        bot.delete_message(chat_id, call.message.message_id)
 
 
 @bot.callback_query_handler(
@@ -131,8 +143,9 @@ def pagination_change_status_movie(call: CallbackQuery) -> None:
         - Если вызов отображения фильмов происходил из команды `postponed_movies` (условие
         data_movie_info[page - 1][`type_search`] == `postponed_movies`), то при изменении статуса фильмов
         происходит обновление сохраненного словаря перечня фильмов с его выводом в пагинацию с их сортировкой
-        в обратном порядке по id добавления в базу. В этом случае предусмотрено уменьшение страниц в пагинации,
-        если они удалены из избранного или просмотренного. В случае полной очистки базы данных `postponed_movies`
+        в обратном порядке по id добавления в базу: карточка фильма в сообщении заменяется на месте вместо
+        обновления клавиатуры, отправки нового сообщения и удаления предыдущего. В этом случае предусмотрено
+        уменьшение страниц в пагинации, если они удалены из избранного или просмотренного. В случае полной очистки базы данных `postponed_movies`
         от избранных или просмотренных фильмов в чат выводится сообщение об отсутствии фильмов в базе данных
         с инлайн-клавиатурой возврата в меню команды `postponed_movies`.
         - В случае отсутствия сохраненных данных по запросу фильмов в чат отправляется сообщение с предложением
@@ -163,10 +176,12 @@ def pagination_change_status_movie(call: CallbackQuery) -> None:
         total_pages = data.setdefault("pages", 1)
         page_number = data.setdefault("page", 1)
 
-    if data["movie_info"]:
+        if not data["movie_info"]:
+            return
+
         movie_info = data["movie_info"][page - 1]
         movie_info[status] = not movie_info[status]
-        toggle_movie_field_response(user_id, movie_info, status)
+        toggle_movie_field_response(user_id, resolve_movies([movie_info])[0], status)
 
         state = (
             MoviePostponed.is_favorites
@@ -174,15 +189,16 @@ def pagination_change_status_movie(call: CallbackQuery) -> None:
             else MoviePostponed.is_viewed
         )
 
-        get_check_status(
-            call.message,
-            data["movie_info"],
-            page,
-            total_pages,
-            page_number,
-            show_pagination_descr=data["is_description"],
-        )
-        if movie_info["type_search"] == "postponed_movies":
+        if movie_info["type_search"] != "postponed_movies":
+            get_check_status(
+                call.message,
+                data["movie_info"],
+                page,
+                total_pages,
+                page_number,
+                show_pagination_descr=data["is_description"],
+            )
+        else:
             if status == data["button_postponed"]:
                 user_movies = (
                     MoviePostponed.select()
@@ -190,8 +206,8 @@ def pagination_change_status_movie(call: CallbackQuery) -> None:
                     .order_by(MoviePostponed.id.desc())
                 )
 
-                data["movie_info"] = sending_to_pagination(
-                    user_movies, type_search="postponed_movies"
+                data["movie_info"] = session_movies(
+                    sending_to_pagination(user_movies, type_search="postponed_movies")
                 )
                 if len(data["movie_info"]) > 0:
                     page = page - 1 if page > 1 else 0
@@ -203,8 +219,10 @@ def pagination_change_status_movie(call: CallbackQuery) -> None:
                     bot.send_message(chat_id, text, reply_markup=keyboard)
                     bot.delete_message(chat_id, call.message.message_id)
                     return
-            send_movie_pagination(chat_id, data["movie_info"], page, total_pages, page_number)
-            bot.delete_message(chat_id, call.message.message_id)
+            data["is_description"] = False
+            edited = edit_movie_pagination(call.message, data["movie_info"], page, total_pages, page_number)
+            # Без редактирования: обновление клавиатуры, отправка карточки и удаление сообщения
+            count_saved_calls(data, edited, saved_calls=2 if edited else 0)
 
 
 @bot.callback_query_handler(
@@ -221,8 +239,9 @@ def pagination_continue_search_movie(call: CallbackQuery):
         фильмов и предлагает осуществить поиск по названию фильмов либо вызвать команду `help`.
         - Обновление словаря отображения фильтров осуществляется с учетом заданного поискового запроса из меню
         команд `movie_search` или `movie_by_filters`.
-        - Выводит заданный перечень фильмов в виде пагинации.
-        - Удаляет сообщение, вызвавшее запрос.
+        - Заменяет карточку фильма в сообщении, вызвавшем запрос, на первый (или последний при возврате) фильм
+        новой страницы. Если сообщение не может быть отредактировано, выводит карточку новым сообщением и удаляет
+        сообщение, вызвавшее запрос.
 
     Args:
         call (CallbackQuery): Объект, содержащий информацию о нажатой кнопке.
@@ -250,28 +269,44 @@ def pagination_continue_search_movie(call: CallbackQuery):
             "movie_search" if isinstance(data["search"], str) else "movie_by_filters"
         )
 
-        movie_search_result, pages = search_movies(
-            data["search"], type_search, page=data["page"]
-        )
-
-        if movie_search_result:
-            data["movie_info"] = search_for_movie(
-                user_id, movie_search_result, type_search
+        limit = data.get("limit") or keep_ratio.base_limit
+        search_result = None
+        if call.data == "continue_search":
+            search_result = prefetcher.take(
+                user_id, chat_id, data["search"], type_search, data["page"], limit
+            )
+        if search_result is None:
+            search_result = search_movies(
+                data["search"], type_search, page=data["page"], limit=limit
+            )
+        if search_result is None or search_result.error:
+            data["page"] = (
+                data["page"] - 1 if call.data == "continue_search" else data["page"] + 1
+            )
+            error = search_result.error if search_result else "Не удалось выполнить поиск"
+            bot.send_message(chat_id, search_error_text(error), parse_mode="HTML")
+            return
+
+        pages = search_result.pages
+        if search_result.movies:
+            data["movie_info"] = session_movies(
+                search_for_movie(user_id, search_result.movies, type_search)
             )
             data["pages"] = pages - data["page"]
+            data["total_pages"] = pages
             page = len(data["movie_info"]) if call.data == "search_back" else 1
-            send_movie_pagination(
-                chat_id,
+            edited = edit_movie_pagination(
+                call.message,
                 data["movie_info"],
                 current_page=page,
                 total_pages=pages,
                 page_number=data["page"],
             )
-        else:
-            text = ("📕 Вам были показаны <b><i>все результаты</i></b> по заданному поисковому запросу.\n\n"
-                    "⬅️ <b><i>Вернитесь назад</i></b> или ✔️ задайте <b><i>новый поиск</i></b>.")
-            keyboard = create_inline_keyboard(buttons_end_search, buttons_per_row=1)
-            bot.send_message(chat_id, text, reply_markup=keyboard, parse_mode="HTML")
+            count_saved_calls(data, edited, saved_calls=int(edited))
+            prefetch_next_page(user_id, chat_id, data, page)
+            return
+        keyboard = create_inline_keyboard(buttons_end_search, buttons_per_row=1)
+        bot.send_message(chat_id, ALL_RESULTS_SHOWN, reply_markup=keyboard, parse_mode="HTML")
     bot.delete_message(chat_id, call.message.message_id)
 
 
@@ -302,6 +337,7 @@ def menu_get_new_search(call: CallbackQuery):
     if not current_state:
         raise BotStatePaginationNotFoundError
 
+    prefetcher.drop(user_id, chat_id)
     with bot.retrieve_data(user_id, chat_id) as data:
         data.setdefault("search", None)
         if data["search"] and isinstance(data["search"], dict):
@@ -326,7 +362,7 @@ def menu_get_new_search(call: CallbackQuery):
                 SearchStates.movie_name,
                 chat_id,
             )
-            text = "✍️ Введите <i>название</i> фильма 🎬 в строку ввода."
+            text = NEW_MOVIE_NAME
             keyboard = None
 
         bot.send_message(chat_id, text, reply_markup=keyboard, parse_mode="HTML")
@@ -1,7 +1,10 @@
-from telebot import TeleBot
-from telebot.storage import StateMemoryStorage
-from config_data.config import BOT_TOKEN
+from telebot import TeleBot, apihelper
+from config_data.config import BOT_TOKEN, TELEGRAM_API_URL
+from states.state_storage import create_state_storage
 
 
-storage = StateMemoryStorage()
-bot = TeleBot(token=BOT_TOKEN, state_storage=storage)
+if TELEGRAM_API_URL:
+    apihelper.API_URL = TELEGRAM_API_URL
+
+storage = create_state_storage()
+bot = TeleBot(token=BOT_TOKEN, state_storage=storage, use_class_middlewares=True)
@@ -1,4 +1,10 @@
-from logs.exceptions import BotStatePaginationNotFoundError, ServerRequestError
+from logs.exceptions import (
+    ApiQuotaExceededError,
+    ApiRateLimitError,
+    ApiUnavailableError,
+    BotStatePaginationNotFoundError,
+    ServerRequestError,
+)
 from typing import Dict, Type
 from telebot.apihelper import ApiTelegramException
 from peewee import IntegrityError
@@ -12,5 +18,8 @@ exception_type: Dict[Type[Exception], str] = {
     BotStatePaginationNotFoundError: "Ошибка сессии просмотра фильмов",
     ApiTelegramException: "Ошибка при попытке выполнить запрос",
     ServerRequestError: "Неверный запрос на сервер",
+    ApiQuotaExceededError: "Исчерпан суточный лимит запросов к API",
+    ApiRateLimitError: "Превышена частота запросов к API",
+    ApiUnavailableError: "API временно недоступен",
     IntegrityError: "Ошибка при работе с записью данных в базу данных"
 }
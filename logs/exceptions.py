@@ -11,3 +11,24 @@ class ServerRequestError(Exception):
         self.status_code = status_code
         self.message = message
         super().__init__(f"Ошибка сервера {status_code}: {message}")
+
+
+class ApiQuotaExceededError(ConnectionError):
+    """Исключение, вызываемое, если суточный лимит запросов к API исчерпан либо почти исчерпан."""
+    def __init__(self, message="Суточный лимит запросов к серверу исчерпан"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class ApiRateLimitError(ConnectionError):
+    """Исключение, вызываемое, если запрос к API не дождался своей очереди в ограничителе частоты запросов."""
+    def __init__(self, message="Сервер перегружен запросами"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class ApiUnavailableError(ConnectionError):
+    """Исключение, вызываемое без обращения к API, пока автоматический выключатель запросов разомкнут."""
+    def __init__(self, message="Сервер временно недоступен"):
+        self.message = message
+        super().__init__(self.message)
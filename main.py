@@ -1,17 +1,50 @@
+from urllib.parse import urlparse
+
 from loader import bot
 from telebot.apihelper import ApiTelegramException
+from config_data.config import (
+    BOT_WORKER_QUEUE_SIZE, BOT_WORKERS, WEBHOOK_ENQUEUE_TIMEOUT, WEBHOOK_HOST, WEBHOOK_PORT, WEBHOOK_QUEUE_SIZE,
+    WEBHOOK_SECRET, WEBHOOK_URL, WEBHOOK_WORKERS,
+)
 from logs.logging_config import log
 import handlers
-from telebot.custom_filters import StateFilter
+from utils.bot_setup import setup_bot
 from utils.set_bot_commands import set_default_commands
+from utils.supervisor import Supervisor
+from utils.telegram_scheduler import telegram_scheduler
+from utils.webhook import WebhookServer
 
 
 if __name__ == "__main__":
-    bot.add_custom_filter(StateFilter(bot))
     set_default_commands(bot)
 
     try:
-        bot.infinity_polling(skip_pending=True)
+        if WEBHOOK_URL:
+            setup_bot(bot)
+            server = WebhookServer(
+                bot,
+                path=urlparse(WEBHOOK_URL).path or "/",
+                host=WEBHOOK_HOST,
+                port=WEBHOOK_PORT,
+                secret_token=WEBHOOK_SECRET,
+                workers=WEBHOOK_WORKERS,
+                queue_size=WEBHOOK_QUEUE_SIZE,
+                enqueue_timeout=WEBHOOK_ENQUEUE_TIMEOUT,
+            )
+            bot.set_webhook(
+                url=WEBHOOK_URL,
+                secret_token=WEBHOOK_SECRET,
+                drop_pending_updates=True,
+            )
+            server.serve_forever()
+        else:
+            # Получение обновлений долгим опросом невозможно, пока у бота установлен вебхук
+            bot.remove_webhook()
+            if BOT_WORKERS > 1:
+                Supervisor(BOT_WORKERS, BOT_WORKER_QUEUE_SIZE).run(skip_pending=True)
+            else:
+                setup_bot(bot)
+                bot.infinity_polling(skip_pending=True)
     except ApiTelegramException as exc:
         if exc.result_json["error_code"] == 401:
             log.error("Неверно указан токен. Проверьте BOT_TOKEN.", exc_info=True)
@@ -19,3 +52,6 @@ if __name__ == "__main__":
             log.error(f"Ошибка при взаимодействии с Telegram API: {exc}", exc_info=True)
     except Exception as exc:
         log.error(f"Произошла непредвиденная ошибка {type(exc).__name__}: {exc}", exc_info=True)
+    finally:
+        # Фоновые запросы (удаление сообщений) выполняются до остановки бота
+        telegram_scheduler.flush(timeout=5)
@@ -1,8 +1,13 @@
 from . import services_api
 from . import services_database
+from . import services_film_cache
 from . import services_history
+from . import services_image_assets
 from . import services_logging
+from . import services_messages
 from . import services_movie_by_filters
 from . import services_pagination_handlers
+from . import services_poster_cache
 from . import services_postponed_movies
+from . import services_prefetch
 from . import services_utils
@@ -6,7 +6,9 @@ from keyboards.buttons.btns_for_movie_by_filters import btns_filters
 from keyboards.inline.inline_movie_by_filters import select_filters_keyboard
 
 from services.services_logging import error_logger_bot, set_ids
+from services.services_messages import NOT_FOUND_MOVIE_NAME, search_error_text
 from services.services_database import search_for_movie
+from services.services_prefetch import prefetcher
 
 from site_API.site_api_handler import search_movies
 
@@ -23,7 +25,7 @@ def run_search_query(
     type_search: str,
     text_search: str = "",
     page: int = 1,
-) -> Tuple[List[Dict[str, Any]] | None, int]:
+) -> Tuple[List[Dict[str, Any]] | None, int, int]:
     """
     Выполняет поиск фильмов в зависимости от типа поиска и переданного запроса на поиск в виде названия фильма
     или словаря фильтров.
@@ -38,12 +40,14 @@ def run_search_query(
 
 
     Returns:
-        Tuple[List[Dict[str, Any]] | None, int]:
+        Tuple[List[Dict[str, Any]] | None, int, int]:
             - movie_info (List[Dict[str, Any]] | None): Список фильмов с их информацией.
             - pages (int): Общее количество страниц результатов поиска.
+            - limit (int): Размер страницы запроса, с которым запрашиваются следующие страницы этого поиска.
 
         В случае ошибки или отсутствия результатов:
-            - Отправляется сообщение пользователю, возвращается None и нулевой номер страницы.
+            - Отправляется сообщение пользователю, возвращается None, нулевой номер страницы и нулевой размер
+            страницы.
 
     Raises:
         ValueError: Если `type_search` имеет недопустимое значение или `page` не является положительным целым числом.
@@ -66,55 +70,49 @@ def run_search_query(
 
     chat_id, user_id, message_id = set_ids(message_or_call)
 
-    movies_data = search_movies(search_criteria, type_search, page)
+    prefetcher.drop(user_id, chat_id)
+    search_result = search_movies(search_criteria, type_search, page)
 
     bot.delete_message(chat_id, message_id)
-    if isinstance(movies_data, tuple):
-        movie_search_result, pages = search_movies(search_criteria, type_search, page)
-        if isinstance(movie_search_result, list):
-            if movie_search_result:
-                movie_info = search_for_movie(
-                    user_id=user_id,
-                    result_response=movie_search_result,
-                    type_search=type_search,
-                    text_search=text_search,
-                )
-                return movie_info, pages
-            else:
-                bot.reset_data(user_id, chat_id)
-                if type_search == "movie_by_filters":
-                    text_addition = (
-                        "✔️ Задайте новые <b><i>фильтры</i></b> с помощью кнопок ниже "
-                        "либо сразу перейдите к 🔍 <b><i>поиску</i></b>."
-                    )
-                    keyboard = select_filters_keyboard(btns_filters, buttons_per_row=2)
-                    state = SearchStates.query
-                else:
-                    text_addition = (
-                        "✍️ Введите в строку ввода другое <b><i>название</i></b> фильма."
-                    )
-                    keyboard = None
-                    state = SearchStates.movie_name
-
-                text = (
-                    f"❌ По вашему запросу <b>ничего не найдено</b>.\n\n{text_addition}"
-                )
-                bot.send_message(
-                    chat_id, text, reply_markup=keyboard, parse_mode="HTML"
-                )
-                bot.set_state(user_id, state, chat_id)
-
-                log.info(
-                    "Поисковой запрос не выдал результатов. Пользователю предложено создать новый запрос."
-                )
-            return None, 0
-    else:
-        text = (
-            f"🚫 <b>{movies_data}</b>\n\n" "⌛ <i>Попробуйте выполнить поиск позже.</i>"
-        )
-        bot.send_message(chat_id, text, parse_mode="HTML")
+    if search_result is None or search_result.error:
+        error = search_result.error if search_result else "Не удалось выполнить поиск"
+        bot.send_message(chat_id, search_error_text(error), parse_mode="HTML")
         bot.set_state(user_id, SearchStates.movie_name, chat_id)
         log.info(
             "При поисковом запросе возникла ошибка. Пользователю предложено создать новый запрос позже."
         )
-        return None, 0
+        return None, 0, 0
+
+    if search_result.movies:
+        movie_info = search_for_movie(
+            user_id=user_id,
+            result_response=search_result.movies,
+            type_search=type_search,
+            text_search=text_search,
+            page_limit=search_result.limit,
+        )
+        return movie_info, search_result.pages, search_result.limit
+
+    bot.reset_data(user_id, chat_id)
+    if type_search == "movie_by_filters":
+        text_addition = (
+            "✔️ Задайте новые <b><i>фильтры</i></b> с помощью кнопок ниже "
+            "либо сразу перейдите к 🔍 <b><i>поиску</i></b>."
+        )
+        text = f"❌ По вашему запросу <b>ничего не найдено</b>.\n\n{text_addition}"
+        keyboard = select_filters_keyboard(btns_filters, buttons_per_row=2)
+        state = SearchStates.query
+    else:
+        text = NOT_FOUND_MOVIE_NAME
+        keyboard = None
+        state = SearchStates.movie_name
+
+    bot.send_message(
+        chat_id, text, reply_markup=keyboard, parse_mode="HTML"
+    )
+    bot.set_state(user_id, state, chat_id)
+
+    log.info(
+        "Поисковой запрос не выдал результатов. Пользователю предложено создать новый запрос."
+    )
+    return None, 0, 0
@@ -1,19 +1,21 @@
+from datetime import datetime
 from typing import Any, List, Dict
 
-from peewee import Query
+from peewee import JOIN, Query
 
-from database.common.models_movies import db, QueryString, BaseMovie, MoviePostponed
+from database.common.models_movies import db, QueryString, BaseMovie, Film, MoviePostponed
 from database.core import crud
 from services.services_logging import error_logger_func
 
 db_write = crud.create()
+db_upsert = crud.upsert()
 db_read = crud.retrieve()
 
 
 @error_logger_func
 def write_to_query_string(
-    user_id: int, type_search: str, text_search: str
-) -> Dict[str, str]:
+    user_id: int, type_search: str, text_search: str, page_limit: int | None = None
+) -> Dict[str, str | int | None]:
     """
     Формирует словарь для сохранения строки поискового запроса в базе данных QueryString.
 
@@ -21,10 +23,11 @@ def write_to_query_string(
         user_id (int): Идентификатор пользователя, который инициировал запрос.
         type_search (str): Тип поискового запроса (например, "movies_search" или "movies_by_filters").
         text_search (str): Текст поискового запроса.
+        page_limit (int | None): Размер страницы запроса к API, с которым получена первая страница результатов.
 
     Returns:
-         Dict[str, str]: Словарь, содержащий данные для записи в таблицу "query_string".
-            Ключи: "user_id", "type_search", "text_search".
+         Dict[str, str | int | None]: Словарь, содержащий данные для записи в таблицу "query_string".
+            Ключи: "user_id", "type_search", "text_search", "page_limit".
 
     Raises:
         ValueError: Если передан пустой или некорректный `text_search` или `type_search`.
@@ -38,6 +41,7 @@ def write_to_query_string(
         "user_id": str(user_id),
         "type_search": type_search,
         "text_search": text_search,
+        "page_limit": page_limit,
     }
 
 
@@ -51,7 +55,8 @@ def write_to_base_movies(
     status_viewed: bool,
 ) -> Dict[str, str]:
     """
-    Формирует словарь для сохранения информации о фильме в базе данных BaseMovie.
+    Формирует словарь для сохранения ссылки на фильм в базе данных BaseMovie. Данные фильма сохраняются
+    в каталоге Film (см. `write_to_film`).
 
     Args:
         user_id (int): Идентификатор пользователя, который инициировал запрос.
@@ -64,11 +69,7 @@ def write_to_base_movies(
 
     Returns:
         Dict[str, str]: Словарь, содержащий данные для записи в таблицу "base_movies".
-            Ключи: "user_id", "movie_id", "type_search", "text_search", "name_movie",
-                   "alternative_name", "type_movie", "year", "countries", "short_description",
-                   "description", "genre", "rating", "age_rating", "poster", "is_series",
-                   "is_viewed", "is_favorites".
-            Значения: соответствующие значения для каждого ключа, могут быть `None`, если данные отсутствуют.
+            Ключи: "user_id", "movie_id", "type_search", "text_search", "is_viewed", "is_favorites".
 
     Raises:
         ValueError: Если передан пустой или некорректный `text_search` или `type_search`.
@@ -85,42 +86,67 @@ def write_to_base_movies(
         "movie_id": movie.get("id"),
         "type_search": type_search,
         "text_search": text_search,
-        "name_movie": movie.get("name"),
-        "alternative_name": movie.get("alternativeName"),
-        "type_movie": movie.get("type"),
-        "year": movie.get("year"),
-        "countries": ", ".join(
-            [country.get("name") for country in movie.get("countries", [])]
-        ),
-        "short_description": movie.get("shortDescription"),
-        "description": movie.get("description"),
-        "genre": ", ".join([genre.get("name") for genre in movie.get("genres", [])]),
-        "rating": movie.get("rating", {}).get("kp"),
-        "age_rating": movie.get("ageRating"),
-        "poster": movie.get("poster", {}).get("url"),
-        "is_series": movie.get("isSeries", False),
         "is_viewed": status_viewed,
         "is_favorites": status_favorites,
     }
 
 
+@error_logger_func
+def write_to_film(movie: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Формирует словарь для сохранения данных фильма в каталоге Film на основе словаря, сформированного
+    для просмотра фильмов в виде пагинации.
+
+    Args:
+        movie (Dict[str, Any]): Информация о фильме в виде словаря, сформированного для просмотра фильмов
+            в виде пагинации.
+
+    Returns:
+        Dict[str, Any]: Словарь, содержащий данные для записи в таблицу "films".
+            Ключи: "movie_id", "name_movie", "alternative_name", "type_movie", "year", "countries",
+                   "short_description", "description", "genre", "rating", "age_rating", "poster", "is_series",
+                   "updated_at".
+
+    Raises:
+        ValueError: Если передан некорректный словарь `movie`.
+    """
+    if not isinstance(movie, dict) or not movie.get("movie_id"):
+        raise ValueError("Некорректный словарь фильма.")
+
+    return {
+        "movie_id": movie["movie_id"],
+        "name_movie": movie.get("name_movie"),
+        "alternative_name": movie.get("alternative_name"),
+        "type_movie": movie.get("type_movie"),
+        "year": movie.get("year"),
+        "countries": movie.get("countries"),
+        "short_description": movie.get("short_description"),
+        "description": movie.get("description"),
+        "genre": movie.get("genre"),
+        "rating": movie.get("rating"),
+        "age_rating": movie.get("age_rating"),
+        "poster": movie.get("poster"),
+        "is_series": movie.get("is_series"),
+        "updated_at": datetime.now(),
+    }
+
+
 @error_logger_func
 def write_to_move_postponed(
     user_id: int, movie: Dict[str, str | None]
 ) -> Dict[str, Dict[str, str] | None]:
     """
-    Формирует словарь для сохранения информации о фильме в базе данных MoviePostponed на основе текущего словаря movie.
+    Формирует словарь для сохранения ссылки на фильм в базе данных MoviePostponed на основе текущего словаря movie.
+    Данные фильма сохраняются в каталоге Film (см. `write_to_film`).
 
     Args:
         user_id (int): Идентификатор пользователя, который инициировал запрос.
         movie (Dict[str, str | None]): Информация о фильме в виде словаря, сформированного
-            для просмотра фильмов в виде пагинации. Ожидается, что словарь содержит ключи,
-            соответствующие полям модели MoviePostponed.
+            для просмотра фильмов в виде пагинации.
 
     Returns:
         Dict[str, Dict[str, str] | None]: Словарь, содержащий данные для записи в таблицу "movie_postponed".
-            - Ключи: включают информацию о фильме, такие как `movie_id`, `name_movie`, и другие.
-            - Значения: соответствующие значения для каждого ключа, могут быть `None`, если данные отсутствуют.
+            Ключи: "user_id", "movie_id", "is_viewed", "is_favorites".
 
     Raises:
         ValueError: Если передан некорректный словарь `movie`.
@@ -128,11 +154,12 @@ def write_to_move_postponed(
     if not isinstance(movie, dict):
         raise ValueError("Некорректный словарь фильма.")
 
-    new_movie = movie.copy()
-    new_movie["user_id"] = str(user_id)
-    new_movie.pop("type_search", None)
-    new_movie.pop("text_search", None)
-    return new_movie
+    return {
+        "user_id": str(user_id),
+        "movie_id": movie.get("movie_id"),
+        "is_viewed": movie.get("is_viewed", False),
+        "is_favorites": movie.get("is_favorites", False),
+    }
 
 
 @error_logger_func
@@ -141,6 +168,7 @@ def sending_to_pagination(
 ) -> List[Dict[str, str | None]]:
     """
     Формирует список словарей для отправки данных о фильмах, соответствующих запросу пользователя, в виде пагинации.
+    Данные фильмов присоединяются из каталога Film в том же запросе (LEFT JOIN).
 
     Args:
         user_movies (Query): Список объектов фильма, выбранных из базы данных
@@ -178,34 +206,42 @@ def sending_to_pagination(
     if not type_search or not isinstance(type_search, str):
         raise ValueError("`type_search` должен быть непустой строкой.")
 
+    model = user_movies.model
+    user_movies = user_movies.select_extend(Film).join(
+        Film, JOIN.LEFT_OUTER, on=(model.movie_id == Film.movie_id), attr="film"
+    )
+
     try:
-        return [
-            {
-                "user_id": movie.user_id,
-                "movie_id": movie.movie_id,
-                "name_movie": movie.name_movie,
-                "alternative_name": movie.alternative_name,
-                "type_movie": movie.type_movie,
-                "year": movie.year,
-                "countries": movie.countries,
-                "short_description": movie.short_description,
-                "description": movie.description,
-                "genre": movie.genre,
-                "rating": movie.rating,
-                "age_rating": movie.age_rating,
-                "poster": movie.poster,
-                "is_series": movie.is_series,
-                "is_viewed": movie.is_viewed,
-                "is_favorites": movie.is_favorites,
-                "type_search": type_search,
-                "text_search": (
-                    movie.text_search
-                    if type_search in ["movie_search", "movie_by_filters"]
-                    else ""
-                ),
-            }
-            for movie in user_movies
-        ]
+        movies_data = []
+        for movie in user_movies:
+            film = getattr(movie, "film", None) or Film(movie_id=movie.movie_id)
+            movies_data.append(
+                {
+                    "user_id": movie.user_id,
+                    "movie_id": movie.movie_id,
+                    "name_movie": film.name_movie,
+                    "alternative_name": film.alternative_name,
+                    "type_movie": film.type_movie,
+                    "year": film.year,
+                    "countries": film.countries,
+                    "short_description": film.short_description,
+                    "description": film.description,
+                    "genre": film.genre,
+                    "rating": film.rating,
+                    "age_rating": film.age_rating,
+                    "poster": film.poster,
+                    "is_series": film.is_series,
+                    "is_viewed": movie.is_viewed,
+                    "is_favorites": movie.is_favorites,
+                    "type_search": type_search,
+                    "text_search": (
+                        movie.text_search
+                        if type_search in ["movie_search", "movie_by_filters"]
+                        else ""
+                    ),
+                }
+            )
+        return movies_data
     except AttributeError as exc:
         raise AttributeError(f"Ошибка доступа к полям фильма: {exc}")
 
@@ -216,8 +252,8 @@ def update_database(
 ) -> List[Dict[str, str | None]]:
     """
     Формирует список словарей для отправки данных о фильмах, соответствующих запросу пользователя, в виде пагинации.
-    Создает записи в базе данных BaseMovie по данному поисковому запросу. Если в базе уже существуют записи
-    по аналогичному поисковому запросу, то перезаписывает их с обновлением id и датой поискового запроса.
+    Обновляет дату поискового запроса у записей BaseMovie по данному поисковому запросу одним запросом UPDATE
+    в одной транзакции с чтением записей.
 
     Args:
         user_movies (Query): Список объектов фильма, выбранных из базы данных
@@ -236,13 +272,11 @@ def update_database(
     if not type_search or not isinstance(type_search, str):
         raise ValueError("`type_search` должен быть непустой строкой.")
 
-    movies_data = sending_to_pagination(user_movies, type_search)
-
-    for movie in user_movies:
-        movie.delete_instance()
-
-    for movie_data in movies_data:
-        BaseMovie.create(**movie_data)
+    with db.atomic():
+        movies_data = sending_to_pagination(user_movies, type_search)
+        BaseMovie.update(date_search=datetime.now()).where(
+            BaseMovie.id.in_(user_movies.columns(BaseMovie.id))
+        ).execute()
 
     return movies_data
 
@@ -250,17 +284,21 @@ def update_database(
 @error_logger_func
 def update_database_query(
     user_id: int, text_search: str, type_search: str = "movie_search"
-) -> None:
+) -> int | None:
     """
     В базе данных QueryString создает новые записи поискового запроса. Если в базе данных уже существует запись
     по аналогичному поисковому запросу, то перезаписывает эту запись с ее удалением для обновления id
-    и даты поискового запроса.
+    и даты поискового запроса, сохраняя размер страницы запроса к API.
 
     Args:
         user_id (int): Идентификатор пользователя.
         text_search (str): Текст поискового запроса.
         type_search (str): Тип поискового запроса. По умолчанию "movie_search".
 
+    Returns:
+        int | None: Размер страницы запроса к API, с которым получена первая страница сохраненного поиска,
+            либо None, если он не сохранен.
+
     Raises:
         ValueError: Если передан пустой или некорректный `text_search` или `type_search`.
     """
@@ -269,6 +307,11 @@ def update_database_query(
     if not type_search or not isinstance(type_search, str):
         raise ValueError("`type_search` должен быть непустой строкой.")
 
+    query = QueryString.select(QueryString.page_limit).where(
+        (QueryString.user_id == user_id) & (QueryString.text_search == text_search)
+    ).order_by(QueryString.id.desc()).first()
+    page_limit = query.page_limit if query else None
+
     QueryString.delete().where(
         (QueryString.user_id == user_id) & (QueryString.text_search == text_search)
     ).execute()
@@ -277,7 +320,9 @@ def update_database_query(
         user_id=user_id,
         text_search=text_search,
         type_search=type_search,
+        page_limit=page_limit,
     )
+    return page_limit
 
 
 @error_logger_func
@@ -321,7 +366,8 @@ def toggle_movie_field_response(
     """
     Обновляет указанный статус фильма (`is_favorites` или `is_viewed`) в базах данных BaseMovie и MoviePostponed.
 
-    Если статус установлен в True, а фильм отсутствует в MoviePostponed, он добавляется в эту базу данных.
+    Если статус установлен в True, а фильм отсутствует в MoviePostponed, он добавляется в эту базу данных,
+    а данные фильма добавляются в каталог Film, если их там еще нет.
     Если после обновления оба статуса (`is_favorites` и `is_viewed`) равны False, фильм удаляется
     из базы данных MoviePostponed.
 
@@ -356,7 +402,9 @@ def toggle_movie_field_response(
     if not user_movies_postponed:
         if movie[status]:
             create_write_mp = write_to_move_postponed(user_id, movie)
-            db_write(db, MoviePostponed, [create_write_mp])
+            with db.atomic():
+                Film.insert(write_to_film(movie)).on_conflict_ignore().execute()
+                db_write(db, MoviePostponed, [create_write_mp])
 
     else:
         # Обновление статуса в MoviePostponed
@@ -389,16 +437,22 @@ def search_for_movie(
     result_response: List[Dict[str, str | None]],
     type_search: str,
     text_search: str = "",
+    page_limit: int | None = None,
 ) -> List[Dict[str, str | None]]:
     """
     Выполняет поиск фильмов, сохраняет поисковый запрос и информацию о фильмах в базы данных, и возвращает список
-    данных для пагинации.
+    данных для пагинации. Статусы избранного и просмотренного для всех фильмов страницы извлекаются одним
+    запросом, а данные фильмов в каталоге Film, поисковый запрос и ссылки на фильмы в BaseMovie сохраняются
+    одной транзакцией. Данные фильмов сохраняются в каталоге Film и без текста поискового запроса, чтобы
+    фильмы из сессий пользователей можно было восстановить из базы данных.
 
     Args:
         user_id (int): Идентификатор пользователя, инициировавшего запрос.
         result_response (List[Dict[str, str | None]]): Список словарей с данными о фильмах, полученными от API.
         type_search (str): Тип поиска, например, "movie_search" или "movies_by_filters".
         text_search (str, optional): Текст поискового запроса. По умолчанию пустая строка.
+        page_limit (int | None): Размер страницы запроса к API, с которым получена первая страница результатов.
+            Сохраняется вместе с поисковым запросом для запроса следующих страниц.
 
     Returns:
         List[Dict[str, str | None]]: Список словарей, содержащих данные о фильмах для отправки в пагинацию.
@@ -411,39 +465,51 @@ def search_for_movie(
     if not isinstance(text_search, str):
         raise ValueError("`text_search` должен быть строкой.")
 
-    if text_search:
-        create_write_qs = write_to_query_string(user_id, type_search, text_search)
-        db_write(db, QueryString, [create_write_qs])
-    movie_info = []
-
-    for movie in result_response:
-        film_check = (
-            MoviePostponed.select()
-            .where(
-                (MoviePostponed.user_id == user_id)
-                & (MoviePostponed.movie_id == movie["id"])
-            )
-            .first()
+    movie_ids = [movie["id"] for movie in result_response]
+    statuses = {}
+    for film_check in (
+        MoviePostponed.select(
+            MoviePostponed.movie_id, MoviePostponed.is_favorites, MoviePostponed.is_viewed
         )
-
-        st_favorites = film_check.is_favorites if film_check else False
-        st_viewed = film_check.is_viewed if film_check else False
-        send_data = sending_to_pagination_res(
-            movie, st_favorites, st_viewed, type_search
+        .where(
+            (MoviePostponed.user_id == user_id)
+            & (MoviePostponed.movie_id.in_(movie_ids))
+        )
+        .order_by(MoviePostponed.id)
+    ):
+        statuses.setdefault(
+            film_check.movie_id, (film_check.is_favorites, film_check.is_viewed)
         )
 
+    movie_info = []
+    films = []
+    base_movies = []
+    for movie in result_response:
+        st_favorites, st_viewed = statuses.get(str(movie["id"]), (False, False))
+        movie_info.append(
+            sending_to_pagination_res(movie, st_favorites, st_viewed, type_search)
+        )
+        films.append(write_to_film(movie_info[-1]))
         if text_search:
-            create_write_bm = write_to_base_movies(
-                user_id,
-                movie,
-                type_search,
-                text_search,
-                st_favorites,
-                st_viewed,
+            base_movies.append(
+                write_to_base_movies(
+                    user_id,
+                    movie,
+                    type_search,
+                    text_search,
+                    st_favorites,
+                    st_viewed,
+                )
             )
-            db_write(db, BaseMovie, [create_write_bm])
 
-        movie_info.append(send_data)
+    with db.atomic():
+        if films:
+            db_upsert(db, Film, films)
+        if text_search:
+            create_write_qs = write_to_query_string(user_id, type_search, text_search, page_limit)
+            db_write(db, QueryString, [create_write_qs])
+            if base_movies:
+                db_write(db, BaseMovie, base_movies)
     return movie_info
 
 
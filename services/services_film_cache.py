@@ -0,0 +1,129 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Iterable, List
+
+from config_data.config import FILM_CACHE_SIZE
+from database.common.models_movies import Film
+
+# Данные фильма, общие для всех пользователей: хранятся в кэше фильмов и в каталоге Film
+FILM_FIELDS = (
+    "name_movie", "alternative_name", "type_movie", "year", "countries", "genre", "rating", "age_rating",
+    "short_description", "description", "poster", "is_series",
+)
+# Данные фильма, хранимые в сессии пользователя: ссылка на фильм и статусы пользователя
+SESSION_FIELDS = ("movie_id", "is_favorites", "is_viewed", "type_search")
+
+
+class FilmCache:
+    """
+    Общий для всех сессий кэш данных фильмов с вытеснением по LRU при превышении размера. Сессии пользователей
+    хранят только ссылки на фильмы, а данные фильма хранятся в кэше в единственном экземпляре. При промахе
+    данные фильмов загружаются из каталога Film одним запросом.
+
+    Attributes:
+        max_entries (int): Максимальное количество фильмов в кэше.
+        hits (int): Количество фильмов, найденных в кэше.
+        misses (int): Количество фильмов, загруженных из базы данных.
+    """
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._films: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._lock = Lock()
+
+    def _put(self, movie_id: str, film: Dict[str, Any]) -> None:
+        self._films[movie_id] = film
+        self._films.move_to_end(movie_id)
+        while len(self._films) > self.max_entries:
+            self._films.popitem(last=False)
+
+    def put_many(self, movies: Iterable[Dict[str, Any]]) -> None:
+        """
+        Сохраняет в кэше данные фильмов, сформированных для просмотра фильмов в виде пагинации.
+
+        Args:
+            movies (Iterable[Dict[str, Any]]): Словари фильмов с ключом "movie_id" и данными фильма.
+        """
+        with self._lock:
+            for movie in movies:
+                self._put(str(movie["movie_id"]), {field: movie.get(field) for field in FILM_FIELDS})
+
+    def get_many(self, movie_ids: Iterable[Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Возвращает данные фильмов по их идентификаторам. Отсутствующие в кэше фильмы загружаются из каталога Film.
+
+        Args:
+            movie_ids (Iterable[Any]): Идентификаторы фильмов.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Данные фильмов по строковым идентификаторам. Фильмы, отсутствующие
+                и в кэше, и в каталоге Film, не возвращаются.
+        """
+        films, missing = {}, set()
+        with self._lock:
+            for movie_id in map(str, movie_ids):
+                film = self._films.get(movie_id)
+                if film is None:
+                    missing.add(movie_id)
+                else:
+                    self._films.move_to_end(movie_id)
+                    films[movie_id] = film
+            self.hits += len(films)
+            self.misses += len(missing)
+        if not missing:
+            return films
+
+        loaded = {
+            film.movie_id: {field: getattr(film, field) for field in FILM_FIELDS}
+            for film in Film.select().where(Film.movie_id.in_(missing))
+        }
+        with self._lock:
+            for movie_id, film in loaded.items():
+                self._put(movie_id, film)
+        films.update(loaded)
+        return films
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Возвращает статистику использования кэша.
+
+        Returns:
+            Dict[str, int]: Количество попаданий, промахов и текущий размер кэша.
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._films)}
+
+
+film_cache = FilmCache(max_entries=FILM_CACHE_SIZE)
+
+
+def session_movies(movies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Сохраняет данные фильмов в общем кэше фильмов и формирует список фильмов для сессии пользователя:
+    идентификаторы фильмов со статусами пользователя.
+
+    Args:
+        movies (List[Dict[str, Any]]): Список словарей фильмов, сформированных для просмотра фильмов в виде пагинации.
+
+    Returns:
+        List[Dict[str, Any]]: Список словарей с ключами "movie_id", "is_favorites", "is_viewed", "type_search".
+    """
+    film_cache.put_many(movies)
+    return [{field: movie.get(field) for field in SESSION_FIELDS} for movie in movies]
+
+
+def resolve_movies(movies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Дополняет фильмы из сессии пользователя данными фильмов из общего кэша фильмов.
+
+    Args:
+        movies (List[Dict[str, Any]]): Список фильмов из сессии пользователя (см. `session_movies`).
+
+    Returns:
+        List[Dict[str, Any]]: Список словарей фильмов для просмотра фильмов в виде пагинации. Данные фильма,
+            отсутствующего в кэше и в каталоге Film, равны None.
+    """
+    films = film_cache.get_many(movie["movie_id"] for movie in movies)
+    empty = dict.fromkeys(FILM_FIELDS)
+    return [{**films.get(str(movie["movie_id"]), empty), **movie} for movie in movies]
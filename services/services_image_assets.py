@@ -0,0 +1,230 @@
+from contextlib import nullcontext
+from threading import Lock
+from typing import ContextManager, Dict
+
+from telebot.apihelper import ApiTelegramException
+from telebot.types import InlineKeyboardMarkup, Message
+
+from config_data.config import (
+    IMAGE_CACHE_PER_CHAT,
+    IMAGE_HELP,
+    IMAGE_HISTORY,
+    IMAGE_MOVIE_BY_FILTERS,
+    IMAGE_MOVIE_SEARCH,
+    IMAGE_POSTPONED_MOVIES,
+    IMAGE_START,
+)
+from database.core import crud_images
+from loader import bot
+from logs.logging_config import log
+
+
+db_get_image = crud_images.get_image()
+db_save_image = crud_images.save_image()
+db_delete_image = crud_images.delete_image()
+
+# Изображения меню команд: название изображения в базе данных ImageFile и путь к файлу
+MENU_IMAGES = {
+    "start": IMAGE_START,
+    "help": IMAGE_HELP,
+    "history": IMAGE_HISTORY,
+    "movie_search": IMAGE_MOVIE_SEARCH,
+    "movie_by_filters": IMAGE_MOVIE_BY_FILTERS,
+    "postponed_movies": IMAGE_POSTPONED_MOVIES,
+}
+# Значение chat_id в базе данных ImageFile для идентификаторов файлов, общих для всех чатов
+GLOBAL_CHAT_ID = "*"
+
+
+class ImageAssets:
+    """
+    Реестр идентификаторов файлов изображений меню в Telegram. Идентификатор файла действителен в любом чате,
+    поэтому по умолчанию каждое изображение загружается один раз при первой отправке, а его идентификатор
+    сохраняется в базе данных ImageFile и в памяти процесса и используется во всех чатах. При
+    `IMAGE_CACHE_PER_CHAT=true` идентификаторы хранятся отдельно для каждого чата.
+
+    Attributes:
+        per_chat (bool): Хранить идентификаторы файлов отдельно для каждого чата.
+        hits (int): Количество изображений, отправленных по сохраненному идентификатору файла.
+        uploads (int): Количество загрузок изображений из файла.
+        stale (int): Количество идентификаторов, отклоненных Telegram и удаленных из реестра.
+    """
+    def __init__(self, per_chat: bool = False) -> None:
+        self.per_chat = per_chat
+        self.hits = 0
+        self.uploads = 0
+        self.stale = 0
+        self._file_ids: Dict[str, str] = {}
+        self._upload_locks: Dict[str, Lock] = {}
+        self._lock = Lock()
+
+    def _chat_key(self, chat_id: int) -> str:
+        return str(chat_id) if self.per_chat else GLOBAL_CHAT_ID
+
+    def get(self, chat_id: int, image_name: str) -> str | None:
+        """
+        Возвращает идентификатор файла изображения: из памяти процесса, а при его отсутствии - из базы данных.
+
+        Args:
+            chat_id (int): Идентификатор чата.
+            image_name (str): Название изображения.
+
+        Returns:
+            str | None: Идентификатор файла в Telegram либо None, если изображение еще не загружалось.
+        """
+        if not self.per_chat:
+            with self._lock:
+                file_id = self._file_ids.get(image_name)
+            if file_id is not None:
+                return file_id
+        file_id = db_get_image(self._chat_key(chat_id), image_name)
+        if file_id is not None and not self.per_chat:
+            with self._lock:
+                self._file_ids[image_name] = file_id
+        return file_id
+
+    def upload_lock(self, image_name: str) -> ContextManager:
+        """
+        Возвращает блокировку загрузки изображения: при одновременных первых отправках изображения в разные чаты
+        изображение загружается один раз, а остальные отправки ожидают сохранения его идентификатора файла.
+        При хранении идентификаторов для каждого чата загрузки не блокируются.
+
+        Args:
+            image_name (str): Название изображения.
+
+        Returns:
+            ContextManager: Блокировка загрузки изображения.
+        """
+        if self.per_chat:
+            return nullcontext()
+        with self._lock:
+            return self._upload_locks.setdefault(image_name, Lock())
+
+    def remember(self, chat_id: int, image_name: str, file_id: str) -> None:
+        """
+        Сохраняет идентификатор файла, который Telegram вернул после загрузки изображения.
+
+        Args:
+            chat_id (int): Идентификатор чата.
+            image_name (str): Название изображения.
+            file_id (str): Идентификатор файла в Telegram.
+        """
+        db_save_image(self._chat_key(chat_id), image_name, file_id)
+        if not self.per_chat:
+            with self._lock:
+                self._file_ids[image_name] = file_id
+
+    def invalidate(self, chat_id: int, image_name: str, file_id: str) -> None:
+        """
+        Удаляет идентификатор файла, который Telegram отклонил, если он не был заменен новым.
+
+        Args:
+            chat_id (int): Идентификатор чата.
+            image_name (str): Название изображения.
+            file_id (str): Отклоненный идентификатор файла.
+        """
+        db_delete_image(self._chat_key(chat_id), image_name, file_id)
+        with self._lock:
+            self.stale += 1
+            if self._file_ids.get(image_name) == file_id:
+                del self._file_ids[image_name]
+
+    def count(self, uploaded: bool) -> None:
+        """
+        Учитывает отправку изображения.
+
+        Args:
+            uploaded (bool): True, если изображение загружено из файла, False - если отправлено по идентификатору.
+        """
+        with self._lock:
+            if uploaded:
+                self.uploads += 1
+            else:
+                self.hits += 1
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Возвращает статистику отправки изображений.
+
+        Returns:
+            Dict[str, float]: Количество отправок по идентификатору файла, загрузок из файла, отклоненных
+                идентификаторов и доля отправок без загрузки.
+        """
+        with self._lock:
+            sent = self.hits + self.uploads
+            return {
+                "hits": self.hits,
+                "uploads": self.uploads,
+                "stale": self.stale,
+                "hit_rate": round(self.hits / sent, 3) if sent else 0.0,
+            }
+
+
+image_assets = ImageAssets(per_chat=IMAGE_CACHE_PER_CHAT)
+
+
+def send_menu_image(
+    chat_id: int, image_name: str, caption: str, reply_markup: InlineKeyboardMarkup | None = None
+) -> Message | None:
+    """
+    Отправляет в чат изображение меню команды по идентификатору файла из реестра изображений. Если изображение
+    еще не загружалось, оно загружается из файла. Если Telegram отклонил идентификатор (ответ 400),
+    идентификатор удаляется из реестра и изображение отправляется повторно: по идентификатору, который уже
+    сохранила другая отправка, либо загрузкой из файла.
+
+    Args:
+        chat_id (int): Идентификатор чата.
+        image_name (str): Название изображения из `MENU_IMAGES`.
+        caption (str): Подпись к изображению в формате HTML.
+        reply_markup (InlineKeyboardMarkup | None): Клавиатура под изображением.
+
+    Returns:
+        Message | None: Отправленное сообщение.
+    """
+    for attempt in range(2):
+        with image_assets.upload_lock(image_name):
+            file_id = image_assets.get(chat_id, image_name)
+            if not file_id:
+                return upload_menu_image(chat_id, image_name, caption, reply_markup)
+        try:
+            sent_message = bot.send_photo(
+                chat_id, file_id, caption=caption, reply_markup=reply_markup, parse_mode="HTML"
+            )
+        except ApiTelegramException as exc:
+            if exc.error_code != 400 or attempt:
+                raise
+            image_assets.invalidate(chat_id, image_name, file_id)
+            log.warning(f"Telegram отклонил идентификатор файла изображения `{image_name}`: {exc.description}.")
+            continue
+        image_assets.count(uploaded=False)
+        return sent_message
+
+
+def upload_menu_image(
+    chat_id: int, image_name: str, caption: str, reply_markup: InlineKeyboardMarkup | None = None
+) -> Message | None:
+    """
+    Загружает изображение меню из файла и сохраняет в реестре идентификатор файла, который вернул Telegram.
+    Если файл изображения не найден, отправляет только подпись.
+
+    Args:
+        chat_id (int): Идентификатор чата.
+        image_name (str): Название изображения из `MENU_IMAGES`.
+        caption (str): Подпись к изображению в формате HTML.
+        reply_markup (InlineKeyboardMarkup | None): Клавиатура под изображением.
+
+    Returns:
+        Message | None: Отправленное сообщение.
+    """
+    try:
+        with open(MENU_IMAGES[image_name], "rb") as image:
+            sent_message = bot.send_photo(
+                chat_id, image, caption=caption, reply_markup=reply_markup, parse_mode="HTML"
+            )
+    except FileNotFoundError as exc:
+        log.error(f"Ошибка при обработке изображения: {type(exc).__name__} - {exc}.")
+        log.info("Пользователю отправлено сообщение без картинки.")
+        return bot.send_message(chat_id, caption, reply_markup=reply_markup, parse_mode="HTML")
+    image_assets.count(uploaded=True)
+    image_assets.remember(chat_id, image_name, sent_message.photo[-1].file_id)
+    return sent_message
@@ -10,6 +10,7 @@ from logs.exception_description import exception_type
 from logs.exceptions import BotStatePaginationNotFoundError, ServerRequestError
 from logs.logging_config import log
 
+from services.services_messages import SESSION_EXPIRED, error_text
 from services.services_utils import set_ids
 from states.search_fields import SearchStates
 
@@ -101,22 +102,13 @@ def error_logger_bot(func: Callable) -> Callable:
             return func(*args, **kwargs)
         except BotStatePaginationNotFoundError as exc:
             handle_exception(func, exc)
-            text = (
-                "🚫 <b>Сессия отображения фильмов истекла.</b>\n\n"
-                "✍️ Введите <b><i>название</i></b> фильма 🎬 "
-                "в строку ввода для нового поиска или обратитесь в /help."
-            )
             bot.set_state(user_id, SearchStates.movie_name, chat_id)
-            bot.send_message(chat_id, text, parse_mode="HTML")
+            bot.send_message(chat_id, SESSION_EXPIRED, parse_mode="HTML")
             bot.delete_message(chat_id, message_id)
             return None
         except Exception as exc:
             handle_exception(func, exc)
-            text = (
-                f"🚫 <b>Произошла ошибка <i>{type(exc).__name__}</i></b>.\n\n"
-                "⌛ Зайдите сюда позже или \n✍️ обратитесь в службу поддержки телеграм-бота /help."
-            )
-            bot.send_message(chat_id, text, parse_mode="HTML")
+            bot.send_message(chat_id, error_text(exc), parse_mode="HTML")
             try:
                 bot.delete_message(chat_id, message_id)
             except ApiTelegramException:
@@ -152,3 +144,31 @@ def error_logger_func(func: Callable) -> Callable:
         return None
 
     return wrapper
+
+
+def async_error_logger_func(func: Callable) -> Callable:
+    """
+    Асинхронный вариант декоратора `error_logger_func` для корутин.
+
+    Args:
+        func (Callable): Корутинная функция, которая может вызывать исключения.
+
+    Returns:
+        Callable: Корутинная обертка, возвращающая описание ошибки для ConnectionError и ServerRequestError
+            и None для остальных исключений. Отмена корутины (CancelledError) пробрасывается.
+    """
+    @wraps(func)
+    async def wrapper(*args, **kwargs) -> Any | None:
+        try:
+            return await func(*args, **kwargs)
+        except ConnectionError as exc:
+            handle_exception(func, exc)
+            return str(exc)
+        except ServerRequestError as exc:
+            log.error(f"{type(exc).__name__}: {exc}")
+            return str(exc)
+        except Exception as exc:
+            handle_exception(func, exc)
+        return None
+
+    return wrapper
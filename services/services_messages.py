@@ -0,0 +1,120 @@
+# Тексты сообщений, общие для синхронного (handlers) и асинхронного (bot_async) вариантов бота
+
+MOVIE_SEARCH_CAPTION = "🔍 <b>Поиск фильма <i>по названию</i>.</b>"
+
+ENTER_MOVIE_NAME = "✍️ Введите <b><i>название</i></b> фильма 🎬 в строку ввода."
+
+NEW_MOVIE_NAME = "✍️ Введите <i>название</i> фильма 🎬 в строку ввода."
+
+NOT_FOUND_MOVIE_NAME = (
+    "❌ По вашему запросу <b>ничего не найдено</b>.\n\n"
+    "✍️ Введите в строку ввода другое <b><i>название</i></b> фильма."
+)
+
+ALL_RESULTS_SHOWN = (
+    "📕 Вам были показаны <b><i>все результаты</i></b> по заданному поисковому запросу.\n\n"
+    "⬅️ <b><i>Вернитесь назад</i></b> или ✔️ задайте <b><i>новый поиск</i></b>."
+)
+
+INACTIVE_INPUT = (
+    "✍️❌ <b>Сейчас строка ввода <i>не активна</i></b>.\n\nПопробуйте задать команду "
+    "другим способом либо обратитесь в <b><i>меню</i></b> или /help."
+)
+
+SESSION_EXPIRED = (
+    "🚫 <b>Сессия отображения фильмов истекла.</b>\n\n"
+    "✍️ Введите <b><i>название</i></b> фильма 🎬 "
+    "в строку ввода для нового поиска или обратитесь в /help."
+)
+
+
+def start_caption(first_name: str | None) -> str:
+    """
+    Формирует приветственное сообщение команды /start.
+
+    Args:
+        first_name (str | None): Имя пользователя.
+
+    Returns:
+        str: Текст сообщения в формате HTML.
+    """
+    return (
+        f"🚀 Рад приветствовать вас, <i>{first_name}</i> 👋!\n\n"
+        "🦔 Я - <b>бот-поисковик</b> фильмов с базой данных 🌐 "
+        '<i><a href="http://www.kinopoisk.ru/">Кинопоиск</a></i>.\n\n'
+        "🔍 Здесь вы можете искать фильмы и сериалы на свой вкус и просматривать их описание 📜.\n\n"
+        "❓ Информацию об основных моих командах можно получить в /help."
+    )
+
+
+def help_caption(first_name: str | None) -> str:
+    """
+    Формирует справочное сообщение команды /help.
+
+    Args:
+        first_name (str | None): Имя пользователя.
+
+    Returns:
+        str: Текст сообщения в формате HTML.
+    """
+    return (
+        f"❓<b>Справка по использованию бота</b>\n\n"
+        f"<i>{first_name}</i>, вот мои основные <b><i>команды</i></b> 📋:\n\n"
+        "🚀 /start — <i>Запустить бота</i>\n\n"
+        "🔍 /movie_search — <i>Поиск фильма по названию</i>\n\n"
+        "🔍 /movie_by_filters — <i>Поиск фильмов/сериалов по фильтрам</i>\n\n"
+        "📌 /postponed_movies — <i>Просмотр избранных и просмотренных фильмов</i>\n\n"
+        "📚 /history — <i>Управление историей поисковых запросов</i>\n\n"
+        "📩 <i>torkvata87@gmail.com</i> -  <i>Обратиться в службу поддержки</i> телеграм-бота"
+    )
+
+
+def commands_text(first_name: str | None) -> str:
+    """
+    Формирует сообщение с перечнем команд бота в ответ на текст, не являющийся командой.
+
+    Args:
+        first_name (str | None): Имя пользователя.
+
+    Returns:
+        str: Текст сообщения в формате HTML.
+    """
+    return (
+        f"<i>{first_name}</i>, вот мои основные <b><i>команды</i></b> 📋:\n\n"
+        "🚀 /start — <i>Запустить бота</i>\n\n"
+        "🔍 /movie_search — <i>Поиск фильма по названию</i>\n\n"
+        "🔍 /movie_by_filters — <i>Поиск фильмов/сериалов по фильтрам</i>\n\n"
+        "📌 /postponed_movies — <i>Просмотр избранных и просмотренных фильмов</i>\n\n"
+        "📚 /history — <i>Управление историей поисковых запросов</i>\n\n"
+        "❓ /help — <i>Справка по использованию бота\n\n"
+        "📩 <i>torkvata87@gmail.com</i> -  <i>Обратиться в службу поддержки</i> телеграм-бота"
+    )
+
+
+def error_text(exc: Exception) -> str:
+    """
+    Формирует сообщение об ошибке при обработке команды.
+
+    Args:
+        exc (Exception): Исключение.
+
+    Returns:
+        str: Текст сообщения в формате HTML.
+    """
+    return (
+        f"🚫 <b>Произошла ошибка <i>{type(exc).__name__}</i></b>.\n\n"
+        "⌛ Зайдите сюда позже или \n✍️ обратитесь в службу поддержки телеграм-бота /help."
+    )
+
+
+def search_error_text(error: str) -> str:
+    """
+    Формирует сообщение об ошибке поискового запроса.
+
+    Args:
+        error (str): Описание ошибки.
+
+    Returns:
+        str: Текст сообщения в формате HTML.
+    """
+    return f"🚫 <b>{error}</b>\n\n" "⌛ <i>Попробуйте выполнить поиск позже.</i>"
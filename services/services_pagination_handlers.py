@@ -1,6 +1,7 @@
-from typing import Any, List, Dict
+from threading import Lock
+from typing import Any, List, Dict, Tuple
 
-from telebot.types import Message
+from telebot.types import InlineKeyboardMarkup, InputMediaPhoto, Message
 from telebot.apihelper import ApiTelegramException
 
 from config_data.config import IMAGE_EMPTY_POSTER
@@ -8,52 +9,109 @@ from keyboards.pagination.pagination_movies import create_paginator_movies
 from keyboards.pagination.pagination_history import create_paginator_history
 from loader import bot
 
+from services.services_film_cache import resolve_movies
 from services.services_logging import error_logger_bot, error_logger_func
+from services.services_poster_cache import is_remote, poster_cache
 
 from logs.logging_config import log
 
 
-@error_logger_func
-def send_movie_pagination(
-    chat_id: int,
+# Значки типов фильмов в карточке фильма
+EMOJI_TYPES = {
+    "movie": "🎞️",
+    "tv-series": "📺",
+    "cartoon": "🦄",
+    "anime": "🌸",
+    "animated-series": "📺🦄",
+}
+# Максимальная длина подписи к изображению в Telegram
+CAPTION_LIMIT = 1024
+# Описания ошибок Telegram API, относящихся к самому редактируемому сообщению, а не к отправляемому изображению
+MESSAGE_ERRORS = (
+    "message to edit not found",
+    "message can't be edited",
+    "message is not modified",
+    "message_id_invalid",
+)
+
+
+class PaginationEditStats:
+    """
+    Статистика обновления сообщений пагинации фильмов. При редактировании сообщения на месте выполняется один
+    вызов Telegram API вместо двух (отправка нового сообщения и удаление предыдущего); если отредактировать
+    сообщение нельзя, отправляется новое сообщение, а предыдущее удаляется.
+
+    Attributes:
+        edits (int): Количество сообщений, отредактированных на месте.
+        fallbacks (int): Количество сообщений, замененных отправкой нового сообщения.
+        saved_calls (int): Количество сэкономленных вызовов Telegram API.
+    """
+    def __init__(self) -> None:
+        self.edits = 0
+        self.fallbacks = 0
+        self.saved_calls = 0
+        self._lock = Lock()
+
+    def record(self, edited: bool, saved_calls: int) -> None:
+        """
+        Учитывает обновление сообщения пагинации.
+
+        Args:
+            edited (bool): True, если сообщение отредактировано на месте.
+            saved_calls (int): Количество сэкономленных вызовов Telegram API.
+        """
+        with self._lock:
+            if edited:
+                self.edits += 1
+            else:
+                self.fallbacks += 1
+            self.saved_calls += saved_calls
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Возвращает статистику обновления сообщений пагинации.
+
+        Returns:
+            Dict[str, int]: Количество отредактированных и замененных сообщений и сэкономленных вызовов API.
+        """
+        with self._lock:
+            return {"edits": self.edits, "fallbacks": self.fallbacks, "saved_calls": self.saved_calls}
+
+
+pagination_edits = PaginationEditStats()
+
+
+def render_movie_card(
     movies_data: List[Dict[str, Any]],
     current_page: int = 1,
     total_pages: int = 1,
     page_number: int = 1,
-) -> None:
+) -> Tuple[str | None, str, InlineKeyboardMarkup]:
     """
-    Отправляет в чат сообщение со списком фильмов в виде пагинации.
+    Формирует карточку фильма для просмотра фильмов в виде пагинации: постер, подпись и клавиатуру пагинации.
+    Используется синхронным и асинхронным вариантами бота.
 
     Args:
-        chat_id (int): Идентификатор чата, может быть chat_id или user_id.
-        movies_data (List[Dict[str, Any]]): Список словарей, содержащих информацию о фильмах.
+        movies_data (List[Dict[str, Any]]): Список словарей, содержащих информацию о фильмах, либо список фильмов
+            из сессии пользователя (данные фильмов извлекаются из общего кэша фильмов).
         current_page (int): Текущая страница в списке фильмов. По умолчанию равна 1.
-        total_pages (int): Общее количество страниц фильмов, если есть несколько страниц в результатах поиска.
-            По умолчанию равно 1.
+        total_pages (int): Общее количество страниц фильмов. По умолчанию равно 1.
         page_number (int): Номер текущей страницы в результатах поиска на ресурсе сайта "Кинопоиск".
             По умолчанию равен 1.
 
+    Returns:
+        Tuple[str | None, str, InlineKeyboardMarkup]: URL постера (None, если постер отсутствует), подпись
+            в формате HTML и клавиатура пагинации.
+
     Raises:
-        ValueError: Если некорректный формат списка фильмов или не предоставлено изображение для фильма.
-        IndexError: Если current_page выходит за пределы допустимого диапазона страниц.
-        ApiTelegramException: Если возникает ошибка при отправке изображения через Telegram API типа "400 Bad Request:
-            wrong type of the web page content".
+        ValueError: Если некорректный формат списка фильмов.
     """
     if not isinstance(movies_data, list):
         raise ValueError("Информация о фильмах должна передаваться в виде списка.")
-    # if not (1 <= current_page <= len(movies_data)):
-    #     raise IndexError("Текущая страница выходит за пределы допустимого диапазона.")
 
+    movies_data = resolve_movies(movies_data)
     data_movie = movies_data[current_page - 1]
 
-    emoji_data = {
-        "movie": "🎞️",
-        "tv-series": "📺",
-        "cartoon": "🦄",
-        "anime": "🌸",
-        "animated-series": "📺🦄",
-    }
-
     movie_param = [
         {"🌍 ": data_movie["countries"]},
         {"\n\n🎭 ": data_movie["genre"]},
@@ -78,53 +136,32 @@ def send_movie_pagination(
     )
 
     text = (
-        f"{emoji_data[data_movie['type_movie']]} <b>{data_movie['name_movie']}</b> "
+        f"{EMOJI_TYPES[data_movie['type_movie']]} <b>{data_movie['name_movie']}</b> "
         f"<i>{alternative_name}({data_movie['year']})</i>\n\n"
         f"{text_data}"
     )
 
-    image = data_movie["poster"]
     paginator = create_paginator_movies(
         movies_data, current_page, total_pages, page_number
     )
-    try:
-        if not image:
-            raise ValueError("Постер фильма отсутствует")
-        bot.send_photo(
-            chat_id,
-            image,
-            caption=text,
-            reply_markup=paginator.markup,
-            parse_mode="HTML",
-        )
-    except (ApiTelegramException, ValueError) as exc:
-        with open(IMAGE_EMPTY_POSTER, "rb") as image_file:
-            bot.send_photo(
-                chat_id,
-                image_file,
-                caption=text,
-                reply_markup=paginator.markup,
-                parse_mode="HTML",
-            )
+    return data_movie["poster"], text, paginator.markup
 
-        log.error(
-            f"{type(exc).__name__}: Ошибка при отправке изображения через Telegram API - {exc}."
-        )
-        log.info("В чат было направлено сообщение с пустым постером.")
 
-
-@error_logger_func
-def send_description_pagination_page(
-    chat_id: int, movies_data: List[Dict[str, Any]], current_page: int = 1
-) -> None:
+def render_description_page(
+    movies_data: List[Dict[str, Any]], current_page: int = 1
+) -> Tuple[str | None, InlineKeyboardMarkup]:
     """
-    Отправляет сообщение в чат с полной информацией о фильме, используя пагинацию для переключения между фильмами.
+    Формирует страницу полного описания фильма: текст описания и клавиатуру пагинации в режиме просмотра описания.
 
     Args:
-        chat_id (int): Идентификатор чата, может быть chat_id или user_id.
-        movies_data (List[Dict[str, Any]]): Список словарей, содержащих информацию о фильмах.
+        movies_data (List[Dict[str, Any]]): Список словарей, содержащих информацию о фильмах, либо список фильмов
+            из сессии пользователя.
         current_page (int): Текущая страница в списке фильмов. По умолчанию равна 1.
 
+    Returns:
+        Tuple[str | None, InlineKeyboardMarkup]: Текст страницы (None, если у фильма нет полного описания)
+            и клавиатура пагинации.
+
     Raises:
         ValueError: Если некорректный формат списка фильмов.
         IndexError: Если current_page выходит за пределы допустимого диапазона страниц.
@@ -134,16 +171,247 @@ def send_description_pagination_page(
     if not (1 <= current_page <= len(movies_data)):
         raise IndexError("Текущая страница выходит за пределы допустимого диапазона.")
 
+    movies_data = resolve_movies(movies_data)
     description = movies_data[current_page - 1]["description"]
     paginator = create_paginator_movies(
         movies_data, current_page, show_pagination_descr=True
     )
+    return (f"📜 {description}" if description else None), paginator.markup
+
+
+def send_cached_photo(chat_id: int, source: str, caption: str, markup: InlineKeyboardMarkup) -> Message:
+    """
+    Отправляет в чат постер по идентификатору файла из кэша постеров, а при его отсутствии - по URL постера
+    либо из файла с сохранением идентификатора файла, который вернул Telegram. Если Telegram отклонил
+    идентификатор из кэша (ответ 400), идентификатор удаляется из кэша и постер отправляется из источника.
+
+    Args:
+        chat_id (int): Идентификатор чата.
+        source (str): URL постера либо путь к файлу изображения.
+        caption (str): Подпись к постеру в формате HTML.
+        markup (InlineKeyboardMarkup): Клавиатура под постером.
+
+    Returns:
+        Message: Отправленное сообщение.
 
-    text = f"📜 {description}"
-    keyboard = paginator.markup
+    Raises:
+        ApiTelegramException: Если Telegram не смог отправить постер из источника.
+        FileNotFoundError: Если файл изображения не найден.
+    """
+    file_id = poster_cache.get(source)
+    if file_id:
+        try:
+            return bot.send_photo(chat_id, file_id, caption=caption, reply_markup=markup, parse_mode="HTML")
+        except ApiTelegramException as exc:
+            if exc.error_code != 400:
+                raise
+            poster_cache.invalidate(source, file_id)
+            log.warning(f"Telegram отклонил идентификатор файла постера: {exc.description}. Постер отправлен повторно.")
+
+    if is_remote(source):
+        sent_message = bot.send_photo(chat_id, source, caption=caption, reply_markup=markup, parse_mode="HTML")
+    else:
+        with open(source, "rb") as image_file:
+            sent_message = bot.send_photo(
+                chat_id, image_file, caption=caption, reply_markup=markup, parse_mode="HTML"
+            )
+    poster_cache.remember(source, sent_message.photo[-1].file_id)
+    return sent_message
+
+
+@error_logger_func
+def send_movie_pagination(
+    chat_id: int,
+    movies_data: List[Dict[str, Any]],
+    current_page: int = 1,
+    total_pages: int = 1,
+    page_number: int = 1,
+) -> None:
+    """
+    Отправляет в чат сообщение со списком фильмов в виде пагинации.
 
-    if description:
+    Args:
+        chat_id (int): Идентификатор чата, может быть chat_id или user_id.
+        movies_data (List[Dict[str, Any]]): Список словарей, содержащих информацию о фильмах, либо список фильмов
+            из сессии пользователя (данные фильмов извлекаются из общего кэша фильмов).
+        current_page (int): Текущая страница в списке фильмов. По умолчанию равна 1.
+        total_pages (int): Общее количество страниц фильмов, если есть несколько страниц в результатах поиска.
+            По умолчанию равно 1.
+        page_number (int): Номер текущей страницы в результатах поиска на ресурсе сайта "Кинопоиск".
+            По умолчанию равен 1.
+
+    Raises:
+        ValueError: Если некорректный формат списка фильмов или не предоставлено изображение для фильма.
+        IndexError: Если current_page выходит за пределы допустимого диапазона страниц.
+        ApiTelegramException: Если возникает ошибка при отправке изображения через Telegram API типа "400 Bad Request:
+            wrong type of the web page content".
+    """
+    image, text, markup = render_movie_card(movies_data, current_page, total_pages, page_number)
+    try:
+        if not image:
+            raise ValueError("Постер фильма отсутствует")
+        send_cached_photo(chat_id, image, text, markup)
+    except (ApiTelegramException, ValueError) as exc:
+        send_cached_photo(chat_id, IMAGE_EMPTY_POSTER, text, markup)
+
+        log.error(
+            f"{type(exc).__name__}: Ошибка при отправке изображения через Telegram API - {exc}."
+        )
+        log.info("В чат было направлено сообщение с пустым постером.")
+
+
+def count_saved_calls(data: Dict[str, Any], edited: bool, saved_calls: int) -> None:
+    """
+    Учитывает сэкономленные вызовы Telegram API в данных сессии пользователя (`saved_calls`) и в общей
+    статистике `pagination_edits`.
+
+    Args:
+        data (Dict[str, Any]): Данные сессии пользователя.
+        edited (bool): True, если сообщение отредактировано на месте.
+        saved_calls (int): Количество сэкономленных вызовов Telegram API.
+    """
+    pagination_edits.record(edited, saved_calls)
+    if saved_calls:
+        data["saved_calls"] = data.get("saved_calls", 0) + saved_calls
+
+
+def is_message_error(exc: ApiTelegramException) -> bool:
+    """
+    Проверяет, что Telegram отклонил редактирование из-за самого сообщения (сообщение не найдено, не может быть
+    отредактировано или не изменилось), а не из-за отправляемого изображения.
+
+    Args:
+        exc (ApiTelegramException): Ошибка Telegram API.
+
+    Returns:
+        bool: True, если ошибка относится к редактируемому сообщению.
+    """
+    description = str(exc.description).lower()
+    return any(error in description for error in MESSAGE_ERRORS)
+
+
+def edit_cached_photo(message: Message, source: str, caption: str, markup: InlineKeyboardMarkup) -> None:
+    """
+    Заменяет изображение и подпись сообщения с изображением, используя идентификатор файла из кэша постеров
+    (см. `send_cached_photo`). Если Telegram отклонил идентификатор из кэша, идентификатор удаляется из кэша
+    и изображение отправляется из источника.
+
+    Args:
+        message (Message): Редактируемое сообщение с изображением.
+        source (str): URL постера либо путь к файлу изображения.
+        caption (str): Подпись к изображению в формате HTML.
+        markup (InlineKeyboardMarkup): Клавиатура под изображением.
+
+    Raises:
+        ApiTelegramException: Если Telegram не смог отредактировать сообщение.
+        FileNotFoundError: Если файл изображения не найден.
+    """
+    chat_id, message_id = message.chat.id, message.message_id
+    file_id = poster_cache.get(source)
+    if file_id:
+        try:
+            bot.edit_message_media(
+                InputMediaPhoto(file_id, caption=caption, parse_mode="HTML"), chat_id, message_id, reply_markup=markup
+            )
+            return
+        except ApiTelegramException as exc:
+            if exc.error_code != 400 or is_message_error(exc):
+                raise
+            poster_cache.invalidate(source, file_id)
+            log.warning(f"Telegram отклонил идентификатор файла постера: {exc.description}. Постер отправлен повторно.")
+
+    if is_remote(source):
+        edited = bot.edit_message_media(
+            InputMediaPhoto(source, caption=caption, parse_mode="HTML"), chat_id, message_id, reply_markup=markup
+        )
+    else:
+        with open(source, "rb") as image_file:
+            edited = bot.edit_message_media(
+                InputMediaPhoto(image_file, caption=caption, parse_mode="HTML"),
+                chat_id,
+                message_id,
+                reply_markup=markup,
+            )
+    poster_cache.remember(source, edited.photo[-1].file_id)
+
+
+def edit_movie_pagination(
+    message: Message,
+    movies_data: List[Dict[str, Any]],
+    current_page: int = 1,
+    total_pages: int = 1,
+    page_number: int = 1,
+) -> bool:
+    """
+    Заменяет сообщение с изображением карточкой фильма на месте. Если постер отсутствует или Telegram не смог его
+    загрузить, в карточку подставляется пустой постер. Если сообщение не содержит изображения или не может быть
+    отредактировано, карточка отправляется новым сообщением, а предыдущее сообщение удаляется.
+
+    Args:
+        message (Message): Сообщение с клавиатурой пагинации, на кнопку которого нажал пользователь.
+        movies_data (List[Dict[str, Any]]): Список фильмов из сессии пользователя.
+        current_page (int): Текущая страница в списке фильмов. По умолчанию равна 1.
+        total_pages (int): Общее количество страниц фильмов. По умолчанию равно 1.
+        page_number (int): Номер текущей страницы в результатах поиска. По умолчанию равен 1.
+
+    Returns:
+        bool: True, если сообщение отредактировано на месте, False - если отправлено новое сообщение.
+    """
+    image, text, markup = render_movie_card(movies_data, current_page, total_pages, page_number)
+    if message.content_type == "photo":
+        try:
+            try:
+                if not image:
+                    raise ValueError("Постер фильма отсутствует")
+                edit_cached_photo(message, image, text, markup)
+            except (ApiTelegramException, ValueError) as exc:
+                if isinstance(exc, ApiTelegramException) and is_message_error(exc):
+                    raise
+                edit_cached_photo(message, IMAGE_EMPTY_POSTER, text, markup)
+            return True
+        except ApiTelegramException as exc:
+            if "message is not modified" in str(exc.description):
+                return True
+            log.info(f"Карточка фильма отправлена новым сообщением: {exc.description}.")
+
+    send_movie_pagination(message.chat.id, movies_data, current_page, total_pages, page_number)
+    bot.delete_message(message.chat.id, message.message_id)
+    return False
+
+
+def edit_description_pagination_page(
+    message: Message, movies_data: List[Dict[str, Any]], current_page: int = 1
+) -> bool:
+    """
+    Заменяет подпись карточки фильма (либо текст сообщения) полным описанием фильма на месте. Если описание
+    длиннее допустимой подписи к изображению или сообщение не может быть отредактировано, описание отправляется
+    новым сообщением, а предыдущее сообщение удаляется.
+
+    Args:
+        message (Message): Сообщение с клавиатурой пагинации, на кнопку которого нажал пользователь.
+        movies_data (List[Dict[str, Any]]): Список фильмов из сессии пользователя.
+        current_page (int): Текущая страница в списке фильмов. По умолчанию равна 1.
+
+    Returns:
+        bool: True, если сообщение отредактировано на месте, False - если отправлено новое сообщение.
+    """
+    text, keyboard = render_description_page(movies_data, current_page)
+    chat_id, message_id = message.chat.id, message.message_id
+    if text:
+        try:
+            if message.content_type == "photo" and len(text) <= CAPTION_LIMIT:
+                bot.edit_message_caption(text, chat_id, message_id, reply_markup=keyboard, parse_mode="HTML")
+                return True
+            if message.content_type == "text":
+                bot.edit_message_text(text, chat_id, message_id, reply_markup=keyboard, parse_mode="HTML")
+                return True
+        except ApiTelegramException as exc:
+            if "message is not modified" in str(exc.description):
+                return True
+            log.info(f"Описание фильма отправлено новым сообщением: {exc.description}.")
         bot.send_message(chat_id, text, reply_markup=keyboard, parse_mode="HTML")
+    bot.delete_message(chat_id, message_id)
+    return False
 
 
 @error_logger_bot
@@ -160,7 +428,8 @@ def get_check_status(
 
     Args:
         message (Message): Сообщение Telegram, для которого необходимо обновить клавиатуру.
-        movies_data (List[Dict[str, Any]]): Список словарей, содержащих информацию о фильмах.
+        movies_data (List[Dict[str, Any]]): Список словарей, содержащих информацию о фильмах, либо список фильмов
+            из сессии пользователя (данные фильмов извлекаются из общего кэша фильмов).
         current_page (int): Текущая страница в списке фильмов. По умолчанию равна 1.
         total_pages (int): Общее количество страниц фильмов, если есть несколько страниц в результатах поиска.
             По умолчанию равно 1.
@@ -176,7 +445,7 @@ def get_check_status(
         raise ValueError("Информация о фильме должна передаваться в виде списка.")
 
     paginator = create_paginator_movies(
-        movies_data, current_page, total_pages, page_number, show_pagination_descr
+        resolve_movies(movies_data), current_page, total_pages, page_number, show_pagination_descr
     )
 
     bot.edit_message_reply_markup(
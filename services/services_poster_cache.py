@@ -0,0 +1,130 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict
+
+from config_data.config import POSTER_CACHE_SIZE
+from database.core import crud_images
+
+
+db_get_poster = crud_images.get_poster()
+db_save_poster = crud_images.save_poster()
+db_delete_poster = crud_images.delete_poster()
+
+
+class PosterCache:
+    """
+    Общий для всех чатов кэш идентификаторов файлов постеров в Telegram. После первой отправки постера по URL
+    Telegram возвращает идентификатор файла, и последующие отправки того же постера в любой чат используют его
+    без повторной загрузки постера с сайта. Идентификаторы хранятся в таблице PosterFile и в LRU-кэше
+    процесса перед ней.
+
+    Attributes:
+        max_entries (int): Максимальное количество идентификаторов в памяти процесса.
+        hits (int): Количество постеров, отправленных по сохраненному идентификатору файла.
+        misses (int): Количество постеров, для которых идентификатор файла не найден.
+        stale (int): Количество идентификаторов, отклоненных Telegram и удаленных из кэша.
+        stored (int): Количество сохраненных идентификаторов.
+    """
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.stored = 0
+        self._file_ids: OrderedDict[str, str] = OrderedDict()
+        self._lock = Lock()
+
+    def _put(self, source: str, file_id: str) -> None:
+        self._file_ids[source] = file_id
+        self._file_ids.move_to_end(source)
+        while len(self._file_ids) > self.max_entries:
+            self._file_ids.popitem(last=False)
+
+    def get(self, source: str) -> str | None:
+        """
+        Возвращает идентификатор файла постера: из памяти процесса, а при его отсутствии - из базы данных.
+
+        Args:
+            source (str): URL постера либо путь к файлу изображения.
+
+        Returns:
+            str | None: Идентификатор файла в Telegram либо None, если постер еще не отправлялся.
+        """
+        with self._lock:
+            file_id = self._file_ids.get(source)
+            if file_id is not None:
+                self._file_ids.move_to_end(source)
+                self.hits += 1
+                return file_id
+
+        file_id = db_get_poster(source)
+        with self._lock:
+            if file_id is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._put(source, file_id)
+        return file_id
+
+    def remember(self, source: str, file_id: str) -> None:
+        """
+        Сохраняет идентификатор файла, который Telegram вернул после отправки постера.
+
+        Args:
+            source (str): URL постера либо путь к файлу изображения.
+            file_id (str): Идентификатор файла в Telegram.
+        """
+        db_save_poster(source, file_id)
+        with self._lock:
+            self.stored += 1
+            self._put(source, file_id)
+
+    def invalidate(self, source: str, file_id: str) -> None:
+        """
+        Удаляет идентификатор файла, который Telegram отклонил. Идентификатор, уже замененный другим процессом
+        или потоком, не удаляется.
+
+        Args:
+            source (str): URL постера либо путь к файлу изображения.
+            file_id (str): Отклоненный идентификатор файла.
+        """
+        db_delete_poster(source, file_id)
+        with self._lock:
+            self.stale += 1
+            if self._file_ids.get(source) == file_id:
+                del self._file_ids[source]
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Возвращает статистику использования кэша.
+
+        Returns:
+            Dict[str, float]: Количество попаданий, промахов, устаревших и сохраненных идентификаторов, доля
+                попаданий и текущий размер кэша в памяти.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale": self.stale,
+                "stored": self.stored,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "size": len(self._file_ids),
+            }
+
+
+def is_remote(source: str) -> bool:
+    """
+    Проверяет, является ли источник постера URL (иначе это путь к локальному файлу изображения).
+
+    Args:
+        source (str): URL постера либо путь к файлу изображения.
+
+    Returns:
+        bool: True, если источник - URL.
+    """
+    return source.startswith(("http://", "https://"))
+
+
+poster_cache = PosterCache(max_entries=POSTER_CACHE_SIZE)
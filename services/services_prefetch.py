@@ -0,0 +1,205 @@
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
+from threading import Lock
+from typing import Any, Dict, Tuple
+
+from logs.logging_config import log
+
+from site_API.core import keep_ratio, site
+from site_API.rate_limiter import PRIORITY_BACKGROUND
+from site_API.response_cache import make_cache_key
+from site_API.site_api_handler import SearchResult, build_search_request, search_movies
+
+
+class PagePrefetcher:
+    """
+    Фоновая загрузка следующей страницы результатов поиска. Когда пользователь просматривает последние карточки
+    страницы, следующая страница запрашивается в фоне с приоритетом PRIORITY_BACKGROUND и сохраняется в буфере
+    сессии пользователя, поэтому переход по кнопке `Дальше` обслуживается без ожидания ответа API.
+    В буфере каждой сессии хранится не более одной страницы; при новом поиске или сбросе сессии
+    незавершенная загрузка отменяется, а загруженная страница удаляется. Буфер хранит страницы не более
+    `max_sessions` сессий: при переполнении удаляется страница сессии, дольше всех не запускавшей загрузку.
+
+    Attributes:
+        cards_before_end (int): Количество последних карточек страницы, при просмотре которых начинается загрузка.
+        max_sessions (int): Максимальное количество сессий в буфере.
+        scheduled (int): Количество запущенных фоновых загрузок.
+        hits (int): Количество переходов на следующую страницу, обслуженных из буфера.
+        dropped (int): Количество неиспользованных загрузок, отмененных или удаленных из буфера.
+    """
+    def __init__(self, max_workers: int, cards_before_end: int, max_sessions: int) -> None:
+        self.cards_before_end = cards_before_end
+        self.max_sessions = max_sessions
+        self.scheduled = 0
+        self.hits = 0
+        self.dropped = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prefetch")
+        # (user_id, chat_id) -> (ключ запроса страницы, загрузка страницы) в порядке запуска загрузок
+        self._buffer: OrderedDict[Tuple[int, int], Tuple[str, Future]] = OrderedDict()
+        self._lock = Lock()
+
+    def should_prefetch(self, current_card: int, total_cards: int) -> bool:
+        """
+        Проверяет, что пользователь дошел до последних карточек страницы.
+
+        Args:
+            current_card (int): Номер текущей карточки фильма на странице.
+            total_cards (int): Количество карточек фильмов на странице.
+
+        Returns:
+            bool: True, если пора загружать следующую страницу.
+        """
+        return current_card > total_cards - self.cards_before_end
+
+    def schedule(
+        self,
+        user_id: int,
+        chat_id: int,
+        search_criteria: Dict[str, Any] | str,
+        type_search: str,
+        page: int,
+        limit: int,
+    ) -> None:
+        """
+        Запускает фоновую загрузку страницы результатов поиска, если она еще не загружена или не загружается.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            chat_id (int): Идентификатор чата.
+            search_criteria (Dict[str, Any] | str): Критерии поиска.
+            type_search (str): Тип поиска. Возможные значения: `movie_by_filters` или `movie_search`.
+            page (int): Номер загружаемой страницы.
+            limit (int): Размер страницы запроса, общий для всех страниц поиска.
+        """
+        key = make_cache_key(*build_search_request(search_criteria, type_search, page, limit))
+        with self._lock:
+            entry = self._buffer.get((user_id, chat_id))
+            if entry is not None and entry[0] == key:
+                return
+            if entry is not None:
+                self._discard(entry)
+            future = self._executor.submit(
+                search_movies, search_criteria, type_search, page, PRIORITY_BACKGROUND, limit
+            )
+            self._buffer[(user_id, chat_id)] = (key, future)
+            self._buffer.move_to_end((user_id, chat_id))
+            while len(self._buffer) > self.max_sessions:
+                self._discard(self._buffer.popitem(last=False)[1])
+            self.scheduled += 1
+        log.debug(f"Фоновая загрузка страницы {page} результатов поиска для пользователя {user_id}.")
+
+    def take(
+        self,
+        user_id: int,
+        chat_id: int,
+        search_criteria: Dict[str, Any] | str,
+        type_search: str,
+        page: int,
+        limit: int,
+    ) -> SearchResult | None:
+        """
+        Извлекает из буфера сессии загруженную страницу результатов поиска. Если загрузка страницы еще
+        выполняется, ожидает ее завершения (не дольше таймаута запроса к API).
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            chat_id (int): Идентификатор чата.
+            search_criteria (Dict[str, Any] | str): Критерии поиска.
+            type_search (str): Тип поиска. Возможные значения: `movie_by_filters` или `movie_search`.
+            page (int): Номер запрашиваемой страницы.
+            limit (int): Размер страницы запроса, общий для всех страниц поиска.
+
+        Returns:
+            SearchResult | None: Результаты поиска либо None, если страница не загружалась или загрузилась с ошибкой.
+        """
+        key = make_cache_key(*build_search_request(search_criteria, type_search, page, limit))
+        with self._lock:
+            entry = self._buffer.pop((user_id, chat_id), None)
+            if entry is None:
+                return None
+            if entry[0] != key:
+                self._discard(entry)
+                return None
+
+        try:
+            result = entry[1].result(timeout=site.api_timeout)
+        except TimeoutError:
+            return None
+        if result is None or result.error:
+            return None
+        with self._lock:
+            self.hits += 1
+        return result
+
+    def drop(self, user_id: int, chat_id: int) -> None:
+        """
+        Отменяет фоновую загрузку и удаляет загруженную страницу из буфера сессии пользователя.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            chat_id (int): Идентификатор чата.
+        """
+        with self._lock:
+            entry = self._buffer.pop((user_id, chat_id), None)
+            if entry is not None:
+                self._discard(entry)
+
+    def _discard(self, entry: Tuple[str, Future]) -> None:
+        entry[1].cancel()
+        self.dropped += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Возвращает статистику фоновой загрузки страниц.
+
+        Returns:
+            Dict[str, int]: Количество запущенных загрузок, использованных и отброшенных страниц,
+                а также количество сессий с загруженной или загружаемой страницей.
+        """
+        with self._lock:
+            return {
+                "scheduled": self.scheduled,
+                "hits": self.hits,
+                "dropped": self.dropped,
+                "buffered": len(self._buffer),
+            }
+
+
+prefetcher = PagePrefetcher(
+    max_workers=site.api_prefetch_workers,
+    cards_before_end=site.api_prefetch_cards,
+    max_sessions=site.api_prefetch_sessions,
+)
+
+
+def prefetch_next_page(user_id: int, chat_id: int, data: Dict[str, Any], current_card: int) -> None:
+    """
+    Запускает фоновую загрузку следующей страницы результатов поиска, если пользователь просматривает последние
+    карточки текущей страницы поиска по названию или по фильтрам.
+
+    Args:
+        user_id (int): Идентификатор пользователя.
+        chat_id (int): Идентификатор чата.
+        data (Dict[str, Any]): Данные сессии пользователя (`search`, `page`, `pages`, `total_pages`, `limit`,
+            `movie_info`).
+        current_card (int): Номер текущей карточки фильма на странице.
+    """
+    search_criteria = data.get("search")
+    movie_info = data.get("movie_info")
+    # После перехода на другую страницу в `pages` хранится количество оставшихся страниц, а общее количество
+    # страниц - в `total_pages`; до первого перехода `pages` - общее количество страниц
+    total_pages = data.get("total_pages", data.get("pages", 1))
+    if not search_criteria or not movie_info or data.get("page", 1) >= total_pages:
+        return
+    if not prefetcher.should_prefetch(current_card, len(movie_info)):
+        return
+
+    type_search = "movie_search" if isinstance(search_criteria, str) else "movie_by_filters"
+    prefetcher.schedule(
+        user_id,
+        chat_id,
+        search_criteria,
+        type_search,
+        data.get("page", 1) + 1,
+        data.get("limit") or keep_ratio.base_limit,
+    )
@@ -1,2 +1,8 @@
+from . import async_core
+from . import circuit_breaker
 from . import core
+from . import keep_ratio
+from . import rate_limiter
+from . import response_cache
+from . import single_flight
 from . import site_api_handler
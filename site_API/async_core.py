@@ -0,0 +1,215 @@
+import asyncio
+import json
+from typing import Any, Dict, List, Tuple
+
+import aiohttp
+
+from config_data.config import SiteSettings
+from logs.exceptions import ApiQuotaExceededError
+from services.services_logging import async_error_logger_func
+from site_API.core import (
+    RETRY_STATUS_CODES,
+    backoff_delay,
+    breaker,
+    quota,
+    rate_limiter,
+    response_cache,
+    site,
+)
+from site_API.rate_limiter import PRIORITY_INTERACTIVE
+from site_API.response_cache import make_cache_key
+from site_API.single_flight import AsyncSingleFlight
+
+
+def encode_params(params: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """
+    Преобразует параметры запроса к виду, в котором их передает requests: параметры со значением None
+    отбрасываются, а списки значений передаются повторяющимися параметрами.
+
+    Args:
+        params (Dict[str, Any]): Параметры запроса.
+
+    Returns:
+        List[Tuple[str, str]]: Пары "имя параметра - значение".
+    """
+    encoded = []
+    for name, value in params.items():
+        if value is None:
+            continue
+        values = value if isinstance(value, (list, tuple)) else [value]
+        encoded.extend((name, str(item)) for item in values)
+    return encoded
+
+
+class AsyncApiClient:
+    """
+    Асинхронный клиент API Кинопоиск на базе aiohttp с пулом keep-alive соединений. Сессия aiohttp создается
+    при первом запросе внутри работающего цикла событий и закрывается методом `close`.
+
+    Attributes:
+        host_api (str): Базовый URL для доступа к API.
+        timeout (aiohttp.ClientTimeout): Таймауты установки соединения и выполнения запроса.
+    """
+    def __init__(self, settings: SiteSettings) -> None:
+        self.host_api = settings.host_api
+        self.timeout = aiohttp.ClientTimeout(
+            total=settings.api_timeout, sock_connect=settings.api_connect_timeout
+        )
+        self._headers = {
+            "accept": "application/json",
+            "X-API-KEY": settings.api_key.get_secret_value(),
+        }
+        self._limit = settings.api_pool_connections * settings.api_pool_maxsize
+        self._limit_per_host = settings.api_pool_maxsize
+        self._session: aiohttp.ClientSession | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._limit, limit_per_host=self._limit_per_host, keepalive_timeout=30
+            )
+            self._session = aiohttp.ClientSession(
+                headers=self._headers, connector=connector, timeout=self.timeout
+            )
+        return self._session
+
+    async def get(self, url_end: str, params: Dict[str, Any]) -> Tuple[int, Any]:
+        """
+        Выполняет GET-запрос к API через пул соединений. Ответ не в формате JSON (например, HTML-страница
+        ошибки 502 от прокси-сервера) возвращается как None вместе с кодом ответа, чтобы ошибка сервера
+        обрабатывалась по коду ответа.
+
+        Args:
+            url_end (str): Конечная часть URL, которая добавляется к основному хосту API.
+            params (Dict[str, Any]): Параметры запроса.
+
+        Returns:
+            Tuple[int, Any]: Код ответа сервера и JSON-ответ либо None, если ответ не в формате JSON.
+        """
+        async with self._get_session().get(
+            f"{self.host_api}{url_end}", params=encode_params(params)
+        ) as response:
+            status, body = response.status, await response.read()
+        try:
+            return status, json.loads(body)
+        except ValueError:
+            return status, None
+
+    async def close(self) -> None:
+        """
+        Закрывает сессию aiohttp и все соединения пула.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+
+async_client = AsyncApiClient(site)
+
+async_request_coalescer = AsyncSingleFlight()
+
+
+async def _get_with_retries(params: Dict[str, Any], url_end: str, priority: int) -> Tuple[int, Any]:
+    """
+    Асинхронный вариант `site_API.core._get_with_retries`: выполняет GET-запрос к API с повторами
+    через общие с синхронным клиентом выключатель запросов, ограничитель частоты запросов и учет лимита.
+
+    Args:
+        params (Dict[str, Any]): Параметры запроса.
+        url_end (str): Конечная часть URL запроса.
+        priority (int): Приоритет запроса: PRIORITY_INTERACTIVE либо PRIORITY_BACKGROUND.
+
+    Returns:
+        Tuple[int, Any]: Код ответа сервера и JSON-ответ.
+
+    Raises:
+        ApiRateLimitError: Если попытка не дождалась разрешения ограничителя частоты запросов.
+        ApiUnavailableError: Если выключатель запросов разомкнут.
+        ConnectionError: Если все попытки завершились сбоем соединения или таймаутом.
+    """
+    attempt = 0
+    while True:
+        probe = breaker.before_call()
+        recorded = False
+        try:
+            await rate_limiter.acquire_async(priority, timeout=site.api_timeout)
+            status, data = await async_client.get(url_end, params)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
+            breaker.record_failure()
+            recorded = True
+            if attempt >= site.api_max_retries or breaker.is_open:
+                raise ConnectionError(f"Не удалось установить соединение с сервером: {type(exc).__name__}")
+        else:
+            if status >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            recorded = True
+            # Учет лимита и кэш ответов сохраняются в SQLite: запись выполняется в пуле потоков,
+            # чтобы не останавливать цикл событий
+            await asyncio.to_thread(quota.record)
+            if status not in RETRY_STATUS_CODES or attempt >= site.api_max_retries or breaker.is_open:
+                return status, data
+        finally:
+            # Отказ ограничителя частоты запросов, отмененный запрос или непредвиденная ошибка не должны
+            # оставлять пробный запрос выключателя незавершенным
+            if probe and not recorded:
+                breaker.release_probe()
+
+        await asyncio.sleep(backoff_delay(attempt))
+        attempt += 1
+
+
+async def _request_and_cache(params: Dict[str, Any], url_end: str, priority: int) -> dict[str, Any] | None:
+    """
+    Асинхронно выполняет запрос к API с повторами и сохраняет успешный ответ в кэше ответов.
+
+    Args:
+        params (Dict[str, Any]): Параметры запроса.
+        url_end (str): Конечная часть URL запроса.
+        priority (int): Приоритет запроса: PRIORITY_INTERACTIVE либо PRIORITY_BACKGROUND.
+
+    Returns:
+        dict[str, Any] | None: JSON-ответ от API либо None при отсутствии ответа.
+    """
+    status, data = await _get_with_retries(params, url_end, priority)
+    if status == 403:
+        await asyncio.to_thread(quota.mark_exhausted)
+    if isinstance(data, dict) and "docs" in data:
+        await asyncio.to_thread(response_cache.set, url_end, params, data)
+    return data
+
+
+@async_error_logger_func
+async def async_api_request(
+    params: Dict[str, Any], url_end: str, priority: int = PRIORITY_INTERACTIVE
+) -> dict[str, Any] | None:
+    """
+    Асинхронный вариант `site_API.core.api_request` с тем же поведением: общий кэш ответов, объединение
+    одинаковых запросов, ограничение частоты запросов, учет суточного лимита и выключатель запросов.
+    Запрос можно отменить вместе с ожидающей его задачей.
+
+    Args:
+        params (Dict[str, Any]): Словарь с параметрами запроса для передачи в строку запроса URL.
+        url_end (str): Конечная часть URL, которая добавляется к основному хосту API.
+        priority (int): Приоритет запроса: PRIORITY_INTERACTIVE (по умолчанию) либо PRIORITY_BACKGROUND.
+
+    Returns:
+        dict[str, Any] | None: JSON-ответ от API в виде словаря с данными фильмов. В случае отсутствия JSON-ответ
+            возвращается None.
+
+    Raises:
+        ApiQuotaExceededError: Если суточный лимит запросов почти исчерпан, а ответа в кэше нет.
+    """
+    cached = response_cache.get(url_end, params)
+    if cached is not None:
+        return cached
+
+    if quota.is_nearly_exhausted():
+        stale = response_cache.get_stale(url_end, params)
+        if stale is not None:
+            return stale
+        raise ApiQuotaExceededError("Суточный лимит запросов к серверу почти исчерпан")
+
+    return await async_request_coalescer.do(
+        make_cache_key(url_end, params), lambda: _request_and_cache(params, url_end, priority)
+    )
@@ -0,0 +1,125 @@
+import time
+from threading import Lock
+from typing import Any, Dict
+
+from logs.exceptions import ApiUnavailableError
+from logs.logging_config import log
+
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Автоматический выключатель запросов к API. После `failure_threshold` сбоев подряд (ошибки соединения,
+    таймауты, ошибки сервера) выключатель размыкается, и запросы завершаются сразу, без ожидания таймаута.
+    Через `reset_timeout` секунд выключатель пропускает один пробный запрос: при его успехе выключатель
+    замыкается, при сбое снова размыкается до следующей попытки.
+
+    Attributes:
+        failure_threshold (int): Количество сбоев подряд, после которого выключатель размыкается.
+        reset_timeout (float): Время в секундах до пробного запроса после размыкания.
+        trips (int): Количество размыканий выключателя.
+        rejected (int): Количество запросов, отклоненных разомкнутым выключателем.
+    """
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.trips = 0
+        self.rejected = 0
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = Lock()
+
+    def before_call(self) -> bool:
+        """
+        Проверяет, можно ли выполнить запрос к API.
+
+        Returns:
+            bool: True, если запрос пробный: его результат нужно учесть методом `record_success`
+                или `record_failure` либо освободить методом `release_probe`.
+
+        Raises:
+            ApiUnavailableError: Если выключатель разомкнут либо пробный запрос уже выполняется.
+        """
+        with self._lock:
+            if self._state == STATE_CLOSED:
+                return False
+            if (
+                self._state == STATE_OPEN
+                and time.monotonic() - self._opened_at >= self.reset_timeout
+            ):
+                self._state = STATE_HALF_OPEN
+            if self._state == STATE_HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.rejected += 1
+        raise ApiUnavailableError
+
+    def record_success(self) -> None:
+        """
+        Учитывает успешный запрос: сбрасывает счетчик сбоев и замыкает выключатель.
+        """
+        with self._lock:
+            if self._state != STATE_CLOSED:
+                log.info("Связь с API восстановлена, выключатель запросов замкнут.")
+            self._state = STATE_CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """
+        Учитывает сбой запроса и размыкает выключатель, если достигнут порог сбоев либо не удался пробный запрос.
+        """
+        with self._lock:
+            self._failures += 1
+            if self._state == STATE_HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != STATE_OPEN:
+                    self.trips += 1
+                    log.error(
+                        f"API недоступен ({self._failures} сбоев подряд), выключатель запросов разомкнут "
+                        f"на {self.reset_timeout} с."
+                    )
+                self._state = STATE_OPEN
+                self._opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """
+        Освобождает пробный запрос, прерванный без результата (отмена, непредвиденная ошибка): состояние
+        выключателя не меняется, и пробным становится следующий запрос.
+        """
+        with self._lock:
+            self._probe_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        """
+        bool: True, если выключатель разомкнут и запросы к API не выполняются.
+        """
+        with self._lock:
+            return self._state == STATE_OPEN
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Возвращает состояние выключателя для мониторинга.
+
+        Returns:
+            Dict[str, Any]: Состояние (`closed`, `open` или `half_open`), количество сбоев подряд, количество
+                размыканий и отклоненных запросов, время в секундах до пробного запроса.
+        """
+        with self._lock:
+            next_probe_in = 0.0
+            if self._state == STATE_OPEN:
+                next_probe_in = max(self.reset_timeout - (time.monotonic() - self._opened_at), 0.0)
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "trips": self.trips,
+                "rejected": self.rejected,
+                "next_probe_in": round(next_probe_in, 1),
+            }
@@ -1,34 +1,339 @@
+import random
+import time
+from threading import Lock
 from typing import Any, Dict
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 
 from config_data.config import SiteSettings
+from logs.exceptions import ApiQuotaExceededError
 from services.services_logging import error_logger_func
+from site_API.circuit_breaker import CircuitBreaker
+from site_API.keep_ratio import KeepRatioTracker
+from site_API.rate_limiter import PRIORITY_INTERACTIVE, QuotaAccountant, TokenBucketLimiter
+from site_API.response_cache import ResponseCache, make_cache_key
+from site_API.single_flight import SingleFlight
 
 
 site = SiteSettings()
 
 
+class PoolStats:
+    """
+    Потокобезопасные счетчики использования пула соединений клиента API.
+
+    Attributes:
+        new_connections (int): Количество открытых новых соединений (DNS, TCP и TLS заново).
+        checkouts (int): Количество выдач соединения из пула под запрос.
+        waits (int): Количество ожиданий свободного соединения при исчерпании пула.
+    """
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.new_connections = 0
+        self.checkouts = 0
+        self.waits = 0
+
+    def increment(self, counter: str) -> None:
+        """
+        Увеличивает на единицу указанный счетчик.
+
+        Args:
+            counter (str): Название счетчика (`new_connections`, `checkouts` или `waits`).
+        """
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def snapshot(self) -> Dict[str, int]:
+        """
+        Возвращает текущие значения счетчиков.
+
+        Returns:
+            Dict[str, int]: Счетчики `new_connections`, `reuses` (повторно использованные keep-alive соединения)
+                и `waits`.
+        """
+        with self._lock:
+            return {
+                "new_connections": self.new_connections,
+                "reuses": self.checkouts - self.new_connections,
+                "waits": self.waits,
+            }
+
+
+class _CountingPoolMixin:
+    """
+    Примесь к пулам соединений urllib3, которая учитывает выдачу, создание соединений и ожидание свободного
+    соединения в статистике `stats`.
+    """
+    stats: PoolStats
+
+    def _get_conn(self, timeout: float | None = None):
+        if self.pool is not None and self.pool.empty():
+            self.stats.increment("waits")
+        self.stats.increment("checkouts")
+        return super()._get_conn(timeout)
+
+    def _new_conn(self):
+        self.stats.increment("new_connections")
+        return super()._new_conn()
+
+
+class _CountingHTTPAdapter(HTTPAdapter):
+    """
+    HTTP-адаптер requests, создающий пулы соединений с учетом статистики их использования.
+    """
+    def __init__(self, stats: PoolStats, **kwargs) -> None:
+        self.stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs) -> None:
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: type(f"Counting{pool.__name__}", (_CountingPoolMixin, pool), {"stats": self.stats})
+            for scheme, pool in (("http", HTTPConnectionPool), ("https", HTTPSConnectionPool))
+        }
+
+
+class ApiClient:
+    """
+    Долгоживущий клиент API Кинопоиск с пулом keep-alive соединений. Адрес API и ключ доступа привязываются
+    к клиенту один раз при запуске.
+
+    Attributes:
+        host_api (str): Базовый URL для доступа к API.
+        timeout (Tuple[float, float]): Таймауты установки соединения и чтения ответа в секундах.
+        stats (PoolStats): Статистика использования пула соединений.
+        session (requests.Session): Сессия requests с подключенным пулом соединений.
+    """
+    def __init__(self, settings: SiteSettings) -> None:
+        self.host_api = settings.host_api
+        self.timeout = (settings.api_connect_timeout, settings.api_timeout)
+        self.stats = PoolStats()
+
+        self.session = requests.Session()
+        self.session.headers.update(
+            {
+                "accept": "application/json",
+                "X-API-KEY": settings.api_key.get_secret_value(),
+            }
+        )
+        adapter = _CountingHTTPAdapter(
+            self.stats,
+            pool_connections=settings.api_pool_connections,
+            pool_maxsize=settings.api_pool_maxsize,
+            pool_block=settings.api_pool_block,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, url_end: str, params: Dict[str, Any]) -> requests.Response:
+        """
+        Выполняет GET-запрос к API через пул соединений.
+
+        Args:
+            url_end (str): Конечная часть URL, которая добавляется к основному хосту API.
+            params (Dict[str, Any]): Параметры запроса.
+
+        Returns:
+            requests.Response: Ответ сервера.
+        """
+        return self.session.get(f"{self.host_api}{url_end}", params=params, timeout=self.timeout)
+
+    def pool_stats(self) -> Dict[str, int]:
+        """
+        Возвращает статистику использования пула соединений.
+
+        Returns:
+            Dict[str, int]: Количество новых соединений, повторных использований и ожиданий свободного соединения.
+        """
+        return self.stats.snapshot()
+
+    def close(self) -> None:
+        """
+        Закрывает все соединения пула.
+        """
+        self.session.close()
+
+
+client = ApiClient(site)
+
+response_cache = ResponseCache(
+    max_entries=site.api_cache_size,
+    ttl_by_endpoint={
+        "/v1.4/movie/search": site.api_cache_ttl_search,
+        "/v1.4/movie": site.api_cache_ttl_filters,
+    },
+    persist=site.api_cache_persist,
+)
+
+request_coalescer = SingleFlight()
+
+rate_limiter = TokenBucketLimiter(rate=site.api_rate_limit, burst=site.api_rate_burst)
+
+quota = QuotaAccountant(daily_limit=site.api_daily_quota, reserve=site.api_quota_reserve)
+
+breaker = CircuitBreaker(failure_threshold=site.api_breaker_threshold, reset_timeout=site.api_breaker_reset)
+
+keep_ratio = KeepRatioTracker(
+    base_limit=site.api_search_limit, max_limit=site.api_search_max_limit, target=site.api_search_target
+)
+
+# Коды ответа сервера, при которых запрос повторяется
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def backoff_delay(attempt: int) -> float:
+    """
+    Вычисляет задержку перед повтором запроса: экспоненциальный рост от `api_backoff_base`, ограниченный
+    `api_backoff_max`, со случайным разбросом от нуля до этого значения (full jitter), чтобы повторы
+    разных потоков не совпадали по времени.
+
+    Args:
+        attempt (int): Номер повтора, начиная с 0.
+
+    Returns:
+        float: Задержка в секундах.
+    """
+    return random.uniform(0, min(site.api_backoff_max, site.api_backoff_base * 2 ** attempt))
+
+
+def _get_with_retries(params: Dict[str, Any], url_end: str, priority: int) -> requests.Response:
+    """
+    Выполняет GET-запрос к API с повторами при сбоях соединения, таймаутах и ошибках сервера. Повторяются
+    только GET-запросы, поскольку они идемпотентны. Каждая попытка проходит через автоматический выключатель
+    запросов и ограничитель частоты запросов и учитывается в расходе суточного лимита.
+
+    Args:
+        params (Dict[str, Any]): Параметры запроса.
+        url_end (str): Конечная часть URL запроса.
+        priority (int): Приоритет запроса: PRIORITY_INTERACTIVE либо PRIORITY_BACKGROUND.
+
+    Returns:
+        requests.Response: Ответ сервера (последней попытки, если все попытки завершились ошибкой сервера).
+
+    Raises:
+        ApiRateLimitError: Если попытка не дождалась разрешения ограничителя частоты запросов.
+        ApiUnavailableError: Если выключатель запросов разомкнут.
+        ConnectionError: Если все попытки завершились сбоем соединения или таймаутом.
+    """
+    attempt = 0
+    while True:
+        # Разомкнутый выключатель отклоняет запрос сразу, не ожидая токена ограничителя частоты запросов.
+        # Если токен не получен, пробный запрос выключателя освобождается в блоке finally
+        probe = breaker.before_call()
+        recorded = False
+        try:
+            rate_limiter.acquire(priority, timeout=site.api_timeout)
+            response = client.get(url_end, params)
+        except (requests.ConnectionError, requests.Timeout) as exc:
+            breaker.record_failure()
+            recorded = True
+            if attempt >= site.api_max_retries or breaker.is_open:
+                raise ConnectionError(f"Не удалось установить соединение с сервером: {type(exc).__name__}")
+        else:
+            if response.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            recorded = True
+            quota.record()
+            if (
+                response.status_code not in RETRY_STATUS_CODES
+                or attempt >= site.api_max_retries
+                or breaker.is_open
+            ):
+                return response
+        finally:
+            if probe and not recorded:
+                breaker.release_probe()
+
+        time.sleep(backoff_delay(attempt))
+        attempt += 1
+
+
+def _request_and_cache(params: Dict[str, Any], url_end: str, priority: int) -> dict[str, Any] | None:
+    """
+    Выполняет запрос к API с повторами и сохраняет успешный ответ в кэше ответов.
+
+    Args:
+        params (Dict[str, Any]): Параметры запроса.
+        url_end (str): Конечная часть URL запроса.
+        priority (int): Приоритет запроса: PRIORITY_INTERACTIVE либо PRIORITY_BACKGROUND.
+
+    Returns:
+        dict[str, Any] | None: JSON-ответ от API либо None при отсутствии ответа.
+    """
+    response = _get_with_retries(params, url_end, priority)
+    if response.status_code == 403:
+        quota.mark_exhausted()
+
+    if response.status_code:
+        data = response.json()
+        if isinstance(data, dict) and "docs" in data:
+            response_cache.set(url_end, params, data)
+        return data
+    return None
+
+
 @error_logger_func
-def api_request(params: Dict[str, Any], url_end: str) -> dict[str, Any] | None:
+def api_request(
+    params: Dict[str, Any], url_end: str, priority: int = PRIORITY_INTERACTIVE
+) -> dict[str, Any] | None:
     """
     Выполняет GET-запрос к API с использованием заданных параметров и возвращает результат в формате JSON.
+    Успешные ответы (содержащие перечень фильмов `docs`) сохраняются в общем кэше ответов и при повторном
+    запросе с теми же параметрами возвращаются из него без обращения к API. Одновременные одинаковые запросы
+    объединяются: выполняется один запрос к API, и его ответ получают все ожидающие потоки.
+
+    Запросы к API проходят через ограничитель частоты запросов, в котором интерактивные запросы пользователей
+    обслуживаются раньше фоновых. Когда суточный лимит запросов почти исчерпан, ответы выдаются только из кэша
+    (в том числе с истекшим временем жизни).
 
     Args:
         params (Dict[str, Any]): Словарь с параметрами запроса для передачи в строку запроса URL.
         url_end (str): Конечная часть URL, которая добавляется к основному хосту API.
+        priority (int): Приоритет запроса: PRIORITY_INTERACTIVE (по умолчанию) либо PRIORITY_BACKGROUND.
 
     Returns:
         dict[str, Any] | None: JSON-ответ от API в виде словаря с данными фильмов. В случае отсутствия JSON-ответ
             возвращается None.
+
+    Raises:
+        ApiQuotaExceededError: Если суточный лимит запросов почти исчерпан, а ответа в кэше нет.
+        ApiRateLimitError: Если запрос не дождался разрешения ограничителя частоты запросов.
+        ApiUnavailableError: Если после серии сбоев запросы к API временно не выполняются.
     """
-    url = f"{site.host_api}{url_end}"
-    headers = {
-        "accept": "application/json",
-        "X-API-KEY": site.api_key.get_secret_value(),
-    }
-    response = requests.get(url, headers=headers, params=params, timeout=10)
+    cached = response_cache.get(url_end, params)
+    if cached is not None:
+        return cached
 
-    if response.status_code:
-        return response.json()
-    return None
+    if quota.is_nearly_exhausted():
+        stale = response_cache.get_stale(url_end, params)
+        if stale is not None:
+            return stale
+        raise ApiQuotaExceededError("Суточный лимит запросов к серверу почти исчерпан")
+
+    return request_coalescer.do(
+        make_cache_key(url_end, params), lambda: _request_and_cache(params, url_end, priority)
+    )
+
+
+def api_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Собирает статистику клиента API для мониторинга.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Статистика пула соединений, кэша ответов, объединения запросов, ограничителя
+            частоты запросов, расхода суточного лимита, состояние выключателя запросов и доля фильмов,
+            остающихся после отбора, по типам поиска.
+    """
+    return {
+        "pool": client.pool_stats(),
+        "cache": response_cache.stats(),
+        "coalescing": request_coalescer.stats(),
+        "rate_limiter": rate_limiter.stats(),
+        "quota": quota.stats(),
+        "breaker": breaker.stats(),
+        "keep_ratio": keep_ratio.stats(),
+    }
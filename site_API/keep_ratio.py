@@ -0,0 +1,82 @@
+import math
+from threading import Lock
+from typing import Dict
+
+
+class KeepRatioTracker:
+    """
+    Учет доли фильмов, остающихся в ответе API после отбора (наличие описания, совпадение названия с поисковым
+    запросом), для каждого типа поиска. Доля сглаживается экспоненциальным скользящим средним и используется
+    для выбора размера страницы запроса `limit`, при котором после отбора остается около `target` фильмов.
+
+    Attributes:
+        base_limit (int): Размер страницы запроса по умолчанию и минимальный размер страницы.
+        max_limit (int): Максимальный размер страницы запроса.
+        target (int): Желаемое количество фильмов на странице после отбора.
+        step (int): Шаг округления размера страницы (чтобы запросы разных пользователей чаще совпадали в кэше).
+        alpha (float): Вес нового наблюдения в скользящем среднем.
+    """
+    def __init__(
+        self,
+        base_limit: int,
+        max_limit: int,
+        target: int,
+        step: int = 5,
+        alpha: float = 0.2,
+    ) -> None:
+        self.base_limit = base_limit
+        self.max_limit = max(max_limit, base_limit)
+        self.target = target
+        self.step = step
+        self.alpha = alpha
+        self._ratios: Dict[str, float] = {}
+        self._lock = Lock()
+
+    def record(self, type_search: str, fetched: int, kept: int) -> None:
+        """
+        Учитывает результат отбора фильмов из одной страницы ответа API.
+
+        Args:
+            type_search (str): Тип поиска. Возможные значения: `movie_by_filters` или `movie_search`.
+            fetched (int): Количество фильмов в ответе API.
+            kept (int): Количество фильмов, оставшихся после отбора.
+        """
+        if fetched <= 0:
+            return
+        ratio = kept / fetched
+        with self._lock:
+            previous = self._ratios.get(type_search)
+            self._ratios[type_search] = (
+                ratio if previous is None else previous + self.alpha * (ratio - previous)
+            )
+
+    def limit_for(self, type_search: str) -> int:
+        """
+        Вычисляет размер страницы запроса для типа поиска по накопленной доле оставшихся фильмов.
+
+        Args:
+            type_search (str): Тип поиска. Возможные значения: `movie_by_filters` или `movie_search`.
+
+        Returns:
+            int: Размер страницы запроса от `base_limit` до `max_limit`, кратный `step`.
+        """
+        with self._lock:
+            ratio = self._ratios.get(type_search)
+        if not ratio:
+            return self.base_limit if ratio is None else self.max_limit
+        limit = math.ceil(self.target / ratio / self.step) * self.step
+        return min(max(limit, self.base_limit), self.max_limit)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Возвращает накопленную долю оставшихся фильмов и текущий размер страницы запроса для каждого типа поиска.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Доля оставшихся фильмов (`keep_ratio`) и размер страницы (`limit`).
+        """
+        with self._lock:
+            ratios = dict(self._ratios)
+        return {
+            type_search: {"keep_ratio": round(ratio, 3), "limit": self.limit_for(type_search)}
+            for type_search, ratio in ratios.items()
+        }
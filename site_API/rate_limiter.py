@@ -0,0 +1,233 @@
+import asyncio
+import time
+from datetime import date
+from threading import Condition, Lock
+from typing import Dict
+
+from database.common.model_api_cache import ApiQuota, db_api_cache
+from logs.exceptions import ApiRateLimitError
+from logs.logging_config import log
+
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+
+class TokenBucketLimiter:
+    """
+    Ограничитель частоты запросов к API по алгоритму "корзины токенов": допускает кратковременные всплески
+    до `burst` запросов, а в среднем пропускает не более `rate` запросов в секунду. Интерактивные запросы
+    пользователей (PRIORITY_INTERACTIVE) получают токены раньше фоновых (PRIORITY_BACKGROUND): пока есть
+    ожидающие интерактивные запросы, фоновые запросы токен не получают.
+
+    Attributes:
+        rate (float): Скорость пополнения корзины (запросов в секунду).
+        burst (int): Вместимость корзины.
+        waits (int): Количество запросов, которым пришлось ожидать токен.
+        rejected (int): Количество запросов, не дождавшихся токена.
+    """
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.waits = 0
+        self.rejected = 0
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._interactive_waiting = 0
+        self._condition = Condition()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _take(self, interactive: bool) -> float:
+        """
+        Забирает токен, если он доступен запросу с данным приоритетом. Вызывается под блокировкой.
+
+        Args:
+            interactive (bool): True для интерактивного запроса.
+
+        Returns:
+            float: 0, если токен получен, иначе время в секундах до следующей попытки.
+        """
+        self._refill()
+        if (interactive or self._interactive_waiting == 0) and self._tokens >= 1:
+            self._tokens -= 1
+            return 0
+        return max((1 - self._tokens) / self.rate, 0.01)
+
+    def acquire(self, priority: int = PRIORITY_INTERACTIVE, timeout: float = 10) -> None:
+        """
+        Забирает токен из корзины, при необходимости ожидая его появления.
+
+        Args:
+            priority (int): Приоритет запроса: PRIORITY_INTERACTIVE либо PRIORITY_BACKGROUND.
+            timeout (float): Максимальное время ожидания токена в секундах.
+
+        Raises:
+            ApiRateLimitError: Если токен не получен за время `timeout`.
+        """
+        deadline = time.monotonic() + timeout
+        interactive = priority == PRIORITY_INTERACTIVE
+        waited = False
+
+        with self._condition:
+            if interactive:
+                self._interactive_waiting += 1
+            try:
+                while True:
+                    delay = self._take(interactive)
+                    if not delay:
+                        if waited:
+                            self.waits += 1
+                        return
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.rejected += 1
+                        raise ApiRateLimitError
+                    waited = True
+                    self._condition.wait(min(remaining, delay))
+            finally:
+                if interactive:
+                    self._interactive_waiting -= 1
+                    self._condition.notify_all()
+
+    async def acquire_async(self, priority: int = PRIORITY_INTERACTIVE, timeout: float = 10) -> None:
+        """
+        Асинхронный вариант `acquire`: ожидает токен в цикле событий (`asyncio.sleep`), не занимая поток.
+        Корзина и очередность приоритетов общие с синхронными запросами.
+
+        Args:
+            priority (int): Приоритет запроса: PRIORITY_INTERACTIVE либо PRIORITY_BACKGROUND.
+            timeout (float): Максимальное время ожидания токена в секундах.
+
+        Raises:
+            ApiRateLimitError: Если токен не получен за время `timeout`.
+        """
+        deadline = time.monotonic() + timeout
+        interactive = priority == PRIORITY_INTERACTIVE
+        waited = False
+
+        if interactive:
+            with self._condition:
+                self._interactive_waiting += 1
+        try:
+            while True:
+                with self._condition:
+                    delay = self._take(interactive)
+                    if not delay:
+                        if waited:
+                            self.waits += 1
+                        return
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.rejected += 1
+                        raise ApiRateLimitError
+                waited = True
+                await asyncio.sleep(min(remaining, delay))
+        finally:
+            if interactive:
+                with self._condition:
+                    self._interactive_waiting -= 1
+                    self._condition.notify_all()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Возвращает статистику ограничителя.
+
+        Returns:
+            Dict[str, float]: Количество доступных токенов, ожиданий и отклоненных запросов.
+        """
+        with self._condition:
+            self._refill()
+            return {"tokens": round(self._tokens, 2), "waits": self.waits, "rejected": self.rejected}
+
+
+class QuotaAccountant:
+    """
+    Учет расхода суточного лимита запросов к API. Расход сохраняется в базе данных SQLite, поэтому
+    при перезапуске бота учет продолжается с сохраненного значения.
+
+    Attributes:
+        daily_limit (int): Суточный лимит запросов для ключа API.
+        reserve (int): Запас запросов, при достижении которого бот переходит на ответы только из кэша.
+    """
+    def __init__(self, daily_limit: int, reserve: int) -> None:
+        self.daily_limit = daily_limit
+        self.reserve = reserve
+        self._lock = Lock()
+
+        db_api_cache.connect(reuse_if_open=True)
+        db_api_cache.create_tables([ApiQuota])
+        self._day = date.today()
+        row = ApiQuota.get_or_none(ApiQuota.day == self._day)
+        self._used = row.used if row else 0
+
+    def _roll_day(self) -> None:
+        today = date.today()
+        if today != self._day:
+            self._day = today
+            self._used = 0
+
+    @property
+    def remaining(self) -> int:
+        """
+        int: Количество запросов, оставшихся до исчерпания суточного лимита.
+        """
+        with self._lock:
+            self._roll_day()
+            return max(self.daily_limit - self._used, 0)
+
+    def is_nearly_exhausted(self) -> bool:
+        """
+        Проверяет, что оставшийся лимит запросов не превышает запаса `reserve`.
+
+        Returns:
+            bool: True, если запросы к API следует обслуживать только из кэша.
+        """
+        return self.remaining <= self.reserve
+
+    def record(self, count: int = 1) -> None:
+        """
+        Учитывает выполненные запросы к API и сохраняет расход лимита в базе данных. После сохранения расход
+        перечитывается из базы данных, чтобы учитывать запросы других процессов бота (режим супервизора).
+
+        Args:
+            count (int): Количество выполненных запросов. По умолчанию 1.
+        """
+        with self._lock:
+            self._roll_day()
+            self._used += count
+            day = self._day
+        ApiQuota.insert(day=day, used=count).on_conflict(
+            conflict_target=[ApiQuota.day], update={ApiQuota.used: ApiQuota.used + count}
+        ).execute()
+        used = ApiQuota.select(ApiQuota.used).where(ApiQuota.day == day).scalar()
+        with self._lock:
+            if self._day == day and used is not None:
+                self._used = max(self._used, used)
+
+    def mark_exhausted(self) -> None:
+        """
+        Отмечает суточный лимит исчерпанным (например, если сервер ответил отказом по лимиту раньше,
+        чем его исчерпал локальный учет).
+        """
+        with self._lock:
+            self._roll_day()
+            count = max(self.daily_limit - self._used, 0)
+        if count:
+            log.info("Сервер сообщил об исчерпании суточного лимита запросов к API.")
+            self.record(count)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Возвращает статистику расхода суточного лимита.
+
+        Returns:
+            Dict[str, int]: Суточный лимит, количество использованных и оставшихся запросов.
+        """
+        remaining = self.remaining
+        return {"daily_limit": self.daily_limit, "used": self.daily_limit - remaining, "remaining": remaining}
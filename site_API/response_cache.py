@@ -0,0 +1,175 @@
+import json
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Tuple
+
+from database.common.model_api_cache import ApiResponse, db_api_cache
+from logs.logging_config import log
+
+
+def make_cache_key(endpoint: str, params: Dict[str, Any]) -> str:
+    """
+    Формирует канонический ключ запроса к API. Параметры со значением None отбрасываются (requests их
+    не передает), значения приводятся к строкам, а списки значений сортируются, так как порядок
+    фильтров и полей на ответ сервера не влияет.
+
+    Args:
+        endpoint (str): Конечная точка API.
+        params (Dict[str, Any]): Параметры запроса, включая номер страницы.
+
+    Returns:
+        str: Ключ запроса в виде JSON-строки.
+    """
+    canonical = {}
+    for name, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple, set)):
+            canonical[name] = sorted(str(item) for item in value)
+        else:
+            canonical[name] = str(value)
+    return json.dumps([endpoint, canonical], ensure_ascii=False, sort_keys=True)
+
+
+class ResponseCache:
+    """
+    Общий для всех пользователей кэш ответов API с вытеснением по LRU при превышении размера
+    и временем жизни записей, задаваемым для каждой конечной точки API. При необходимости записи
+    сохраняются в базе данных SQLite, чтобы после перезапуска бота кэш был заполнен.
+
+    Attributes:
+        max_entries (int): Максимальное количество записей в кэше.
+        ttl_by_endpoint (Dict[str, float]): Время жизни записей в секундах для каждой конечной точки API.
+        default_ttl (float): Время жизни записей для конечных точек, отсутствующих в `ttl_by_endpoint`.
+        persist (bool): Сохранять ли записи в базе данных SQLite.
+        hits (int): Количество запросов, обслуженных из кэша.
+        misses (int): Количество запросов, для которых в кэше не нашлось актуальной записи.
+        evictions (int): Количество записей, вытесненных из кэша по LRU.
+    """
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_by_endpoint: Dict[str, float],
+        default_ttl: float = 60 * 60,
+        persist: bool = False,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_by_endpoint = ttl_by_endpoint
+        self.default_ttl = default_ttl
+        self.persist = persist
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, Tuple[str, float, Dict[str, Any]]] = OrderedDict()
+        self._lock = Lock()
+
+        if self.persist:
+            db_api_cache.connect(reuse_if_open=True)
+            db_api_cache.create_tables([ApiResponse])
+            self._load()
+
+    def _ttl(self, endpoint: str) -> float:
+        return self.ttl_by_endpoint.get(endpoint, self.default_ttl)
+
+    def _load(self) -> None:
+        """
+        Загружает из базы данных SQLite актуальные записи, начиная с самых свежих, в пределах размера кэша.
+        """
+        rows = (
+            ApiResponse.select()
+            .order_by(ApiResponse.created_at.desc())
+            .limit(self.max_entries)
+        )
+        now = time.time()
+        for row in reversed(list(rows)):
+            if now - row.created_at < self._ttl(row.endpoint):
+                self._entries[row.key] = (row.endpoint, row.created_at, json.loads(row.payload))
+        log.info(f"Кэш ответов API загружен из базы данных: {len(self._entries)} записей.")
+
+    def get(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any] | None:
+        """
+        Возвращает сохраненный ответ API, если он есть в кэше и его время жизни не истекло.
+
+        Args:
+            endpoint (str): Конечная точка API.
+            params (Dict[str, Any]): Параметры запроса.
+
+        Returns:
+            Dict[str, Any] | None: JSON-ответ API либо None, если актуальной записи нет.
+        """
+        key = make_cache_key(endpoint, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.time() - entry[1] >= self._ttl(endpoint):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def get_stale(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any] | None:
+        """
+        Возвращает сохраненный ответ API независимо от его времени жизни. Вызывается после промаха `get`
+        (например, когда суточный лимит запросов почти исчерпан), поэтому статистику попаданий и промахов
+        не изменяет.
+
+        Args:
+            endpoint (str): Конечная точка API.
+            params (Dict[str, Any]): Параметры запроса.
+
+        Returns:
+            Dict[str, Any] | None: JSON-ответ API либо None, если записи нет.
+        """
+        key = make_cache_key(endpoint, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[2]
+
+    def set(self, endpoint: str, params: Dict[str, Any], payload: Dict[str, Any]) -> None:
+        """
+        Сохраняет ответ API в кэше, вытесняя давно не использованные записи при превышении размера кэша.
+
+        Args:
+            endpoint (str): Конечная точка API.
+            params (Dict[str, Any]): Параметры запроса.
+            payload (Dict[str, Any]): JSON-ответ API.
+        """
+        key = make_cache_key(endpoint, params)
+        created_at = time.time()
+        evicted = []
+        with self._lock:
+            self._entries[key] = (endpoint, created_at, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted.append(self._entries.popitem(last=False)[0])
+                self.evictions += 1
+
+        if self.persist:
+            with db_api_cache.atomic():
+                ApiResponse.insert(
+                    key=key,
+                    endpoint=endpoint,
+                    payload=json.dumps(payload, ensure_ascii=False),
+                    created_at=created_at,
+                ).on_conflict_replace().execute()
+                if evicted:
+                    ApiResponse.delete().where(ApiResponse.key.in_(evicted)).execute()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Возвращает статистику использования кэша.
+
+        Returns:
+            Dict[str, int]: Количество попаданий, промахов, вытеснений и текущий размер кэша.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
@@ -0,0 +1,147 @@
+import asyncio
+from threading import Event, Lock
+from typing import Any, Awaitable, Callable, Dict, List
+
+
+class _Call:
+    """
+    Выполняющийся запрос, результат которого ожидают все обратившиеся с тем же ключом потоки.
+    """
+    def __init__(self) -> None:
+        self.done = Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Объединение одновременных одинаковых запросов: пока запрос с некоторым ключом выполняется,
+    остальные потоки с тем же ключом не выполняют его повторно, а ожидают и получают тот же результат.
+
+    Attributes:
+        calls (int): Количество выполненных запросов.
+        collapsed (int): Количество запросов, объединенных с уже выполняющимся запросом.
+    """
+    def __init__(self) -> None:
+        self.calls = 0
+        self.collapsed = 0
+        self._in_flight: Dict[str, _Call] = {}
+        self._lock = Lock()
+
+    def do(self, key: str, func: Callable[[], Any]) -> Any:
+        """
+        Выполняет функцию `func` либо, если запрос с тем же ключом уже выполняется, ожидает его результат.
+
+        Args:
+            key (str): Ключ запроса.
+            func (Callable[[], Any]): Функция, выполняющая запрос.
+
+        Returns:
+            Any: Результат функции `func`, общий для всех ожидавших его потоков.
+
+        Raises:
+            BaseException: Исключение, возникшее при выполнении `func`, пробрасывается во все ожидавшие потоки.
+        """
+        with self._lock:
+            call = self._in_flight.get(key)
+            if call is not None:
+                self.collapsed += 1
+                leader = False
+            else:
+                call = _Call()
+                self._in_flight[key] = call
+                self.calls += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+        else:
+            try:
+                call.result = func()
+            except BaseException as exc:
+                call.error = exc
+            finally:
+                with self._lock:
+                    del self._in_flight[key]
+                call.done.set()
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Возвращает статистику объединения запросов.
+
+        Returns:
+            Dict[str, int]: Количество выполненных запросов, объединенных запросов и выполняющихся в данный
+                момент запросов.
+        """
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "collapsed": self.collapsed,
+                "in_flight": len(self._in_flight),
+            }
+
+
+class AsyncSingleFlight:
+    """
+    Объединение одновременных одинаковых запросов для асинхронного клиента: пока запрос с некоторым ключом
+    выполняется, остальные корутины с тем же ключом ожидают ту же задачу. Отмена одной из ожидающих корутин
+    не отменяет общую задачу, поэтому остальные ожидающие получают результат.
+
+    Attributes:
+        calls (int): Количество выполненных запросов.
+        collapsed (int): Количество запросов, объединенных с уже выполняющимся запросом.
+    """
+    def __init__(self) -> None:
+        self.calls = 0
+        self.collapsed = 0
+        # Ключ запроса -> [общая задача, количество ожидающих ее корутин]
+        self._in_flight: Dict[str, List[Any]] = {}
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Выполняет корутину `func` либо, если запрос с тем же ключом уже выполняется, ожидает его результат.
+        Если отменены все ожидающие корутины, общая задача также отменяется.
+
+        Args:
+            key (str): Ключ запроса.
+            func (Callable[[], Awaitable[Any]]): Функция, возвращающая корутину запроса.
+
+        Returns:
+            Any: Результат корутины, общий для всех ожидавших ее корутин.
+        """
+        entry = self._in_flight.get(key)
+        if entry is not None:
+            self.collapsed += 1
+        else:
+            entry = [asyncio.ensure_future(func()), 0]
+            self._in_flight[key] = entry
+            self.calls += 1
+            entry[0].add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        task = entry[0]
+        entry[1] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            entry[1] -= 1
+            if entry[1] == 0:
+                task.cancel()
+            raise
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Возвращает статистику объединения запросов.
+
+        Returns:
+            Dict[str, int]: Количество выполненных запросов, объединенных запросов и выполняющихся в данный
+                момент запросов.
+        """
+        return {
+            "calls": self.calls,
+            "collapsed": self.collapsed,
+            "in_flight": len(self._in_flight),
+        }
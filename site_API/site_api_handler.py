@@ -1,8 +1,29 @@
-from typing import Any, Dict, List, Tuple
+import asyncio
+from typing import Any, Dict, Iterable, List, NamedTuple, Tuple
 
 from logs.exceptions import ServerRequestError
-from services.services_logging import error_logger_func
-from site_API.core import api_request
+from logs.logging_config import log
+from services.services_logging import async_error_logger_func, error_logger_func
+from site_API.async_core import async_api_request
+from site_API.core import api_request, keep_ratio
+from site_API.rate_limiter import PRIORITY_INTERACTIVE
+
+
+class SearchResult(NamedTuple):
+    """
+    Результат одного поискового запроса к API Кинопоиск.
+
+    Attributes:
+        movies (List[Dict[str, Any]]): Список отфильтрованных фильмов, пригодных для отображения.
+        pages (int): Общее количество страниц результатов поиска на сервере.
+        error (str | None): Описание ошибки при запросе на сервер либо None, если запрос выполнен успешно.
+        limit (int): Размер страницы запроса. Для согласованной нумерации страниц все страницы одного
+            поискового запроса запрашиваются с одинаковым размером.
+    """
+    movies: List[Dict[str, Any]]
+    pages: int
+    error: str | None = None
+    limit: int = 0
 
 
 @error_logger_func
@@ -23,38 +44,87 @@ def remove_trailing_vowels(word: str) -> str:
     return word
 
 
-@error_logger_func
-def search_movies(
-    search_criteria: Dict[str, Any] | str, type_search: str, page: int = 1
-) -> Tuple[List[Dict[str, Any] | None], int] | str:
+def check_response(response: Dict[str, Any] | str | None) -> Dict[str, Any]:
     """
-    Универсальный поиск фильмов по названию или фильтрам.
+    Проверяет, что ответ сервера содержит перечень фильмов.
+
+    Args:
+        response (Dict[str, Any] | str | None): Результат функции `api_request` или `async_api_request`.
+
+    Returns:
+        Dict[str, Any]: JSON-ответ сервера с ключом `docs`.
+
+    Raises:
+        ConnectionError: Если не получен ответ при запросе с сервера в формате JSON.
+        ServerRequestError: Если при запросе на сервер ответ пришел с отрицательным ответом  в формате JSON.
+    """
+    if isinstance(response, str):
+        # Описание ошибки соединения, возвращенное декоратором error_logger_func
+        raise ConnectionError(response)
+    if not response:
+        raise ConnectionError("Не удалось установить соединение с сервером")
+
+    if "docs" not in response:
+        status_code = response.get("statusCode", "не установлен")
+        message = response.get("message", "Ошибка не определена сервером")
+        raise ServerRequestError(status_code, message)
+    return response
+
+
+def fetch_response(
+    params: Dict[str, Any], endpoint: str, priority: int = PRIORITY_INTERACTIVE
+) -> Dict[str, Any]:
+    """
+    Выполняет запрос к API и проверяет, что ответ сервера содержит перечень фильмов.
+
+    Args:
+        params (Dict[str, Any]): Параметры запроса.
+        endpoint (str): Конечная часть URL запроса.
+        priority (int): Приоритет запроса: PRIORITY_INTERACTIVE (по умолчанию) либо PRIORITY_BACKGROUND.
+
+    Returns:
+        Dict[str, Any]: JSON-ответ сервера с ключом `docs`.
+
+    Raises:
+        ConnectionError: Если не получен ответ при запросе с сервера в формате JSON.
+        ServerRequestError: Если при запросе на сервер ответ пришел с отрицательным ответом  в формате JSON.
+    """
+    return check_response(api_request(params, endpoint, priority))
+
+
+def build_search_request(
+    search_criteria: Dict[str, Any] | str, type_search: str, page: int = 1, limit: int | None = None
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Формирует конечную точку API и параметры запроса для поиска фильмов по названию или фильтрам.
 
     Args:
         search_criteria (Dict[str, Any] | str): Критерии поиска. Может быть либо строкой с названием фильма,
             либо словарем с фильтрами.
         type_search (str): Тип поиска. Возможные значения: `movie_by_filters` или `movie_search`.
         page (int): Номер страницы для пагинации результатов поиска. По умолчанию 1.
+        limit (int | None): Размер страницы запроса. По умолчанию (None) выбирается по доле фильмов,
+            остающихся после отбора, для данного типа поиска.
 
     Returns:
-        Tuple[List[Dict[str, Any] | None], int] | str: Список фильмов и номер страницы или строка с описанием ошибки.
+        Tuple[str, Dict[str, Any]]: Конечная точка API и параметры запроса.
 
     Raises:
         ValueError: Если тип поиска не является `movie_by_filters` или `movie_search`.
-        ConnectionError: Если не получен ответ при запросе с сервера в формате JSON.
-        ServerRequestError: Если при запросе на сервер ответ пришел с отрицательным ответом  в формате JSON.
     """
     if type_search not in {"movie_by_filters", "movie_search"}:
         raise ValueError(f"Недопустимый тип поиска: {type_search}")
+    if limit is None:
+        limit = keep_ratio.limit_for(type_search)
 
     if type_search == "movie_search":
         endpoint = "/v1.4/movie/search"
-        params = {"page": page, "limit": 15, "query": search_criteria}
+        params = {"page": page, "limit": limit, "query": search_criteria}
     else:
         endpoint = "/v1.4/movie"
         params = {
             "page": page,
-            "limit": 15,
+            "limit": limit,
             "selectFields": [
                 "id",
                 "name",
@@ -78,18 +148,28 @@ def search_movies(
             "genres.name": search_criteria.get("genres", "драма"),
             "countries.name": search_criteria.get("countries"),
         }
-    response = api_request(params, endpoint)
-    if not response:
-        raise ConnectionError("Не удалось установить соединение с сервером")
+    return endpoint, params
 
-    if "docs" not in response:
-        status_code = response.get("statusCode", "не установлен")
-        message = response.get("message", "Ошибка не определена сервером")
-        raise ServerRequestError(status_code, message)
 
+def filter_films(
+    response: Dict[str, Any], search_criteria: Dict[str, Any] | str, type_search: str
+) -> SearchResult:
+    """
+    Отбирает из ответа сервера фильмы с описанием, а при поиске по названию - фильмы, в названии которых
+    содержится хотя бы одно слово из поискового запроса. Доля отобранных фильмов учитывается при выборе
+    размера страницы следующих запросов.
+
+    Args:
+        response (Dict[str, Any]): JSON-ответ сервера с ключом `docs`.
+        search_criteria (Dict[str, Any] | str): Критерии поиска.
+        type_search (str): Тип поиска. Возможные значения: `movie_by_filters` или `movie_search`.
+
+    Returns:
+        SearchResult: Отобранные фильмы и количество страниц результатов поиска.
+    """
     films = response.get("docs", [])
     if not films:
-        return [], response.get("pages", 0)
+        return SearchResult([], response.get("pages", 0))
     filtered_films = [
         film
         for film in films
@@ -104,4 +184,105 @@ def search_movies(
             for film in filtered_films
             if any(word in film.get("name", "").lower() for word in search_words)
         ]
-    return filtered_films, response.get("pages", 0)
+    keep_ratio.record(type_search, len(films), len(filtered_films))
+    return SearchResult(filtered_films, response.get("pages", 0))
+
+
+@error_logger_func
+def search_movies(
+    search_criteria: Dict[str, Any] | str,
+    type_search: str,
+    page: int = 1,
+    priority: int = PRIORITY_INTERACTIVE,
+    limit: int | None = None,
+) -> SearchResult:
+    """
+    Универсальный поиск фильмов по названию или фильтрам. На каждый вызов выполняется ровно один запрос к API.
+
+    Args:
+        search_criteria (Dict[str, Any] | str): Критерии поиска. Может быть либо строкой с названием фильма,
+            либо словарем с фильтрами.
+        type_search (str): Тип поиска. Возможные значения: `movie_by_filters` или `movie_search`.
+        page (int): Номер страницы для пагинации результатов поиска. По умолчанию 1.
+        priority (int): Приоритет запроса к API: PRIORITY_INTERACTIVE (по умолчанию) для запросов пользователя
+            либо PRIORITY_BACKGROUND для фоновой предзагрузки.
+        limit (int | None): Размер страницы запроса. По умолчанию (None) выбирается адаптивно, чтобы после отбора
+            на странице осталось достаточно фильмов. Для следующих страниц того же поиска передается
+            `limit` из результата первой страницы.
+
+    Returns:
+        SearchResult: Список фильмов, количество страниц и описание ошибки, если при запросе на сервер
+            не получен ответ (ConnectionError) либо получен отрицательный ответ (ServerRequestError).
+
+    Raises:
+        ValueError: Если тип поиска не является `movie_by_filters` или `movie_search`.
+    """
+    endpoint, params = build_search_request(search_criteria, type_search, page, limit)
+    try:
+        response = fetch_response(params, endpoint, priority)
+    except (ConnectionError, ServerRequestError) as exc:
+        log.error(f"{type(exc).__name__}: {exc}")
+        return SearchResult([], 0, str(exc), params["limit"])
+    return filter_films(response, search_criteria, type_search)._replace(limit=params["limit"])
+
+
+@async_error_logger_func
+async def async_search_movies(
+    search_criteria: Dict[str, Any] | str,
+    type_search: str,
+    page: int = 1,
+    priority: int = PRIORITY_INTERACTIVE,
+    limit: int | None = None,
+) -> SearchResult:
+    """
+    Асинхронный вариант `search_movies` с тем же контрактом: универсальный поиск фильмов по названию
+    или фильтрам с одним запросом к API на каждый вызов.
+
+    Args:
+        search_criteria (Dict[str, Any] | str): Критерии поиска. Может быть либо строкой с названием фильма,
+            либо словарем с фильтрами.
+        type_search (str): Тип поиска. Возможные значения: `movie_by_filters` или `movie_search`.
+        page (int): Номер страницы для пагинации результатов поиска. По умолчанию 1.
+        priority (int): Приоритет запроса к API: PRIORITY_INTERACTIVE (по умолчанию) либо PRIORITY_BACKGROUND.
+        limit (int | None): Размер страницы запроса. По умолчанию (None) выбирается адаптивно.
+
+    Returns:
+        SearchResult: Список фильмов, количество страниц и описание ошибки.
+
+    Raises:
+        ValueError: Если тип поиска не является `movie_by_filters` или `movie_search`.
+    """
+    endpoint, params = build_search_request(search_criteria, type_search, page, limit)
+    try:
+        response = check_response(await async_api_request(params, endpoint, priority))
+    except (ConnectionError, ServerRequestError) as exc:
+        log.error(f"{type(exc).__name__}: {exc}")
+        return SearchResult([], 0, str(exc), params["limit"])
+    return filter_films(response, search_criteria, type_search)._replace(limit=params["limit"])
+
+
+async def async_search_movies_pages(
+    search_criteria: Dict[str, Any] | str,
+    type_search: str,
+    pages: Iterable[int],
+    priority: int = PRIORITY_INTERACTIVE,
+    limit: int | None = None,
+) -> List[SearchResult | None]:
+    """
+    Одновременно запрашивает несколько страниц результатов поиска фильмов с одинаковым размером страницы.
+
+    Args:
+        search_criteria (Dict[str, Any] | str): Критерии поиска.
+        type_search (str): Тип поиска. Возможные значения: `movie_by_filters` или `movie_search`.
+        pages (Iterable[int]): Номера страниц результатов поиска.
+        priority (int): Приоритет запросов к API: PRIORITY_INTERACTIVE (по умолчанию) либо PRIORITY_BACKGROUND.
+        limit (int | None): Размер страницы запроса. По умолчанию (None) выбирается адаптивно.
+
+    Returns:
+        List[SearchResult | None]: Результаты поиска в порядке номеров страниц `pages`.
+    """
+    if limit is None:
+        limit = keep_ratio.limit_for(type_search)
+    return await asyncio.gather(
+        *(async_search_movies(search_criteria, type_search, page, priority, limit) for page in pages)
+    )
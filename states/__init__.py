@@ -1 +1,2 @@
 from . import search_fields
+from . import state_storage
@@ -0,0 +1,334 @@
+import pickle
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+from telebot.storage import StateStorageBase
+
+from config_data.config import STATE_MEMORY_LIMIT, STATE_STORAGE, STATE_TTL
+from database.common.model_states import UserState, db_states
+from logs.logging_config import log
+
+
+def pack_data(data: Dict[str, Any]) -> bytes:
+    """
+    Сериализует данные сессии пользователя в компактный вид: pickle (сохраняет даты и вложенные структуры)
+    со сжатием zlib.
+
+    Args:
+        data (Dict[str, Any]): Данные сессии.
+
+    Returns:
+        bytes: Сериализованные данные.
+    """
+    return zlib.compress(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL), 1)
+
+
+def unpack_data(blob: bytes) -> Dict[str, Any]:
+    """
+    Восстанавливает данные сессии пользователя, сериализованные функцией `pack_data`.
+
+    Args:
+        blob (bytes): Сериализованные данные.
+
+    Returns:
+        Dict[str, Any]: Данные сессии.
+    """
+    return pickle.loads(zlib.decompress(blob))
+
+
+class StateDataContext:
+    """
+    Контекстный менеджер `bot.retrieve_data`: возвращает данные сессии и сохраняет их при выходе. Данные
+    восстанавливаются из сериализованного вида, поэтому, в отличие от контекста telebot, не копируются повторно.
+
+    Attributes:
+        storage (CompactStateStorage): Хранилище состояний.
+        key (str): Ключ состояния.
+        data (Dict[str, Any]): Данные сессии.
+    """
+    def __init__(self, storage: "CompactStateStorage", key: str) -> None:
+        self.storage = storage
+        self.key = key
+        self.data = storage.read_data(key)
+
+    def __enter__(self) -> Dict[str, Any]:
+        return self.data
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        return self.storage.write_data(self.key, self.data)
+
+
+class CompactStateStorage(StateStorageBase, ABC):
+    """
+    Базовое хранилище состояний пользователей с сериализованными данными сессий и временем жизни записей.
+    Реализует интерфейс хранилища telebot через абстрактные операции чтения, записи и удаления записи по ключу,
+    которые определяют наследники.
+
+    Attributes:
+        ttl (float): Время жизни записи без изменений в секундах.
+        prefix (str): Префикс ключей состояний.
+        separator (str): Разделитель частей ключа состояния.
+    """
+    def __init__(self, ttl: float, prefix: str = "telebot", separator: str = ":") -> None:
+        super().__init__()
+        self.ttl = ttl
+        self.prefix = prefix
+        self.separator = separator
+
+    @abstractmethod
+    def _load(self, key: str) -> Optional[Tuple[Optional[str], bytes]]:
+        """
+        Возвращает состояние и сериализованные данные сессии по ключу либо None, если записи нет
+        или ее время жизни истекло.
+        """
+
+    @abstractmethod
+    def _store(self, key: str, state: Optional[str], blob: bytes) -> None:
+        """
+        Сохраняет состояние и сериализованные данные сессии по ключу.
+        """
+
+    @abstractmethod
+    def _remove(self, key: str) -> bool:
+        """
+        Удаляет запись по ключу. Возвращает True, если запись существовала.
+        """
+
+    def key(
+        self,
+        chat_id: int,
+        user_id: int,
+        business_connection_id: Optional[str] = None,
+        message_thread_id: Optional[int] = None,
+        bot_id: Optional[int] = None,
+    ) -> str:
+        """
+        Формирует ключ состояния пользователя в чате.
+
+        Args:
+            chat_id (int): Идентификатор чата.
+            user_id (int): Идентификатор пользователя.
+            business_connection_id (Optional[str]): Идентификатор бизнес-подключения.
+            message_thread_id (Optional[int]): Идентификатор темы сообщений.
+            bot_id (Optional[int]): Идентификатор бота.
+
+        Returns:
+            str: Ключ состояния.
+        """
+        return self._get_key(
+            chat_id, user_id, self.prefix, self.separator, business_connection_id, message_thread_id, bot_id
+        )
+
+    def read_data(self, key: str) -> Dict[str, Any]:
+        """
+        Возвращает данные сессии по ключу состояния.
+
+        Args:
+            key (str): Ключ состояния.
+
+        Returns:
+            Dict[str, Any]: Данные сессии либо пустой словарь, если записи нет.
+        """
+        record = self._load(key)
+        return unpack_data(record[1]) if record else {}
+
+    def write_data(self, key: str, data: Dict[str, Any]) -> bool:
+        """
+        Сохраняет данные сессии по ключу состояния, если запись существует.
+
+        Args:
+            key (str): Ключ состояния.
+            data (Dict[str, Any]): Данные сессии.
+
+        Returns:
+            bool: True, если данные сохранены.
+        """
+        record = self._load(key)
+        if record is None:
+            return False
+        self._store(key, record[0], pack_data(data))
+        return True
+
+    def set_state(self, chat_id: int, user_id: int, state: Any, *args, **kwargs) -> bool:
+        if hasattr(state, "name"):
+            state = state.name
+        key = self.key(chat_id, user_id, *args, **kwargs)
+        record = self._load(key)
+        self._store(key, state, record[1] if record else pack_data({}))
+        return True
+
+    def get_state(self, chat_id: int, user_id: int, *args, **kwargs) -> Optional[str]:
+        record = self._load(self.key(chat_id, user_id, *args, **kwargs))
+        return record[0] if record else None
+
+    def delete_state(self, chat_id: int, user_id: int, *args, **kwargs) -> bool:
+        return self._remove(self.key(chat_id, user_id, *args, **kwargs))
+
+    def set_data(self, chat_id: int, user_id: int, key: str, value: Any, *args, **kwargs) -> bool:
+        state_key = self.key(chat_id, user_id, *args, **kwargs)
+        record = self._load(state_key)
+        if record is None:
+            raise RuntimeError(f"{type(self).__name__}: key {state_key} does not exist.")
+        data = unpack_data(record[1])
+        data[key] = value
+        self._store(state_key, record[0], pack_data(data))
+        return True
+
+    def get_data(self, chat_id: int, user_id: int, *args, **kwargs) -> Dict[str, Any]:
+        return self.read_data(self.key(chat_id, user_id, *args, **kwargs))
+
+    def reset_data(self, chat_id: int, user_id: int, *args, **kwargs) -> bool:
+        return self.write_data(self.key(chat_id, user_id, *args, **kwargs), {})
+
+    def get_interactive_data(self, chat_id: int, user_id: int, *args, **kwargs) -> StateDataContext:
+        return StateDataContext(self, self.key(chat_id, user_id, *args, **kwargs))
+
+    def save(self, chat_id: int, user_id: int, data: Dict[str, Any], *args, **kwargs) -> bool:
+        return self.write_data(self.key(chat_id, user_id, *args, **kwargs), data)
+
+
+class MemoryStateStorage(CompactStateStorage):
+    """
+    Хранилище состояний в памяти процесса. Записи, не использованные дольше времени жизни, удаляются,
+    а при превышении объема памяти, отведенного под данные сессий, вытесняются давно не использованные
+    записи (LRU). Порядок LRU совпадает с порядком последнего обращения, поэтому записи с истекшим временем
+    жизни всегда находятся в начале очереди.
+
+    Attributes:
+        max_bytes (int): Максимальный суммарный объем сериализованных данных сессий в байтах.
+        size (int): Текущий суммарный объем сериализованных данных сессий в байтах.
+        evictions (int): Количество записей, вытесненных из-за превышения объема памяти.
+        expirations (int): Количество записей, удаленных по истечении времени жизни.
+    """
+    def __init__(self, ttl: float, max_bytes: int, **kwargs) -> None:
+        super().__init__(ttl, **kwargs)
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries: OrderedDict[str, Tuple[Optional[str], bytes, float]] = OrderedDict()
+        self._lock = Lock()
+
+    def _pop_oldest(self) -> None:
+        _, blob, _ = self._entries.popitem(last=False)[1]
+        self.size -= len(blob)
+
+    def _expire(self, now: float) -> None:
+        while self._entries and now - next(iter(self._entries.values()))[2] >= self.ttl:
+            self._pop_oldest()
+            self.expirations += 1
+
+    def _load(self, key: str) -> Optional[Tuple[Optional[str], bytes]]:
+        now = time.time()
+        with self._lock:
+            self._expire(now)
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries[key] = (entry[0], entry[1], now)
+            self._entries.move_to_end(key)
+            return entry[0], entry[1]
+
+    def _store(self, key: str, state: Optional[str], blob: bytes) -> None:
+        now = time.time()
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous[1])
+            self._entries[key] = (state, blob, now)
+            self.size += len(blob)
+            self._expire(now)
+            while self.size > self.max_bytes and len(self._entries) > 1:
+                self._pop_oldest()
+                self.evictions += 1
+
+    def _remove(self, key: str) -> bool:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return False
+            self.size -= len(entry[1])
+            return True
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Возвращает статистику использования хранилища.
+
+        Returns:
+            Dict[str, int]: Количество записей, их суммарный объем, количество вытесненных и удаленных
+                по истечении времени жизни записей.
+        """
+        with self._lock:
+            return {
+                "sessions": len(self._entries),
+                "bytes": self.size,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+class SQLiteStateStorage(CompactStateStorage):
+    """
+    Хранилище состояний в базе данных SQLite: состояния и данные сессий сохраняются между перезапусками бота.
+    Время жизни записи отсчитывается от ее последнего изменения; записи с истекшим временем жизни
+    не возвращаются и удаляются из базы данных не чаще одного раза в `purge_interval` секунд.
+
+    Attributes:
+        purge_interval (float): Минимальный интервал между удалениями устаревших записей в секундах.
+    """
+    def __init__(self, ttl: float, purge_interval: float = 60, **kwargs) -> None:
+        super().__init__(ttl, **kwargs)
+        self.purge_interval = purge_interval
+        self._last_purge = 0.0
+        db_states.connect(reuse_if_open=True)
+        db_states.create_tables([UserState])
+        self._purge(time.time())
+
+    def _purge(self, now: float) -> None:
+        self._last_purge = now
+        removed = UserState.delete().where(UserState.updated_at < now - self.ttl).execute()
+        if removed:
+            log.info(f"Удалено устаревших состояний пользователей: {removed}.")
+
+    def _load(self, key: str) -> Optional[Tuple[Optional[str], bytes]]:
+        row = (
+            UserState.select(UserState.state, UserState.data)
+            .where((UserState.key == key) & (UserState.updated_at >= time.time() - self.ttl))
+            .tuples()
+            .first()
+        )
+        return (row[0], bytes(row[1])) if row else None
+
+    def _store(self, key: str, state: Optional[str], blob: bytes) -> None:
+        now = time.time()
+        UserState.insert(key=key, state=state, data=blob, updated_at=now).on_conflict_replace().execute()
+        if now - self._last_purge >= self.purge_interval:
+            self._purge(now)
+
+    def _remove(self, key: str) -> bool:
+        return UserState.delete().where(UserState.key == key).execute() > 0
+
+
+def create_state_storage(backend: str = STATE_STORAGE) -> CompactStateStorage:
+    """
+    Создает хранилище состояний пользователей.
+
+    Args:
+        backend (str): Тип хранилища: "memory" (в памяти процесса) либо "sqlite" (в базе данных SQLite).
+            По умолчанию значение STATE_STORAGE из настроек.
+
+    Returns:
+        CompactStateStorage: Хранилище состояний.
+
+    Raises:
+        ValueError: Если передан неизвестный тип хранилища.
+    """
+    if backend == "memory":
+        return MemoryStateStorage(ttl=STATE_TTL, max_bytes=STATE_MEMORY_LIMIT)
+    if backend == "sqlite":
+        return SQLiteStateStorage(ttl=STATE_TTL)
+    raise ValueError(f"Неизвестный тип хранилища состояний: {backend}")
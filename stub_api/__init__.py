@@ -0,0 +1,5 @@
+from . import corpus
+from . import server
+from . import telegram
+from . import replay
+from . import bench
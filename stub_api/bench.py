@@ -0,0 +1,377 @@
+import argparse
+import asyncio
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, Thread
+from typing import Any, Callable, Dict, List, Sequence
+
+from stub_api.corpus import generate_corpus
+from stub_api.server import StubKinopoiskServer
+
+
+def use_temporary_workdir(**env: str) -> str:
+    """
+    Переходит во временный каталог с пустыми каталогами `database` и `logs`, чтобы замеры не изменяли базы данных
+    и журналы бота, и задает переменные окружения, которые модули бота читают при импорте. Вызывается до импорта
+    модулей бота; файл `.env` по-прежнему читается из каталога проекта.
+
+    Args:
+        **env (str): Переменные окружения, заменяющие значения из `.env`.
+
+    Returns:
+        str: Путь к временному каталогу.
+    """
+    os.environ.update(env)
+    workdir = tempfile.mkdtemp(prefix="bench_")
+    os.chdir(workdir)
+    os.makedirs("database", exist_ok=True)
+    os.makedirs("logs", exist_ok=True)
+    return workdir
+
+
+def timings_ms(values: List[float]) -> Dict[str, float]:
+    """
+    Возвращает медиану и 95-й перцентиль замеров времени.
+
+    Args:
+        values (List[float]): Замеры времени в секундах.
+
+    Returns:
+        Dict[str, float]: Медиана и 95-й перцентиль в миллисекундах.
+    """
+    values = sorted(values)
+    p95 = values[min(int(len(values) * 0.95), len(values) - 1)]
+    return {"p50_ms": round(statistics.median(values) * 1000, 2), "p95_ms": round(p95 * 1000, 2)}
+
+
+def bench_api(pages: int = 200, latency: float = 0.2) -> List[Dict[str, Any]]:
+    """
+    Сравнивает загрузку `pages` страниц результатов поиска по названию пулом потоков (`search_movies`,
+    по потоку на страницу) и в цикле событий (`async_search_movies_pages`) против заглушки API Кинопоиск
+    с задержкой ответа `latency`. Ограничения частоты и суточного лимита запросов снимаются, размеры пулов
+    соединений клиентов API берутся из `.env`; варианты запрашивают разные названия, чтобы не попадать в кэш.
+
+    Args:
+        pages (int): Количество страниц.
+        latency (float): Задержка ответа заглушки API в секундах.
+
+    Returns:
+        List[Dict[str, Any]]: Для каждого варианта: количество страниц, страниц с ошибкой и время загрузки.
+    """
+    films = generate_corpus()
+    first, second = sorted({film["name"] for film in films})[:2]
+    stub = StubKinopoiskServer(films, port=0, latency=latency).start()
+    use_temporary_workdir(
+        API_URL=stub.url, API_RATE_LIMIT=str(pages), API_RATE_BURST=str(pages), API_DAILY_QUOTA=str(pages * 10)
+    )
+
+    # Модули импортируются в том же порядке, что и при запуске бота
+    import handlers  # noqa: F401
+    from site_API.async_core import async_client
+    from site_API.site_api_handler import async_search_movies_pages, search_movies
+
+    results = []
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(pages) as executor:
+            found = list(executor.map(lambda page: search_movies(first, "movie_search", page), range(1, pages + 1)))
+        results.append(_api_result("threads", found, time.perf_counter() - start))
+
+        async def load_pages() -> List[Any]:
+            try:
+                return await async_search_movies_pages(second, "movie_search", range(1, pages + 1))
+            finally:
+                await async_client.close()
+
+        start = time.perf_counter()
+        found = asyncio.run(load_pages())
+        results.append(_api_result("asyncio", found, time.perf_counter() - start))
+    finally:
+        stub.stop()
+    return results
+
+
+def _api_result(name: str, found: List[Any], elapsed: float) -> Dict[str, Any]:
+    return {
+        "variant": name,
+        "pages": len(found),
+        "errors": sum(result is None or bool(result.error) for result in found),
+        "seconds": round(elapsed, 2),
+    }
+
+
+def bench_search_pages(pages: int = 20, postponed: int = 60) -> List[Dict[str, Any]]:
+    """
+    Замеряет время сохранения страницы результатов поиска в базе данных (`search_for_movie`): поисковый запрос,
+    фильмы каталога, ссылки на фильмы и статусы избранного и просмотренного у пользователя с `postponed`
+    отложенными фильмами.
+
+    Args:
+        pages (int): Количество сохраняемых страниц по 15 фильмов.
+        postponed (int): Количество отложенных фильмов пользователя.
+
+    Returns:
+        List[Dict[str, Any]]: Количество страниц, медиана и 95-й перцентиль времени сохранения страницы.
+    """
+    use_temporary_workdir()
+
+    # Модули импортируются в том же порядке, что и при запуске бота
+    import handlers  # noqa: F401
+    from database.common.models_movies import MoviePostponed
+    from services.services_database import search_for_movie
+
+    films = [film for film in generate_corpus(pages * 30) if film["description"]][:pages * 15]
+    for film in films[:postponed]:
+        MoviePostponed.create(user_id="42", movie_id=str(film["id"]), is_favorites=True)
+
+    times = []
+    for index in range(pages):
+        start = time.perf_counter()
+        search_for_movie(42, films[index * 15:index * 15 + 15], "movie_search", f"query {index}")
+        times.append(time.perf_counter() - start)
+    return [{"pages": pages, "postponed": postponed, **timings_ms(times)}]
+
+
+def bench_db_concurrency(journal_mode: str = "wal", threads: int = 16, iterations: int = 40) -> List[Dict[str, Any]]:
+    """
+    Замеряет одновременную работу обработчиков с базой данных фильмов в режиме журнала `journal_mode`: каждый
+    поток, как обработчик обновления, открывает подключения промежуточным обработчиком, сохраняет страницу
+    результатов поиска и добавляет фильм в избранное.
+
+    Args:
+        journal_mode (str): Режим журнала SQLite (`DB_JOURNAL_MODE`), например `wal` или `delete`.
+        threads (int): Количество одновременных потоков.
+        iterations (int): Количество обновлений, обрабатываемых каждым потоком.
+
+    Returns:
+        List[Dict[str, Any]]: Количество обработанных обновлений и обновлений с ошибкой, время и пропускная
+            способность (обновлений в секунду).
+    """
+    use_temporary_workdir(DB_JOURNAL_MODE=journal_mode)
+
+    # Модули импортируются в том же порядке, что и при запуске бота
+    import handlers  # noqa: F401
+    from database.common.models_movies import db
+    from services.services_database import search_for_movie, toggle_movie_field_response
+    from utils.db_middleware import DatabaseConnectionMiddleware
+
+    films = [film for film in generate_corpus(400) if film["description"]][:150]
+    middleware = DatabaseConnectionMiddleware()
+    counters = {"done": 0, "errors": 0}
+    lock = Lock()
+
+    def worker(index: int) -> None:
+        for iteration in range(iterations):
+            middleware.pre_process(None, {})
+            try:
+                page = films[(iteration % 10) * 15:(iteration % 10) * 15 + 15]
+                movies = search_for_movie(1000 + index, page, "movie_search", f"query {index}-{iteration}")
+                if not movies:
+                    raise RuntimeError("Страница результатов поиска не сохранена")
+                toggle_movie_field_response(1000 + index, dict(movies[0], is_favorites=True), "is_favorites")
+                outcome = "done"
+            except Exception:
+                outcome = "errors"
+            finally:
+                middleware.post_process(None, {}, None)
+            with lock:
+                counters[outcome] += 1
+
+    start = time.perf_counter()
+    workers = [Thread(target=worker, args=(index,)) for index in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return [{
+        "journal_mode": db.pragma("journal_mode"),
+        **counters,
+        "seconds": round(elapsed, 2),
+        "updates_per_second": round(counters["done"] / elapsed, 1),
+    }]
+
+
+def bench_saved_search(sizes: Sequence[int] = (15, 150), repeats: int = 20) -> List[Dict[str, Any]]:
+    """
+    Замеряет повторное открытие сохраненного поискового запроса (`update_database`): чтение фильмов запроса
+    для пагинации и обновление даты поиска у записей запроса.
+
+    Args:
+        sizes (Sequence[int]): Количество фильмов в сохраненных поисковых запросах.
+        repeats (int): Количество повторов для каждого запроса.
+
+    Returns:
+        List[Dict[str, Any]]: Для каждого размера запроса: количество фильмов, медиана и 95-й перцентиль времени.
+    """
+    use_temporary_workdir()
+
+    # Модули импортируются в том же порядке, что и при запуске бота
+    import handlers  # noqa: F401
+    from database.common.models_movies import BaseMovie
+    from services.services_database import search_for_movie, update_database
+
+    films = [film for film in generate_corpus(max(sizes) * 5) if film["description"]]
+    results = []
+    for size in sizes:
+        text_search = f"saved {size}"
+        search_for_movie(77, films[:size], "movie_search", text_search)
+        times = []
+        for _ in range(repeats):
+            user_movies = BaseMovie.select().where((BaseMovie.user_id == 77) & (BaseMovie.text_search == text_search))
+            start = time.perf_counter()
+            update_database(user_movies, "movie_search")
+            times.append(time.perf_counter() - start)
+        results.append({"movies": size, **timings_ms(times)})
+    return results
+
+
+def bench_movie_storage(users: int = 20000, lookups: int = 2000) -> List[Dict[str, Any]]:
+    """
+    Сравнивает размер базы данных фильмов и время чтения фильмов для пагинации до и после переноса данных фильмов
+    в каталог `films`. Создается база данных в схеме до миграций (данные фильма в каждой записи пользователя,
+    без индексов): у каждого из `users` пользователей поисковый запрос с 10 фильмами и 2 избранных фильма.
+    До миграций замеряется тот же запрос SQL, который выполняли модели, после миграций - `sending_to_pagination`.
+
+    Args:
+        users (int): Количество пользователей.
+        lookups (int): Количество пользователей, для которых замеряется чтение.
+
+    Returns:
+        List[Dict[str, Any]]: До и после миграций: размер базы данных в мегабайтах, медиана и 95-й перцентиль
+            времени чтения страницы результатов поиска и избранных фильмов.
+    """
+    use_temporary_workdir()
+    from config_data.config import DB_PATH_MOVIES
+    from database.utils.migrations import FILM_COLUMNS
+
+    films = [
+        (
+            str(film["id"]), film["name"], film["alternativeName"], film["type"], film["year"],
+            ", ".join(country["name"] for country in film["countries"]),
+            ", ".join(genre["name"] for genre in film["genres"]),
+            film["rating"]["kp"], film["ageRating"], film["shortDescription"], film["description"],
+            film["poster"]["url"], film["isSeries"],
+        )
+        for film in generate_corpus(2000)
+    ]
+    film_columns = ", ".join(FILM_COLUMNS)
+    placeholders = ", ".join("?" * (len(FILM_COLUMNS) + 1))
+    user_columns = "id INTEGER PRIMARY KEY, date_search DATE NOT NULL, user_id VARCHAR(255) NOT NULL, "
+    status_columns = "is_viewed INTEGER NOT NULL, is_favorites INTEGER NOT NULL"
+    texts = {}
+    rnd = random.Random(1)
+    with sqlite3.connect(DB_PATH_MOVIES) as connection:
+        connection.execute(
+            f"CREATE TABLE base_movies ({user_columns}movie_id VARCHAR(255) NOT NULL, {film_columns}, "
+            f"{status_columns}, type_search VARCHAR(255) NOT NULL, text_search TEXT NOT NULL)"
+        )
+        connection.execute(
+            f"CREATE TABLE movies_postponed ({user_columns}movie_id VARCHAR(255) NOT NULL, {film_columns}, "
+            f"{status_columns})"
+        )
+        connection.execute(
+            f"CREATE TABLE query_string ({user_columns}type_search VARCHAR(255) NOT NULL, text_search TEXT NOT NULL)"
+        )
+        for user in range(users):
+            texts[str(user)] = text_search = f"query {rnd.randint(0, 500)}"
+            connection.execute(
+                "INSERT INTO query_string (date_search, user_id, type_search, text_search) "
+                "VALUES (date('now'), ?, 'movie_search', ?)",
+                (str(user), text_search),
+            )
+            connection.executemany(
+                f"INSERT INTO base_movies (date_search, user_id, movie_id, {film_columns}, is_viewed, is_favorites, "
+                f"type_search, text_search) VALUES (date('now'), ?, {placeholders}, 0, 0, 'movie_search', ?)",
+                [(str(user), *film, text_search) for film in rnd.sample(films, 10)],
+            )
+            connection.executemany(
+                f"INSERT INTO movies_postponed (date_search, user_id, movie_id, {film_columns}, is_viewed, "
+                f"is_favorites) VALUES (date('now'), ?, {placeholders}, 0, 1)",
+                [(str(user), *film) for film in rnd.sample(films, 2)],
+            )
+    connection.close()
+    sample = [str(rnd.randrange(users)) for _ in range(lookups)]
+
+    def measure(search_page: Callable[[str], Any], favorites: Callable[[str], Any]) -> Dict[str, Any]:
+        result = {"size_mb": round(os.path.getsize(DB_PATH_MOVIES) / 2 ** 20, 1)}
+        for name, read in (("search_page", search_page), ("favorites", favorites)):
+            times = []
+            for user in sample:
+                start = time.perf_counter()
+                read(user)
+                times.append(time.perf_counter() - start)
+            result.update({f"{name}_{key}": value for key, value in timings_ms(times).items()})
+        return result
+
+    with sqlite3.connect(DB_PATH_MOVIES) as connection:
+        columns = f"movie_id, {film_columns}, is_viewed, is_favorites"
+        before = measure(
+            lambda user: connection.execute(
+                f"SELECT {columns} FROM base_movies WHERE user_id = ? AND text_search = ?", (user, texts[user])
+            ).fetchall(),
+            lambda user: connection.execute(
+                f"SELECT {columns} FROM movies_postponed WHERE user_id = ? AND is_favorites ORDER BY id DESC", (user,)
+            ).fetchall(),
+        )
+    connection.close()
+
+    # Модули импортируются в том же порядке, что и при запуске бота; база данных фильмов мигрирует при импорте
+    import handlers  # noqa: F401
+    from database.common.models_movies import db, BaseMovie, MoviePostponed
+    from services.services_database import sending_to_pagination
+
+    db.execute_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+    after = measure(
+        lambda user: sending_to_pagination(
+            BaseMovie.select().where((BaseMovie.user_id == user) & (BaseMovie.text_search == texts[user])),
+            "movie_search",
+        ),
+        lambda user: sending_to_pagination(
+            MoviePostponed.select().where(
+                (MoviePostponed.user_id == user) & MoviePostponed.is_favorites
+            ).order_by(MoviePostponed.id.desc()),
+            "favorites",
+        ),
+    )
+    return [{"schema": "before_migrations", **before}, {"schema": "after_migrations", **after}]
+
+
+# Замеры, доступные из командной строки: название и функция, которая выполняет замер по аргументам
+BENCHMARKS: Dict[str, Callable[[argparse.Namespace], List[Dict[str, Any]]]] = {
+    "api": lambda args: bench_api(args.pages or 200, args.latency),
+    "search_pages": lambda args: bench_search_pages(args.pages or 20, args.postponed),
+    "db_concurrency": lambda args: bench_db_concurrency(args.journal_mode, args.threads, args.iterations),
+    "saved_search": lambda args: bench_saved_search(args.sizes),
+    "movie_storage": lambda args: bench_movie_storage(args.users, args.lookups),
+}
+
+
+def main() -> None:
+    """
+    Выполняет замеры производительности из командной строки: `python -m stub_api.bench api --pages 200`.
+    """
+    parser = argparse.ArgumentParser(description="Замеры производительности бота")
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS), help="Замер")
+    parser.add_argument("--pages", type=int, help="api, search_pages: количество страниц (по умолчанию 200 и 20)")
+    parser.add_argument("--latency", type=float, default=0.2, help="api: задержка ответа API в секундах")
+    parser.add_argument("--postponed", type=int, default=60, help="search_pages: количество отложенных фильмов")
+    parser.add_argument("--journal-mode", default="wal", help="db_concurrency: режим журнала SQLite")
+    parser.add_argument("--threads", type=int, default=16, help="db_concurrency: количество потоков")
+    parser.add_argument("--iterations", type=int, default=40, help="db_concurrency: обновлений на поток")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[15, 150], help="saved_search: фильмов в запросе")
+    parser.add_argument("--users", type=int, default=20000, help="movie_storage: количество пользователей")
+    parser.add_argument("--lookups", type=int, default=2000, help="movie_storage: количество замеров чтения")
+    args = parser.parse_args()
+
+    for result in BENCHMARKS[args.benchmark](args):
+        print(" ".join(f"{key}={value}" for key, value in result.items()))
+
+
+if __name__ == "__main__":
+    main()
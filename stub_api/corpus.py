@@ -0,0 +1,119 @@
+import json
+import random
+from typing import Any, Dict, List
+
+
+TITLE_WORDS = (
+    "Матрица", "Начало", "Интерстеллар", "Брат", "Город", "Ночь", "Дом", "Любовь", "Война", "Мир", "Остров",
+    "Побег", "Игра", "Код", "Путь", "Зима", "Море", "Тень", "Звезда", "Охота", "Легенда", "Сердце", "Граница",
+    "Дорога", "Небо", "Тайна", "Экипаж", "Солярис", "Сталкер", "Служба",
+)
+
+GENRES = (
+    "биография", "боевик", "вестерн", "военный", "детектив", "детский", "для взрослых", "документальный",
+    "драма", "игра", "история", "комедия", "криминал", "мелодрама", "мюзикл", "музыка", "приключения",
+    "семейный", "спорт", "триллер", "ужасы", "фантастика", "фэнтези", "фильм-нуар", "концерт", "церемония",
+    "ток-шоу",
+)
+
+COUNTRIES = (
+    "Россия", "СССР", "США", "Великобритания", "Франция", "Германия", "Италия", "Испания", "Япония", "Китай",
+    "Корея Южная", "Индия", "Канада", "Австралия", "Казахстан", "Беларусь", "Польша", "Турция",
+)
+
+MOVIE_TYPES = ("movie", "tv-series", "cartoon", "anime", "animated-series")
+
+AGE_RATINGS = (0, 6, 12, 16, 18)
+
+
+def generate_corpus(size: int = 2000, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Формирует детерминированный набор фильмов в формате ответа API Кинопоиск (`/v1.4/movie`). Часть фильмов
+    не имеет описания или постера, как и в ответах реального API, чтобы отбор фильмов ботом давал
+    сопоставимую долю отброшенных фильмов.
+
+    Args:
+        size (int): Количество фильмов. По умолчанию 2000.
+        seed (int): Начальное значение генератора случайных чисел. По умолчанию 0.
+
+    Returns:
+        List[Dict[str, Any]]: Список фильмов.
+    """
+    rnd = random.Random(seed)
+    films = []
+    for index in range(size):
+        movie_id = 100000 + index
+        movie_type = rnd.choices(MOVIE_TYPES, weights=(60, 25, 7, 4, 4))[0]
+        name = " ".join(rnd.sample(TITLE_WORDS, rnd.randint(1, 3)))
+        if rnd.random() < 0.3:
+            name = f"{name} {rnd.randint(2, 5)}"
+        description = f"Описание фильма «{name}»." if rnd.random() < 0.8 else None
+        rating_kp = round(rnd.uniform(3, 9.5), 3)
+        films.append(
+            {
+                "id": movie_id,
+                "name": name,
+                "alternativeName": f"Title {movie_id}" if rnd.random() < 0.5 else None,
+                "description": description,
+                "shortDescription": description[:60] if description and rnd.random() < 0.6 else None,
+                "type": movie_type,
+                "isSeries": movie_type in ("tv-series", "animated-series"),
+                "year": rnd.randint(1950, 2024),
+                "rating": {"kp": rating_kp, "imdb": round(min(rating_kp + rnd.uniform(-1, 1), 10), 1)},
+                "votes": {"kp": rnd.randint(10, 500000)},
+                "genres": [{"name": genre} for genre in rnd.sample(GENRES, rnd.randint(1, 3))],
+                "countries": [{"name": country} for country in rnd.sample(COUNTRIES, rnd.randint(1, 2))],
+                "poster": (
+                    {
+                        "url": f"https://image.example/poster/{movie_id}.jpg",
+                        "previewUrl": f"https://image.example/preview/{movie_id}.jpg",
+                    }
+                    if rnd.random() < 0.9
+                    else {"url": None, "previewUrl": None}
+                ),
+                "ageRating": rnd.choice(AGE_RATINGS),
+                "top10": None,
+                "top250": None,
+            }
+        )
+
+    ranked = sorted(films, key=lambda film: film["rating"]["kp"], reverse=True)
+    for position, film in enumerate(ranked[:250], start=1):
+        film["top250"] = position
+        if position <= 10:
+            film["top10"] = position
+    return films
+
+
+def load_corpus(path: str) -> List[Dict[str, Any]]:
+    """
+    Загружает набор фильмов из JSON-файла: списка фильмов либо сохраненного ответа API с ключом `docs`.
+
+    Args:
+        path (str): Путь к JSON-файлу.
+
+    Returns:
+        List[Dict[str, Any]]: Список фильмов.
+
+    Raises:
+        ValueError: Если файл не содержит списка фильмов.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    if isinstance(data, dict):
+        data = data.get("docs")
+    if not isinstance(data, list):
+        raise ValueError(f"Файл {path} не содержит списка фильмов")
+    return data
+
+
+def save_corpus(films: List[Dict[str, Any]], path: str) -> None:
+    """
+    Сохраняет набор фильмов в JSON-файл.
+
+    Args:
+        films (List[Dict[str, Any]]): Список фильмов.
+        path (str): Путь к JSON-файлу.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(films, file, ensure_ascii=False, indent=2)
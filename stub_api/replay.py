@@ -0,0 +1,173 @@
+import argparse
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+from itertools import count
+from threading import Lock, Thread
+from typing import Any, Dict, List
+
+from stub_api.corpus import generate_corpus
+from stub_api.server import StubKinopoiskServer
+from stub_api.telegram import StubTelegramServer, make_callback_update, make_message_update
+
+
+# Команды запуска вариантов бота
+RUNTIMES = {
+    "sync": [sys.executable, "main.py"],
+    "async": [sys.executable, "-m", "bot_async"],
+}
+# Шаги сценария пользователя: название шага, обновление и количество ответов бота, которых ожидает шаг
+SCENARIO = (
+    ("movie_search", "message", "/movie_search", 2),
+    ("title", "message", None, 1),
+    ("next_card", "callback", "movie#2", 1),
+    ("description", "callback", "show_description#2", 1),
+    ("back", "callback", "back_movie#2", 1),
+)
+
+
+def percentile(values: List[float], share: float) -> float:
+    """
+    Возвращает значение перцентиля отсортированного списка.
+
+    Args:
+        values (List[float]): Отсортированные значения.
+        share (float): Доля от 0 до 1.
+
+    Returns:
+        float: Значение перцентиля.
+    """
+    return values[min(int(len(values) * share), len(values) - 1)]
+
+
+def run_replay(
+    runtime: str,
+    users: int,
+    rounds: int,
+    think: float = 0.2,
+    telegram_latency: float = 0.05,
+    api_latency: float = 0.1,
+    step_timeout: float = 30,
+) -> Dict[str, Any]:
+    """
+    Воспроизводит сценарий пользователей против варианта бота, запущенного отдельным процессом с заглушками
+    Telegram Bot API и API Кинопоиск. Каждый пользователь `rounds` раз выполняет поиск по названию, переходит
+    к следующей карточке, открывает полное описание и возвращается к карточке; следующий шаг начинается после
+    ответа бота на предыдущий и паузы `think` (замкнутый цикл).
+
+    Бот запускается из текущего каталога с его файлом `.env` и базами данных; адреса API заменяются
+    адресами заглушек через переменные окружения.
+
+    Args:
+        runtime (str): Вариант бота: `sync` или `async`.
+        users (int): Количество одновременных пользователей.
+        rounds (int): Количество повторов сценария каждым пользователем.
+        think (float): Пауза пользователя между шагами в секундах.
+        telegram_latency (float): Задержка ответа заглушки Telegram Bot API в секундах.
+        api_latency (float): Задержка ответа заглушки API Кинопоиск в секундах.
+        step_timeout (float): Максимальное время ожидания ответа бота на шаг в секундах.
+
+    Returns:
+        Dict[str, Any]: Количество шагов и шагов без ответа бота, пропускная способность (шагов в секунду),
+            медиана и 95-й перцентиль времени ответа по шагам сценария в миллисекундах, количество запросов
+            к API Кинопоиск и вызовов методов Telegram Bot API.
+    """
+    films = generate_corpus()
+    titles = sorted({film["name"] for film in films})
+    kinopoisk = StubKinopoiskServer(films, port=0, latency=api_latency).start()
+    telegram = StubTelegramServer(port=0, latency=telegram_latency).start()
+    env = dict(os.environ, API_URL=kinopoisk.url, TELEGRAM_API_URL=telegram.api_url)
+    process = subprocess.Popen(RUNTIMES[runtime], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    update_ids = count(10)
+    latencies: Dict[str, List[float]] = {name: [] for name, *_ in SCENARIO}
+    failed = [0]
+    lock = Lock()
+
+    def user(index: int) -> None:
+        chat_id = 5000 + index
+        for round_index in range(rounds):
+            title = titles[(index * rounds + round_index) % len(titles)]
+            for name, kind, data, replies in SCENARIO:
+                if kind == "message":
+                    update = make_message_update(next(update_ids), chat_id, data or title)
+                else:
+                    update = make_callback_update(next(update_ids), chat_id, data)
+                expected = telegram.replies[chat_id] + replies
+                start = time.perf_counter()
+                telegram.push_updates([update])
+                answered = telegram.wait_chat_replies(chat_id, expected, step_timeout)
+                with lock:
+                    latencies[name].append(time.perf_counter() - start)
+                    failed[0] += not answered
+                time.sleep(think)
+
+    try:
+        while telegram.calls["getUpdates"] < 2:
+            if process.poll() is not None:
+                raise RuntimeError(f"Бот завершился с кодом {process.returncode}")
+            time.sleep(0.2)
+        start = time.perf_counter()
+        threads = [Thread(target=user, args=(index,)) for index in range(users)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+    finally:
+        process.send_signal(signal.SIGINT)
+        try:
+            process.wait(20)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        telegram.stop()
+        kinopoisk.stop()
+
+    steps = sum(len(values) for values in latencies.values())
+    result: Dict[str, Any] = {
+        "runtime": runtime,
+        "steps": steps,
+        "failed": failed[0],
+        "seconds": round(elapsed, 1),
+        "steps_per_second": round(steps / elapsed, 1),
+    }
+    for name, values in latencies.items():
+        values.sort()
+        result[f"{name}_p50_ms"] = round(statistics.median(values) * 1000)
+        result[f"{name}_p95_ms"] = round(percentile(values, 0.95) * 1000)
+    result["api_requests"] = kinopoisk.requests
+    result["telegram_calls"] = dict(telegram.calls)
+    return result
+
+
+def main() -> None:
+    """
+    Сравнивает синхронный и асинхронный варианты бота на воспроизводимом сценарии пользователей:
+    `python -m stub_api.replay sync async --users 50 --rounds 3`.
+    """
+    parser = argparse.ArgumentParser(description="Сравнение вариантов бота на сценарии пользователей")
+    parser.add_argument("runtimes", nargs="+", choices=sorted(RUNTIMES), help="Варианты бота")
+    parser.add_argument("--users", type=int, default=50, help="Количество одновременных пользователей")
+    parser.add_argument("--rounds", type=int, default=3, help="Количество повторов сценария пользователем")
+    parser.add_argument("--think", type=float, default=0.2, help="Пауза пользователя между шагами в секундах")
+    parser.add_argument("--telegram-latency", type=float, default=0.05, help="Задержка Telegram Bot API в секундах")
+    parser.add_argument("--api-latency", type=float, default=0.1, help="Задержка API Кинопоиск в секундах")
+    args = parser.parse_args()
+
+    for runtime in args.runtimes:
+        result = run_replay(
+            runtime,
+            users=args.users,
+            rounds=args.rounds,
+            think=args.think,
+            telegram_latency=args.telegram_latency,
+            api_latency=args.api_latency,
+        )
+        print(" ".join(f"{key}={value}" for key, value in result.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,446 @@
+import argparse
+import json
+import math
+import os
+import random
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import Any, Dict, List, Tuple
+from urllib.error import HTTPError
+from urllib.parse import parse_qs, urlencode, urlparse
+from urllib.request import Request, urlopen
+
+from logs.logging_config import log
+from stub_api.corpus import generate_corpus, load_corpus
+
+
+# Максимальный размер страницы, допускаемый API Кинопоиск
+MAX_LIMIT = 250
+
+ENDPOINT_MOVIE = "/v1.4/movie"
+ENDPOINT_SEARCH = "/v1.4/movie/search"
+
+
+def get_field(film: Dict[str, Any], path: str) -> Any:
+    """
+    Возвращает значение поля фильма по пути через точку (например, `rating.kp`).
+
+    Args:
+        film (Dict[str, Any]): Фильм.
+        path (str): Путь к полю.
+
+    Returns:
+        Any: Значение поля либо None, если поле отсутствует.
+    """
+    value: Any = film
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def parse_range(value: str) -> Tuple[float, float]:
+    """
+    Разбирает значение фильтра в виде числа (`2020`) либо диапазона (`7-10`).
+
+    Args:
+        value (str): Значение фильтра.
+
+    Returns:
+        Tuple[float, float]: Нижняя и верхняя границы диапазона включительно.
+
+    Raises:
+        ValueError: Если значение не является числом или диапазоном чисел.
+    """
+    low, _, high = value.partition("-")
+    return float(low), float(high or low)
+
+
+def match_names(values: List[str], names: List[str]) -> bool:
+    """
+    Проверяет список названий фильма (жанров, стран) по значениям фильтра с правилами API Кинопоиск:
+    значения с префиксом `+` обязательны, с префиксом `!` исключаются, из остальных достаточно одного.
+
+    Args:
+        values (List[str]): Значения фильтра.
+        names (List[str]): Названия у фильма.
+
+    Returns:
+        bool: True, если фильм проходит фильтр.
+    """
+    required = {value[1:] for value in values if value.startswith("+")}
+    excluded = {value[1:] for value in values if value.startswith("!")}
+    any_of = {value for value in values if value[:1] not in ("+", "!")}
+    names_set = set(names)
+    return (
+        required <= names_set
+        and not excluded & names_set
+        and (not any_of or bool(any_of & names_set))
+    )
+
+
+def filter_movies(films: List[Dict[str, Any]], query: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+    """
+    Отбирает фильмы по фильтрам `type`, `year`, `rating.kp`, `genres.name`, `countries.name` и сортирует их
+    по парам `sortField`/`sortType` (фильмы без значения поля сортировки располагаются в конце).
+
+    Args:
+        films (List[Dict[str, Any]]): Набор фильмов.
+        query (Dict[str, List[str]]): Параметры строки запроса.
+
+    Returns:
+        List[Dict[str, Any]]: Отобранные и отсортированные фильмы.
+
+    Raises:
+        ValueError: Если значение фильтра года или рейтинга некорректно.
+    """
+    types = set(query.get("type", []))
+    ranges = [
+        (field, parse_range(query[field][0])) for field in ("year", "rating.kp") if field in query
+    ]
+    genres = query.get("genres.name", [])
+    countries = query.get("countries.name", [])
+
+    result = []
+    for film in films:
+        if types and film.get("type") not in types:
+            continue
+        if any(
+            not isinstance(get_field(film, field), (int, float)) or not low <= get_field(film, field) <= high
+            for field, (low, high) in ranges
+        ):
+            continue
+        if genres and not match_names(genres, [genre["name"] for genre in film.get("genres", [])]):
+            continue
+        if countries and not match_names(countries, [country["name"] for country in film.get("countries", [])]):
+            continue
+        result.append(film)
+
+    sort_fields = query.get("sortField", [])
+    sort_types = query.get("sortType", [])
+    for index in reversed(range(len(sort_fields))):
+        field = sort_fields[index]
+        descending = (sort_types[index] if index < len(sort_types) else "1") == "-1"
+        present = [film for film in result if get_field(film, field) is not None]
+        missing = [film for film in result if get_field(film, field) is None]
+        present.sort(key=lambda film: get_field(film, field), reverse=descending)
+        result = present + missing
+    return result
+
+
+def search_by_title(films: List[Dict[str, Any]], text: str) -> List[Dict[str, Any]]:
+    """
+    Отбирает фильмы, в названии которых встречается хотя бы одно слово поискового запроса. Фильмы с большим
+    количеством совпавших слов располагаются первыми.
+
+    Args:
+        films (List[Dict[str, Any]]): Набор фильмов.
+        text (str): Поисковый запрос.
+
+    Returns:
+        List[Dict[str, Any]]: Найденные фильмы.
+    """
+    words = text.lower().split()
+    scored = []
+    for film in films:
+        title = f"{film.get('name') or ''} {film.get('alternativeName') or ''}".lower()
+        score = sum(word in title for word in words)
+        if score:
+            scored.append((score, film))
+    scored.sort(key=lambda item: item[0], reverse=True)
+    return [film for _, film in scored]
+
+
+def paginate(
+    films: List[Dict[str, Any]], page: int, limit: int, select_fields: List[str]
+) -> Dict[str, Any]:
+    """
+    Формирует страницу ответа в формате API Кинопоиск.
+
+    Args:
+        films (List[Dict[str, Any]]): Отобранные фильмы.
+        page (int): Номер страницы.
+        limit (int): Размер страницы.
+        select_fields (List[str]): Поля фильмов в ответе (все поля, если список пуст).
+
+    Returns:
+        Dict[str, Any]: Ответ с ключами `docs`, `total`, `limit`, `page` и `pages`.
+    """
+    docs = films[(page - 1) * limit:page * limit]
+    if select_fields:
+        docs = [{field: film.get(field) for field in select_fields} for film in docs]
+    return {
+        "docs": docs,
+        "total": len(films),
+        "limit": limit,
+        "page": page,
+        "pages": math.ceil(len(films) / limit),
+    }
+
+
+def fixture_key(path: str, query: Dict[str, List[str]]) -> str:
+    """
+    Формирует ключ записанного ответа: путь запроса и отсортированные параметры строки запроса.
+
+    Args:
+        path (str): Путь запроса.
+        query (Dict[str, List[str]]): Параметры строки запроса.
+
+    Returns:
+        str: Ключ записанного ответа.
+    """
+    return f"{path}?{urlencode(sorted((name, value) for name in query for value in query[name]))}"
+
+
+class FixtureStore:
+    """
+    Записанные ответы API Кинопоиск для воспроизведения. В режиме записи запросы, отсутствующие в файле,
+    передаются на реальный API (`upstream`), а полученные ответы сохраняются в файл.
+
+    Attributes:
+        path (str): Путь к JSON-файлу с записанными ответами.
+        upstream (str | None): Базовый URL реального API для записи новых ответов либо None.
+    """
+    def __init__(self, path: str, upstream: str | None = None) -> None:
+        self.path = path
+        self.upstream = upstream
+        self._responses: Dict[str, Dict[str, Any]] = {}
+        self._lock = Lock()
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as file:
+                self._responses = json.load(file)
+
+    def get(self, key: str) -> Tuple[int, Dict[str, Any]] | None:
+        """
+        Возвращает записанный ответ.
+
+        Args:
+            key (str): Ключ записанного ответа.
+
+        Returns:
+            Tuple[int, Dict[str, Any]] | None: Код ответа и JSON-ответ либо None, если ответ не записан.
+        """
+        with self._lock:
+            record = self._responses.get(key)
+        return (record["status"], record["body"]) if record else None
+
+    def record(self, key: str, api_key: str) -> Tuple[int, Dict[str, Any]]:
+        """
+        Запрашивает ответ у реального API и сохраняет его в файл.
+
+        Args:
+            key (str): Ключ записанного ответа (путь и строка запроса).
+            api_key (str): Ключ доступа к API.
+
+        Returns:
+            Tuple[int, Dict[str, Any]]: Код ответа и JSON-ответ.
+        """
+        request = Request(
+            f"{self.upstream}{key}", headers={"accept": "application/json", "X-API-KEY": api_key}
+        )
+        try:
+            with urlopen(request, timeout=30) as response:
+                status, body = response.status, json.load(response)
+        except HTTPError as exc:
+            status, body = exc.code, json.load(exc)
+        with self._lock:
+            self._responses[key] = {"status": status, "body": body}
+            with open(self.path, "w", encoding="utf-8") as file:
+                json.dump(self._responses, file, ensure_ascii=False, indent=2)
+        return status, body
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    """
+    Обработчик HTTP-запросов заглушки API Кинопоиск.
+    """
+    protocol_version = "HTTP/1.1"
+    server: "_StubHTTPServer"
+
+    def do_GET(self) -> None:
+        status, body = self.server.stub.handle(self.path, self.headers.get("X-API-KEY"))
+        payload = json.dumps(body, ensure_ascii=False).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        log.debug(f"Заглушка API: {format % args}")
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    stub: "StubKinopoiskServer"
+
+
+class StubKinopoiskServer:
+    """
+    Локальная заглушка API Кинопоиск для конечных точек `/v1.4/movie` и `/v1.4/movie/search`. Поддерживает
+    пагинацию, `selectFields`, сортировку и фильтры по типу, году, рейтингу, жанрам и странам над набором
+    фильмов, а также воспроизведение записанных ответов, задержку ответов и внедрение ошибок.
+    Для работы бота с заглушкой укажите в `.env` адрес `API_URL` из свойства `url`.
+
+    Attributes:
+        films (List[Dict[str, Any]]): Набор фильмов.
+        latency (float): Задержка каждого ответа в секундах.
+        jitter (float): Случайная добавка к задержке от нуля до `jitter` секунд.
+        error_rate (float): Доля запросов, на которые возвращается ошибка `error_status`.
+        error_status (int): Код ответа при внедренной ошибке.
+        fixtures (FixtureStore | None): Записанные ответы, которые возвращаются вместо ответов по набору фильмов.
+        requests (int): Количество обработанных запросов.
+        injected_errors (int): Количество внедренных ошибок.
+    """
+    def __init__(
+        self,
+        films: List[Dict[str, Any]],
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: int = 0,
+        fixtures: FixtureStore | None = None,
+    ) -> None:
+        self.films = films
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.fixtures = fixtures
+        self.requests = 0
+        self.injected_errors = 0
+        self._random = random.Random(seed)
+        self._lock = Lock()
+        self._httpd = _StubHTTPServer((host, port), _StubRequestHandler)
+        self._httpd.stub = self
+        self._thread: Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """
+        str: Базовый URL заглушки.
+        """
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def handle(self, raw_path: str, api_key: str | None) -> Tuple[int, Dict[str, Any]]:
+        """
+        Формирует ответ на GET-запрос.
+
+        Args:
+            raw_path (str): Путь запроса со строкой запроса.
+            api_key (str | None): Значение заголовка `X-API-KEY`.
+
+        Returns:
+            Tuple[int, Dict[str, Any]]: Код ответа и JSON-ответ.
+        """
+        with self._lock:
+            self.requests += 1
+            inject_error = self._random.random() < self.error_rate
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            if inject_error:
+                self.injected_errors += 1
+        if delay:
+            time.sleep(delay)
+
+        if not api_key:
+            return 401, {"statusCode": 401, "message": "В запросе не указан токен!", "error": "Unauthorized"}
+        if inject_error:
+            return self.error_status, {
+                "statusCode": self.error_status,
+                "message": "Внедренная ошибка заглушки API",
+                "error": "Injected Error",
+            }
+
+        url = urlparse(raw_path)
+        query = parse_qs(url.query)
+        if self.fixtures is not None:
+            key = fixture_key(url.path, query)
+            recorded = self.fixtures.get(key)
+            if recorded is not None:
+                return recorded
+            if self.fixtures.upstream:
+                return self.fixtures.record(key, api_key)
+
+        if url.path not in (ENDPOINT_MOVIE, ENDPOINT_SEARCH):
+            return 404, {"statusCode": 404, "message": f"Cannot GET {url.path}", "error": "Not Found"}
+        try:
+            page = int(query.get("page", ["1"])[0])
+            limit = int(query.get("limit", ["10"])[0])
+            if page < 1 or not 1 <= limit <= MAX_LIMIT:
+                raise ValueError
+            if url.path == ENDPOINT_SEARCH:
+                films = search_by_title(self.films, query.get("query", [""])[0])
+            else:
+                films = filter_movies(self.films, query)
+        except ValueError:
+            return 400, {"statusCode": 400, "message": "Некорректные параметры запроса", "error": "Bad Request"}
+        return 200, paginate(films, page, limit, query.get("selectFields", []))
+
+    def start(self) -> "StubKinopoiskServer":
+        """
+        Запускает заглушку в фоновом потоке.
+
+        Returns:
+            StubKinopoiskServer: Запущенная заглушка.
+        """
+        self._thread = Thread(target=self._httpd.serve_forever, name="stub-api", daemon=True)
+        self._thread.start()
+        log.info(f"Заглушка API Кинопоиск запущена по адресу {self.url} ({len(self.films)} фильмов).")
+        return self
+
+    def stop(self) -> None:
+        """
+        Останавливает заглушку и закрывает сокет сервера.
+        """
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+def main() -> None:
+    """
+    Запускает заглушку API Кинопоиск из командной строки: `python -m stub_api.server --help`.
+    """
+    parser = argparse.ArgumentParser(description="Локальная заглушка API Кинопоиск")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--corpus", help="JSON-файл с набором фильмов (по умолчанию набор генерируется)")
+    parser.add_argument("--size", type=int, default=2000, help="Количество генерируемых фильмов")
+    parser.add_argument("--seed", type=int, default=0, help="Начальное значение генератора случайных чисел")
+    parser.add_argument("--latency", type=float, default=0.0, help="Задержка ответа в секундах")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Случайная добавка к задержке в секундах")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Доля запросов с внедренной ошибкой")
+    parser.add_argument("--error-status", type=int, default=503, help="Код ответа внедренной ошибки")
+    parser.add_argument("--fixtures", help="JSON-файл с записанными ответами для воспроизведения")
+    parser.add_argument("--record-from", help="URL реального API для записи отсутствующих ответов в --fixtures")
+    args = parser.parse_args()
+
+    films = load_corpus(args.corpus) if args.corpus else generate_corpus(args.size, args.seed)
+    fixtures = FixtureStore(args.fixtures, args.record_from) if args.fixtures else None
+    stub = StubKinopoiskServer(
+        films,
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+        fixtures=fixtures,
+    ).start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,522 @@
+import argparse
+import json
+from email.parser import BytesParser
+from email.policy import HTTP
+import statistics
+import time
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from threading import Condition, Lock, Thread, local
+from typing import Any, Deque, Dict, List, Set, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from logs.logging_config import log
+
+
+# Методы Telegram Bot API, отправляющие сообщение в чат (учитываются как ответы бота)
+SEND_METHODS = (
+    "sendMessage", "sendPhoto", "sendMediaGroup", "editMessageMedia", "editMessageText", "editMessageCaption"
+)
+
+
+def make_message_update(update_id: int, chat_id: int, text: str) -> Dict[str, Any]:
+    """
+    Формирует обновление Telegram с текстовым сообщением пользователя в личном чате с ботом.
+
+    Args:
+        update_id (int): Идентификатор обновления.
+        chat_id (int): Идентификатор чата (совпадает с идентификатором пользователя).
+        text (str): Текст сообщения.
+
+    Returns:
+        Dict[str, Any]: Обновление в формате Telegram Bot API.
+    """
+    user = {"id": chat_id, "is_bot": False, "first_name": f"User {chat_id}"}
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "private", "first_name": user["first_name"]},
+            "from": user,
+            "text": text,
+        },
+    }
+
+
+def make_callback_update(
+    update_id: int, chat_id: int, data: str, message_id: int = 1, photo: bool = False
+) -> Dict[str, Any]:
+    """
+    Формирует обновление Telegram с нажатием пользователем инлайн-кнопки под сообщением бота.
+
+    Args:
+        update_id (int): Идентификатор обновления.
+        chat_id (int): Идентификатор чата (совпадает с идентификатором пользователя).
+        data (str): Данные нажатой кнопки.
+        message_id (int): Идентификатор сообщения бота с кнопкой. По умолчанию 1.
+        photo (bool): Сообщение бота с кнопкой - изображение с подписью (карточка фильма), а не текст.
+            По умолчанию `False`.
+
+    Returns:
+        Dict[str, Any]: Обновление в формате Telegram Bot API.
+    """
+    user = {"id": chat_id, "is_bot": False, "first_name": f"User {chat_id}"}
+    content = (
+        {"photo": [{"file_id": "stub-photo", "file_unique_id": "stub", "width": 1, "height": 1}], "caption": ""}
+        if photo
+        else {"text": ""}
+    )
+    return {
+        "update_id": update_id,
+        "callback_query": {
+            "id": str(update_id),
+            "from": user,
+            "chat_instance": str(chat_id),
+            "data": data,
+            "message": {
+                "message_id": message_id,
+                "date": int(time.time()),
+                "chat": {"id": chat_id, "type": "private", "first_name": user["first_name"]},
+                "from": {"id": 1, "is_bot": True, "first_name": "Stub"},
+                **content,
+            },
+        },
+    }
+
+
+def parse_body(content_type: str, body: bytes) -> Dict[str, str]:
+    """
+    Извлекает параметры вызова метода из тела запроса: telebot передает параметры в строке запроса,
+    а асинхронный вариант telebot - в теле запроса (`application/x-www-form-urlencoded` либо
+    `multipart/form-data` при отправке файлов). Файлы отбрасываются.
+
+    Args:
+        content_type (str): Значение заголовка Content-Type.
+        body (bytes): Тело запроса.
+
+    Returns:
+        Dict[str, str]: Параметры вызова.
+    """
+    if content_type.startswith("application/x-www-form-urlencoded"):
+        return {name: values[0] for name, values in parse_qs(body.decode()).items()}
+    if content_type.startswith("multipart/form-data"):
+        form = BytesParser(policy=HTTP).parsebytes(f"Content-Type: {content_type}\r\n\r\n".encode() + body)
+        return {
+            part.get_param("name", header="content-disposition"): part.get_content()
+            for part in form.iter_parts()
+            if part.get_filename() is None
+        }
+    return {}
+
+
+class _StubTelegramRequestHandler(BaseHTTPRequestHandler):
+    """
+    Обработчик HTTP-запросов заглушки Telegram Bot API.
+    """
+    protocol_version = "HTTP/1.1"
+    # Заголовки и тело ответа отправляются отдельно: без TCP_NODELAY ответ задерживается алгоритмом Нейгла
+    disable_nagle_algorithm = True
+    server: "_StubTelegramHTTPServer"
+
+    def _respond(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        url = urlparse(self.path)
+        token, method = url.path.rsplit("/", 2)[-2:]
+        params = {name: values[0] for name, values in parse_qs(url.query).items()}
+        params.update(parse_body(self.headers.get("Content-Type", ""), body))
+        status, body = self.server.stub.handle(method, params, token.removeprefix("bot"))
+        payload = json.dumps(body, ensure_ascii=False).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, format: str, *args: Any) -> None:
+        log.debug(f"Заглушка Telegram: {format % args}")
+
+
+class _StubTelegramHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    stub: "StubTelegramServer"
+
+
+class StubTelegramServer:
+    """
+    Локальная заглушка Telegram Bot API для нагрузочного тестирования бота без реального бота и сети.
+    Отдает добавленные обновления методом `getUpdates` (с долгим опросом и подтверждением через `offset`),
+    а на остальные методы отвечает успешно с задержкой `latency`, учитывая вызовы методов и ответы бота
+    в каждом чате. При заданных `chat_limit` и `global_limit` сообщения сверх лимита за последнюю секунду
+    отклоняются ответом 429 с `retry_after`, как в Telegram. Для работы бота с заглушкой укажите в `.env`
+    значение `TELEGRAM_API_URL` из свойства `api_url`.
+
+    Attributes:
+        latency (float): Задержка ответа на вызов методов, кроме `getUpdates`, в секундах.
+        chat_limit (int): Максимальное количество сообщений в чат за секунду (0 - без ограничения).
+        global_limit (int): Максимальное количество сообщений бота за секунду (0 - без ограничения).
+        calls (Counter): Количество вызовов каждого метода.
+        replies (Counter): Количество сообщений, отправленных ботом в каждый чат.
+        photos (Counter): Количество изображений, отправленных по URL (`url`), по идентификатору файла
+            (`file_id`) и загрузкой файла (`upload`), а также отклоненных идентификаторов файлов (`rejected`).
+        throttled (Counter): Количество сообщений, отклоненных ответом 429, в каждом чате.
+        deleted (Counter): Количество удаленных сообщений в каждом чате. Повторное удаление сообщения
+            методом `deleteMessage` отклоняется ответом 400, а `deleteMessages` пропускает такие сообщения.
+    """
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8766,
+        latency: float = 0.0,
+        chat_limit: int = 0,
+        global_limit: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.chat_limit = chat_limit
+        self.global_limit = global_limit
+        self.calls: Counter = Counter()
+        self.throttled: Counter = Counter()
+        self.deleted: Counter = Counter()
+        self._deleted_ids: Set[Tuple[int, int]] = set()
+        # Время отправки сообщений за последнюю секунду в каждом чате и всего (ключ None)
+        self._sent_at: Dict[int | None, Deque[float]] = defaultdict(deque)
+        self.replies: Counter = Counter()
+        self.photos: Counter = Counter()
+        # Идентификаторы файлов, выданные этим экземпляром заглушки: остальные отклоняются как устаревшие
+        self._file_ids: Set[str] = set()
+        self._updates: List[Dict[str, Any]] = []
+        self._message_ids = count(1000)
+        self._condition = Condition()
+        self._httpd = _StubTelegramHTTPServer((host, port), _StubTelegramRequestHandler)
+        self._httpd.stub = self
+        self._thread: Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """
+        str: Базовый URL заглушки.
+        """
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_url(self) -> str:
+        """
+        str: Шаблон адреса методов API в формате `telebot.apihelper.API_URL`.
+        """
+        return self.url + "/bot{0}/{1}"
+
+    def push_updates(self, updates: List[Dict[str, Any]]) -> None:
+        """
+        Добавляет обновления, которые бот получит методом `getUpdates`.
+
+        Args:
+            updates (List[Dict[str, Any]]): Обновления в формате Telegram Bot API.
+        """
+        with self._condition:
+            self._updates.extend(updates)
+            self._condition.notify_all()
+
+    def total_replies(self) -> int:
+        """
+        int: Общее количество сообщений, отправленных ботом.
+        """
+        with self._condition:
+            return sum(self.replies.values())
+
+    def wait_replies(self, expected: int, timeout: float) -> bool:
+        """
+        Ожидает, пока бот отправит не менее `expected` сообщений.
+
+        Args:
+            expected (int): Ожидаемое количество сообщений.
+            timeout (float): Максимальное время ожидания в секундах.
+
+        Returns:
+            bool: True, если ожидаемое количество сообщений отправлено до истечения времени ожидания.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: sum(self.replies.values()) >= expected, timeout)
+
+    def wait_chat_replies(self, chat_id: int, expected: int, timeout: float) -> bool:
+        """
+        Ожидает, пока бот отправит в чат не менее `expected` сообщений.
+
+        Args:
+            chat_id (int): Идентификатор чата.
+            expected (int): Ожидаемое количество сообщений в чате.
+            timeout (float): Максимальное время ожидания в секундах.
+
+        Returns:
+            bool: True, если ожидаемое количество сообщений отправлено до истечения времени ожидания.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self.replies[chat_id] >= expected, timeout)
+
+    def _get_updates(self, params: Dict[str, str]) -> List[Dict[str, Any]]:
+        offset = int(params.get("offset", 0))
+        limit = int(params.get("limit", 100))
+        timeout = float(params.get("timeout", 0))
+        with self._condition:
+            if offset < 0:
+                self._updates = self._updates[offset:]
+            elif offset:
+                self._updates = [update for update in self._updates if update["update_id"] >= offset]
+            self._condition.wait_for(lambda: self._updates, timeout)
+            return self._updates[:limit]
+
+    def _accept_photo(self, params: Dict[str, str]) -> bool:
+        photo = params.get("photo")
+        if photo is None and "media" in params:
+            photo = json.loads(params["media"]).get("media", "")
+            photo = None if photo.startswith("attach://") else photo
+        if photo is None:
+            source = "upload"
+        elif photo.startswith(("http://", "https://")):
+            source = "url"
+        else:
+            source = "file_id"
+        with self._condition:
+            if source == "file_id" and photo not in self._file_ids:
+                self.photos["rejected"] += 1
+                return False
+            self.photos[source] += 1
+        return True
+
+    def _delete(self, chat_id: int, message_ids: List[int]) -> int:
+        with self._condition:
+            new_ids = {(chat_id, message_id) for message_id in message_ids} - self._deleted_ids
+            self._deleted_ids |= new_ids
+            self.deleted[chat_id] += len(new_ids)
+        return len(new_ids)
+
+    def _over_limit(self, chat_id: int) -> bool:
+        now = time.monotonic()
+        with self._condition:
+            limits = ((chat_id, self.chat_limit), (None, self.global_limit))
+            for key, limit in limits:
+                sent_at = self._sent_at[key]
+                while sent_at and now - sent_at[0] >= 1:
+                    sent_at.popleft()
+                if limit and len(sent_at) >= limit:
+                    self.throttled[chat_id] += 1
+                    return True
+            for key, _ in limits:
+                self._sent_at[key].append(now)
+        return False
+
+    def handle(self, method: str, params: Dict[str, str], token: str = "") -> Tuple[int, Dict[str, Any]]:
+        """
+        Формирует ответ на вызов метода Telegram Bot API.
+
+        Args:
+            method (str): Название метода.
+            params (Dict[str, str]): Параметры вызова из строки запроса и тела запроса.
+            token (str): Токен бота из адреса метода. Идентификатор бота в ответе `getMe` берется из токена,
+                как в Telegram Bot API: по нему telebot формирует ключи состояний пользователей.
+
+        Returns:
+            Tuple[int, Dict[str, Any]]: Код ответа и JSON-ответ.
+        """
+        if method == "getUpdates":
+            with self._condition:
+                self.calls[method] += 1
+            return 200, {"ok": True, "result": self._get_updates(params)}
+
+        if self.latency:
+            time.sleep(self.latency)
+        if method in ("sendPhoto", "editMessageMedia") and not self._accept_photo(params):
+            return 400, {
+                "ok": False,
+                "error_code": 400,
+                "description": "Bad Request: wrong file identifier/HTTP URL specified",
+            }
+        chat_id = int(params.get("chat_id", 0))
+        if (self.chat_limit or self.global_limit) and method in SEND_METHODS and self._over_limit(chat_id):
+            return 429, {
+                "ok": False,
+                "error_code": 429,
+                "description": "Too Many Requests: retry after 1",
+                "parameters": {"retry_after": 1},
+            }
+        if method == "deleteMessage" and not self._delete(chat_id, [int(params["message_id"])]):
+            return 400, {"ok": False, "error_code": 400, "description": "Bad Request: message to delete not found"}
+        if method == "deleteMessages":
+            self._delete(chat_id, json.loads(params["message_ids"]))
+        with self._condition:
+            self.calls[method] += 1
+            if method in SEND_METHODS:
+                self.replies[chat_id] += 1
+                self._condition.notify_all()
+
+        if method == "getMe":
+            bot_id = int(token.split(":")[0]) if token[:1].isdigit() else 1
+            me = {"id": bot_id, "is_bot": True, "first_name": "Stub", "username": "stub_bot"}
+            return 200, {"ok": True, "result": me}
+        if method not in SEND_METHODS:
+            return 200, {"ok": True, "result": True}
+
+        # Отредактированное сообщение сохраняет свой идентификатор
+        message_id = int(params.get("message_id") or next(self._message_ids))
+        result = {
+            "message_id": message_id,
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "private"},
+            "from": {"id": 1, "is_bot": True, "first_name": "Stub"},
+        }
+        if method in ("sendPhoto", "editMessageMedia"):
+            file_id = f"stub-photo-{id(self)}-{message_id}"
+            with self._condition:
+                self._file_ids.add(file_id)
+            result["photo"] = [{"file_id": file_id, "file_unique_id": str(message_id), "width": 1, "height": 1}]
+        elif method == "editMessageCaption":
+            result["caption"] = params.get("caption", "")
+        else:
+            result["text"] = params.get("text", "")
+        return 200, {"ok": True, "result": [result] if method == "sendMediaGroup" else result}
+
+    def start(self) -> "StubTelegramServer":
+        """
+        Запускает заглушку в фоновом потоке.
+
+        Returns:
+            StubTelegramServer: Запущенная заглушка.
+        """
+        self._thread = Thread(target=self._httpd.serve_forever, name="stub-telegram", daemon=True)
+        self._thread.start()
+        log.info(f"Заглушка Telegram Bot API запущена по адресу {self.url}.")
+        return self
+
+    def stop(self) -> None:
+        """
+        Останавливает заглушку и закрывает сокет сервера.
+        """
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+class FakeWebhookClient:
+    """
+    Имитирует доставку обновлений Telegram на вебхук бота: отправляет обновления методом POST не более чем
+    в `connections` параллельных соединениях (как `max_connections` метода `setWebhook`) и повторяет доставку
+    обновления, получившего ответ не 2xx, через `retry_delay` секунд. Используется вместе с заглушкой
+    `StubTelegramServer`, которая принимает исходящие запросы бота.
+
+    Attributes:
+        url (str): Адрес вебхука.
+        secret_token (str | None): Секретный токен вебхука.
+        connections (int): Максимальное количество параллельных соединений.
+        retry_delay (float): Задержка повторной доставки в секундах.
+        max_attempts (int): Максимальное количество попыток доставки обновления.
+    """
+    def __init__(
+        self,
+        url: str,
+        secret_token: str | None = None,
+        connections: int = 40,
+        retry_delay: float = 1.0,
+        max_attempts: int = 10,
+    ) -> None:
+        self.url = url
+        self.secret_token = secret_token
+        self.connections = connections
+        self.retry_delay = retry_delay
+        self.max_attempts = max_attempts
+        self._local = local()
+        self._lock = Lock()
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            if self.secret_token:
+                session.headers["X-Telegram-Bot-Api-Secret-Token"] = self.secret_token
+        return session
+
+    def _deliver_one(self, update: Dict[str, Any], acks: List[float], counters: Counter) -> None:
+        for attempt in range(self.max_attempts):
+            start = time.perf_counter()
+            try:
+                status = self._session().post(self.url, json=update, timeout=30).status_code
+            except requests.RequestException:
+                status = 0
+            with self._lock:
+                if 200 <= status < 300:
+                    acks.append(time.perf_counter() - start)
+                    counters["delivered"] += 1
+                    return
+                counters["retries"] += 1
+            time.sleep(self.retry_delay)
+        with self._lock:
+            counters["failed"] += 1
+
+    def deliver(self, updates: List[Dict[str, Any]]) -> Dict[str, float]:
+        """
+        Доставляет обновления на вебхук и ожидает подтверждения всех обновлений.
+
+        Args:
+            updates (List[Dict[str, Any]]): Обновления в формате Telegram Bot API.
+
+        Returns:
+            Dict[str, float]: Количество доставленных обновлений, повторных попыток и недоставленных обновлений,
+                время доставки в секундах и время подтверждения обновления вебхуком (медиана, 95-й процентиль
+                и максимум) в миллисекундах.
+        """
+        acks: List[float] = []
+        counters: Counter = Counter()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.connections) as executor:
+            for update in updates:
+                executor.submit(self._deliver_one, update, acks, counters)
+        elapsed = time.perf_counter() - start
+
+        acks_ms = sorted(ack * 1000 for ack in acks) or [0.0]
+        return {
+            "delivered": counters["delivered"],
+            "retries": counters["retries"],
+            "failed": counters["failed"],
+            "seconds": round(elapsed, 3),
+            "ack_p50_ms": round(statistics.median(acks_ms), 2),
+            "ack_p95_ms": round(acks_ms[min(int(len(acks_ms) * 0.95), len(acks_ms) - 1)], 2),
+            "ack_max_ms": round(acks_ms[-1], 2),
+        }
+
+
+def main() -> None:
+    """
+    Запускает заглушку Telegram Bot API из командной строки: `python -m stub_api.telegram --help`.
+    """
+    parser = argparse.ArgumentParser(description="Локальная заглушка Telegram Bot API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--latency", type=float, default=0.0, help="Задержка ответа в секундах")
+    parser.add_argument("--chat-limit", type=int, default=0, help="Лимит сообщений в чат за секунду")
+    parser.add_argument("--global-limit", type=int, default=0, help="Лимит сообщений бота за секунду")
+    args = parser.parse_args()
+
+    stub = StubTelegramServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        chat_limit=args.chat_limit,
+        global_limit=args.global_limit,
+    ).start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import os
+import sys
+import tempfile
+from collections import OrderedDict
+
+import dotenv
+import pytest
+
+
+# Модули бота читают настройки при импорте: тестам не нужен файл .env, а базы данных и логи
+# создаются во временном каталоге
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("BOT_TOKEN", "123456:TEST")
+os.environ.setdefault("API_KEY", "test")
+os.environ.setdefault("API_URL", "http://127.0.0.1:9")
+dotenv.find_dotenv = lambda *args, **kwargs: os.devnull
+os.chdir(tempfile.mkdtemp())
+os.makedirs("database", exist_ok=True)
+
+# Модули импортируются в том же порядке, что и при запуске бота
+import handlers  # noqa: E402,F401
+from site_API import async_core, core  # noqa: E402
+from stub_api.corpus import generate_corpus  # noqa: E402
+from stub_api.server import StubKinopoiskServer  # noqa: E402
+
+
+@pytest.fixture
+def stub_api(monkeypatch):
+    """
+    Локальная заглушка API Кинопоиск, к которой обращаются синхронный и асинхронный клиенты API.
+    Кэш ответов API на время теста очищается.
+    """
+    server = StubKinopoiskServer(generate_corpus(size=300), port=0).start()
+    monkeypatch.setattr(core.client, "host_api", server.url)
+    monkeypatch.setattr(async_core.async_client, "host_api", server.url)
+    monkeypatch.setattr(core.response_cache, "_entries", OrderedDict())
+    yield server
+    server.stop()
@@ -0,0 +1,51 @@
+import asyncio
+import threading
+
+from aiohttp import web
+
+from site_API import async_core, core
+from site_API.circuit_breaker import CircuitBreaker
+from site_API.site_api_handler import async_search_movies
+
+
+async def _serve_bad_gateway(requests):
+    async def bad_gateway(request):
+        requests.append(request.path)
+        return web.Response(status=502, text="<html><body>502 Bad Gateway</body></html>", content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/v1.4/movie/search", bad_gateway)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, f"http://127.0.0.1:{runner.addresses[0][1]}"
+
+
+def test_html_bad_gateway_is_retried_failure(monkeypatch):
+    breaker = CircuitBreaker(failure_threshold=10, reset_timeout=60)
+    recorded = []
+    monkeypatch.setattr(async_core, "breaker", breaker)
+    monkeypatch.setattr(async_core, "backoff_delay", lambda attempt: 0)
+    monkeypatch.setattr(core.quota, "record", lambda count=1: recorded.append(threading.current_thread()))
+    monkeypatch.setattr(core.site, "api_max_retries", 1)
+    requests = []
+
+    async def search():
+        runner, host = await _serve_bad_gateway(requests)
+        monkeypatch.setattr(async_core.async_client, "host_api", host)
+        try:
+            return await async_search_movies("матрица", "movie_search")
+        finally:
+            await async_core.async_client.close()
+            await runner.cleanup()
+
+    result = asyncio.run(search())
+
+    assert result.error
+    assert result.movies == []
+    assert len(requests) == 2
+    assert breaker.stats()["consecutive_failures"] == 2
+    # Расход лимита сохраняется в SQLite вне потока цикла событий
+    assert len(recorded) == 2
+    assert threading.main_thread() not in recorded
@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+import requests
+
+from logs.exceptions import ApiRateLimitError, ApiUnavailableError
+from site_API import async_core, core
+from site_API.circuit_breaker import STATE_CLOSED, STATE_HALF_OPEN, CircuitBreaker
+from site_API.rate_limiter import PRIORITY_INTERACTIVE, TokenBucketLimiter
+
+
+class _Response:
+    status_code = 200
+
+
+@pytest.fixture
+def half_open(monkeypatch):
+    """
+    Выключатель запросов, готовый пропустить пробный запрос.
+    """
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    monkeypatch.setattr(core, "breaker", breaker)
+    monkeypatch.setattr(async_core, "breaker", breaker)
+    monkeypatch.setattr(core.quota, "record", lambda count=1: None)
+    monkeypatch.setattr(core.site, "api_max_retries", 0)
+    return breaker
+
+
+def test_rate_limit_rejection_releases_probe(half_open, monkeypatch):
+    limiter = TokenBucketLimiter(rate=0.001, burst=1)
+    limiter.acquire()
+    monkeypatch.setattr(core, "rate_limiter", limiter)
+    monkeypatch.setattr(core.site, "api_timeout", 0.01)
+
+    monkeypatch.setattr(async_core, "rate_limiter", limiter)
+
+    with pytest.raises(ApiRateLimitError):
+        core._get_with_retries({}, "/v1.4/movie", PRIORITY_INTERACTIVE)
+    with pytest.raises(ApiRateLimitError):
+        asyncio.run(async_core._get_with_retries({}, "/v1.4/movie", PRIORITY_INTERACTIVE))
+
+    assert half_open.before_call() is True
+
+
+def test_unexpected_error_releases_probe(half_open, monkeypatch):
+    def get(url_end, params):
+        raise requests.TooManyRedirects
+
+    monkeypatch.setattr(core.client, "get", get)
+    with pytest.raises(requests.TooManyRedirects):
+        core._get_with_retries({}, "/v1.4/movie", PRIORITY_INTERACTIVE)
+
+    assert half_open.stats()["state"] == STATE_HALF_OPEN
+    monkeypatch.setattr(core.client, "get", lambda url_end, params: _Response())
+    assert core._get_with_retries({}, "/v1.4/movie", PRIORITY_INTERACTIVE).status_code == 200
+    assert half_open.stats()["state"] == STATE_CLOSED
+
+
+def test_cancelled_async_request_releases_probe(half_open, monkeypatch):
+    async def get(url_end, params):
+        await asyncio.sleep(10)
+
+    async def cancel_probe():
+        task = asyncio.create_task(async_core._get_with_retries({}, "/v1.4/movie", PRIORITY_INTERACTIVE))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    monkeypatch.setattr(async_core.async_client, "get", get)
+    asyncio.run(cancel_probe())
+
+    assert half_open.before_call() is True
+
+
+def test_probe_in_flight_rejects_other_calls(half_open):
+    assert half_open.before_call() is True
+    with pytest.raises(ApiUnavailableError):
+        half_open.before_call()
+    half_open.release_probe()
+    assert half_open.before_call() is True
+
+
+def test_open_breaker_fails_fast_without_token(monkeypatch):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    breaker.record_failure()
+    limiter = TokenBucketLimiter(rate=0.001, burst=1)
+    monkeypatch.setattr(core, "breaker", breaker)
+    monkeypatch.setattr(async_core, "breaker", breaker)
+    monkeypatch.setattr(core, "rate_limiter", limiter)
+    monkeypatch.setattr(async_core, "rate_limiter", limiter)
+
+    with pytest.raises(ApiUnavailableError):
+        core._get_with_retries({}, "/v1.4/movie", PRIORITY_INTERACTIVE)
+    with pytest.raises(ApiUnavailableError):
+        asyncio.run(async_core._get_with_retries({}, "/v1.4/movie", PRIORITY_INTERACTIVE))
+
+    assert limiter.stats()["tokens"] == 1
@@ -0,0 +1,49 @@
+import sqlite3
+
+import pytest
+
+from database.common.model_images import db_image, ImageFile, PosterFile
+from database.core import crud_images
+from database.utils.migrations import IMAGE_MIGRATIONS, migrate_images_db
+from services.services_image_assets import ImageAssets
+
+
+# Схема базы данных изображений до миграций: имя изображения уникально во всей таблице
+LEGACY_SCHEMA = (
+    'CREATE TABLE "imagefile" ("id" INTEGER NOT NULL PRIMARY KEY, "chat_id" VARCHAR(255) NOT NULL, '
+    '"image_name" VARCHAR(255) NOT NULL, "file_id" VARCHAR(255) NOT NULL)',
+    'CREATE UNIQUE INDEX "imagefile_image_name" ON "imagefile" ("image_name")',
+    "INSERT INTO imagefile (chat_id, image_name, file_id) VALUES ('*', 'start', 'global-start')",
+)
+
+
+@pytest.fixture
+def images_db(tmp_path):
+    """
+    Подключает модели базы данных изображений к отдельному файлу на время теста.
+    """
+    database = db_image.database
+    db_image.close()
+    db_image.init(str(tmp_path / "images.db"), timeout=db_image._timeout)
+    yield str(tmp_path / "images.db")
+    db_image.close()
+    db_image.init(database, timeout=db_image._timeout)
+
+
+def test_per_chat_file_ids_do_not_replace_each_other(images_db):
+    with sqlite3.connect(images_db) as connection:
+        for statement in LEGACY_SCHEMA:
+            connection.execute(statement)
+
+    migrate_images_db()
+    db_image.create_tables([ImageFile, PosterFile])
+    assets = ImageAssets(per_chat=True)
+    assets.remember(1, "start", "chat-1-start")
+    assets.remember(2, "start", "chat-2-start")
+    assets.remember(1, "start", "chat-1-start-new")
+
+    assert db_image.pragma("user_version") == len(IMAGE_MIGRATIONS)
+    assert assets.get(1, "start") == "chat-1-start-new"
+    assert assets.get(2, "start") == "chat-2-start"
+    assert crud_images.get_image()("*", "start") == "global-start"
+    assert ImageFile.select().count() == 3
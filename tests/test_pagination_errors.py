@@ -0,0 +1,25 @@
+import pytest
+from telebot.apihelper import ApiTelegramException
+
+from services.services_pagination_handlers import is_message_error
+
+
+def telegram_error(description: str) -> ApiTelegramException:
+    return ApiTelegramException(
+        "editMessageMedia", None, {"ok": False, "error_code": 400, "description": description}
+    )
+
+
+@pytest.mark.parametrize("description, expected", [
+    ("Bad Request: message to edit not found", True),
+    ("Bad Request: message can't be edited", True),
+    ("Bad Request: message is not modified: specified new message content and reply markup are exactly the same "
+     "as a current content and reply markup of the message", True),
+    ("Bad Request: MESSAGE_ID_INVALID", True),
+    ("Bad Request: wrong file identifier/HTTP URL specified", False),
+    ("Bad Request: failed to get HTTP URL content", False),
+    ("Bad Request: wrong type of the web page content", False),
+    ("Bad Request: can't parse message text", False),
+])
+def test_only_edited_message_errors_match(description, expected):
+    assert is_message_error(telegram_error(description)) is expected
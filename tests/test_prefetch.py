@@ -0,0 +1,32 @@
+from services import services_prefetch
+from services.services_prefetch import PagePrefetcher, prefetch_next_page
+
+
+def test_prefetch_when_one_page_left(monkeypatch):
+    scheduled = []
+    monkeypatch.setattr(
+        services_prefetch.prefetcher, "schedule", lambda *args: scheduled.append(args[4])
+    )
+    data = {"search": "матрица", "movie_info": [1, 2, 3], "limit": 15}
+
+    # Переход с первой на четвертую из пяти страниц: осталась одна страница
+    prefetch_next_page(1, 1, dict(data, page=4, pages=5 - 4, total_pages=5), current_card=3)
+    # Последняя страница
+    prefetch_next_page(1, 1, dict(data, page=5, pages=0, total_pages=5), current_card=3)
+    # Первая страница до перехода: `pages` - общее количество страниц
+    prefetch_next_page(1, 1, dict(data, page=1, pages=2), current_card=3)
+
+    assert scheduled == [5, 2]
+
+
+def test_buffer_keeps_latest_sessions(monkeypatch):
+    monkeypatch.setattr(services_prefetch, "search_movies", lambda *args: None)
+    prefetcher = PagePrefetcher(max_workers=1, cards_before_end=3, max_sessions=2)
+    for user_id in range(1, 4):
+        prefetcher.schedule(user_id, user_id, "матрица", "movie_search", 2, 15)
+
+    assert prefetcher.stats()["buffered"] == 2
+    assert prefetcher.stats()["dropped"] == 1
+    assert prefetcher.take(1, 1, "матрица", "movie_search", 2, 15) is None
+    prefetcher.take(3, 3, "матрица", "movie_search", 2, 15)
+    assert prefetcher.stats()["buffered"] == 1
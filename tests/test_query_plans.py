@@ -0,0 +1,75 @@
+import sqlite3
+
+import pytest
+
+from database.common.models_movies import db, BaseMovie, Film, MoviePostponed, QueryString
+from database.utils.migrations import MIGRATIONS, migrate_movies_db
+from database.utils.query_plans import find_full_scans
+
+
+# Схема базы данных фильмов до миграций: данные фильмов в таблицах пользователей, индексов нет
+LEGACY_SCHEMA = (
+    'CREATE TABLE "base_movies" ("id" INTEGER NOT NULL PRIMARY KEY, "date_search" DATE NOT NULL, '
+    '"user_id" VARCHAR(255) NOT NULL, "movie_id" VARCHAR(255) NOT NULL, "name_movie" TEXT, '
+    '"alternative_name" VARCHAR(255), "type_movie" VARCHAR(255), "year" VARCHAR(255), "countries" VARCHAR(255), '
+    '"genre" TEXT, "rating" VARCHAR(255), "age_rating" VARCHAR(255), "short_description" TEXT, '
+    '"description" TEXT, "poster" TEXT, "is_series" INTEGER, "is_viewed" INTEGER NOT NULL, '
+    '"is_favorites" INTEGER NOT NULL, "type_search" VARCHAR(255) NOT NULL, "text_search" TEXT NOT NULL)',
+    'CREATE TABLE "movies_postponed" ("id" INTEGER NOT NULL PRIMARY KEY, "date_search" DATE NOT NULL, '
+    '"user_id" VARCHAR(255) NOT NULL, "movie_id" VARCHAR(255) NOT NULL, "name_movie" TEXT, '
+    '"alternative_name" VARCHAR(255), "type_movie" VARCHAR(255), "year" VARCHAR(255), "countries" VARCHAR(255), '
+    '"genre" TEXT, "rating" VARCHAR(255), "age_rating" VARCHAR(255), "short_description" TEXT, '
+    '"description" TEXT, "poster" TEXT, "is_series" INTEGER, "is_viewed" INTEGER NOT NULL, '
+    '"is_favorites" INTEGER NOT NULL)',
+    'CREATE TABLE "query_string" ("id" INTEGER NOT NULL PRIMARY KEY, "date_search" DATE NOT NULL, '
+    '"user_id" VARCHAR(255) NOT NULL, "type_search" VARCHAR(255) NOT NULL, "text_search" TEXT NOT NULL)',
+    # Повторная запись фильма у пользователя мешает созданию уникального индекса
+    "INSERT INTO movies_postponed (date_search, user_id, movie_id, name_movie, is_viewed, is_favorites) "
+    "VALUES ('2024-01-01', '1', '301', 'Матрица', 0, 1), ('2024-01-02', '1', '301', 'Матрица', 1, 0)",
+    "INSERT INTO base_movies (date_search, user_id, movie_id, name_movie, is_viewed, is_favorites, "
+    "type_search, text_search) VALUES ('2024-01-01', '1', '301', 'Матрица', 0, 1, 'movie_search', 'матрица')",
+    "INSERT INTO query_string (date_search, user_id, type_search, text_search) "
+    "VALUES ('2024-01-01', '1', 'movie_search', 'матрица')",
+)
+
+
+@pytest.fixture
+def movies_db(tmp_path):
+    """
+    Подключает модели базы данных фильмов к отдельному файлу на время теста.
+    """
+    database = db.database
+    db.close()
+    db.init(str(tmp_path / "movies.db"), timeout=db._timeout)
+    yield str(tmp_path / "movies.db")
+    db.close()
+    db.init(database, timeout=db._timeout)
+
+
+def test_hot_queries_use_indexes_on_new_database(movies_db):
+    migrate_movies_db()
+    db.create_tables([QueryString, Film, BaseMovie, MoviePostponed])
+
+    assert find_full_scans() == {}
+
+
+def test_hot_queries_use_indexes_after_migration(movies_db):
+    with sqlite3.connect(movies_db) as connection:
+        for statement in LEGACY_SCHEMA:
+            connection.execute(statement)
+
+    migrate_movies_db()
+    db.create_tables([QueryString, Film, BaseMovie, MoviePostponed])
+
+    assert db.pragma("user_version") == len(MIGRATIONS)
+    assert MoviePostponed.select().count() == 1
+    assert Film.get_by_id("301").name_movie == "Матрица"
+    assert find_full_scans() == {}
+
+
+def test_full_scan_is_reported(movies_db):
+    migrate_movies_db()
+    db.create_tables([QueryString, Film, BaseMovie, MoviePostponed])
+    db.execute_sql("DROP INDEX moviepostponed_user_id_movie_id")
+
+    assert "postponed_by_movie" in find_full_scans()
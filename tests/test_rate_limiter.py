@@ -0,0 +1,34 @@
+import asyncio
+import threading
+
+import pytest
+
+from logs.exceptions import ApiRateLimitError
+from site_API.rate_limiter import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, TokenBucketLimiter
+
+
+def test_async_waiters_do_not_take_threads():
+    limiter = TokenBucketLimiter(rate=100, burst=1)
+    threads = []
+
+    async def acquire_all():
+        async def acquire():
+            threads.append(threading.active_count())
+            await limiter.acquire_async(PRIORITY_INTERACTIVE, timeout=5)
+
+        await asyncio.gather(*(acquire() for _ in range(50)))
+        threads.append(threading.active_count())
+
+    asyncio.run(acquire_all())
+
+    assert max(threads) == threads[0]
+    assert limiter.stats()["waits"] == 49
+
+
+def test_async_acquire_times_out():
+    limiter = TokenBucketLimiter(rate=0.001, burst=1)
+    limiter.acquire()
+
+    with pytest.raises(ApiRateLimitError):
+        asyncio.run(limiter.acquire_async(PRIORITY_BACKGROUND, timeout=0.05))
+    assert limiter.stats()["rejected"] == 1
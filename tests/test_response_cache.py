@@ -0,0 +1,18 @@
+from site_API import core
+
+
+PARAMS = {"query": "матрица", "page": 1, "limit": 15}
+PAYLOAD = {"docs": [{"id": 301}], "pages": 1}
+
+
+def test_stale_fallback_counts_one_miss(stub_api, monkeypatch):
+    monkeypatch.setattr(core.response_cache, "ttl_by_endpoint", {"/v1.4/movie/search": 0})
+    core.response_cache.set("/v1.4/movie/search", PARAMS, PAYLOAD)
+    monkeypatch.setattr(core.quota, "is_nearly_exhausted", lambda: True)
+    before = core.response_cache.stats()
+
+    assert core.api_request(PARAMS, "/v1.4/movie/search") == PAYLOAD
+
+    after = core.response_cache.stats()
+    assert (after["hits"] - before["hits"], after["misses"] - before["misses"]) == (0, 1)
+    assert stub_api.requests == 0
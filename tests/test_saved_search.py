@@ -0,0 +1,19 @@
+from database.common.models_movies import QueryString
+from services.services_database import search_for_movie, update_database_query
+
+
+MOVIE = {"id": 301, "name": "Матрица", "description": "Описание", "poster": {"url": None}}
+
+
+def test_saved_search_keeps_page_limit():
+    search_for_movie(1, [MOVIE], "movie_search", text_search="матрица", page_limit=30)
+
+    assert update_database_query(1, "матрица") == 30
+    assert update_database_query(1, "матрица") == 30
+    assert QueryString.select().where(QueryString.text_search == "матрица").count() == 1
+
+
+def test_search_saved_before_page_limit_returns_none():
+    search_for_movie(2, [MOVIE], "movie_search", text_search="терминатор")
+
+    assert update_database_query(2, "терминатор") is None
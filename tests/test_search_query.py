@@ -0,0 +1,41 @@
+import pytest
+from telebot.types import Update
+
+from services import services_api
+from services.services_api import run_search_query
+from stub_api.telegram import make_callback_update, make_message_update
+
+
+@pytest.fixture
+def telegram(monkeypatch):
+    """
+    Вызовы Telegram Bot API из `run_search_query` без обращения к сети.
+    """
+    calls = []
+    for method in ("delete_message", "send_message", "set_state", "reset_data"):
+        monkeypatch.setattr(services_api.bot, method, lambda *args, name=method, **kwargs: calls.append(name))
+    return calls
+
+
+def test_title_search_makes_one_request(stub_api, telegram):
+    message = Update.de_json(make_message_update(1, 101, "Матрица")).message
+
+    movie_info, pages, limit = run_search_query(
+        message, search_criteria="Матрица", type_search="movie_search", text_search="Матрица"
+    )
+
+    assert movie_info
+    assert pages >= 1
+    assert stub_api.requests == 1
+
+
+def test_filter_search_makes_one_request(stub_api, telegram):
+    call = Update.de_json(make_callback_update(2, 102, "search_filters")).callback_query
+    filters = {"genres": "драма", "rating": "1-10"}
+
+    movie_info, pages, limit = run_search_query(
+        call, search_criteria=filters, type_search="movie_by_filters", text_search="драма 1-10"
+    )
+
+    assert movie_info
+    assert stub_api.requests == 1
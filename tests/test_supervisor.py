@@ -0,0 +1,42 @@
+import threading
+
+from utils import supervisor as supervisor_module
+from utils.supervisor import Supervisor
+
+
+class _Process:
+    def __init__(self, alive: bool) -> None:
+        self.alive = alive
+        self.exitcode = None if alive else 1
+
+    def is_alive(self) -> bool:
+        return self.alive
+
+
+def test_dispatch_restarts_dead_worker_with_full_queue(monkeypatch):
+    monkeypatch.setattr(supervisor_module, "DISPATCH_CHECK_INTERVAL", 0.05)
+    supervisor = Supervisor(workers=1, queue_size=1)
+    supervisor._processes = [_Process(alive=False)]
+    received = []
+
+    def spawn(index):
+        def drain():
+            while True:
+                update = supervisor._queues[index].get()
+                if update is None:
+                    return
+                received.append(update["update_id"])
+
+        threading.Thread(target=drain, daemon=True).start()
+        return _Process(alive=True)
+
+    monkeypatch.setattr(supervisor, "_spawn", spawn)
+    updates = [{"update_id": update_id, "message": {"chat": {"id": 1}}} for update_id in range(3)]
+    dispatcher = threading.Thread(target=supervisor.dispatch, args=(updates,), daemon=True)
+    dispatcher.start()
+    dispatcher.join(5)
+
+    assert not dispatcher.is_alive()
+    assert supervisor.restarts == 1
+    assert supervisor.routed == 3
+    supervisor._queues[0].put(None)
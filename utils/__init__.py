@@ -1 +1,6 @@
+from . import db_middleware
 from . import set_bot_commands
+from . import bot_setup
+from . import supervisor
+from . import telegram_scheduler
+from . import webhook
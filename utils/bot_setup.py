@@ -0,0 +1,21 @@
+from telebot import TeleBot, apihelper
+from telebot.custom_filters import StateFilter
+
+from config_data.config import TELEGRAM_SCHEDULER
+from utils.db_middleware import DatabaseConnectionMiddleware
+from utils.telegram_scheduler import telegram_scheduler
+
+
+def setup_bot(bot: TeleBot) -> None:
+    """
+    Подключает к боту фильтр состояний, промежуточный обработчик подключений к базам данных и планировщик
+    исходящих запросов к Telegram Bot API. Вызывается в процессе, который обрабатывает обновления: в основном
+    процессе либо в каждом процессе-обработчике режима супервизора.
+
+    Args:
+        bot (TeleBot): Экземпляр бота.
+    """
+    bot.add_custom_filter(StateFilter(bot))
+    bot.setup_middleware(DatabaseConnectionMiddleware())
+    if TELEGRAM_SCHEDULER:
+        apihelper.CUSTOM_REQUEST_SENDER = telegram_scheduler.request
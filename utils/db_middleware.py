@@ -0,0 +1,50 @@
+from typing import Any, Dict, List
+
+from peewee import SqliteDatabase
+from telebot.handler_backends import BaseMiddleware
+
+from database.common.model_api_cache import db_api_cache
+from database.common.model_images import db_image
+from database.common.model_states import db_states
+from database.common.models_movies import db
+
+
+class DatabaseConnectionMiddleware(BaseMiddleware):
+    """
+    Промежуточный обработчик, который открывает подключения к базам данных SQLite перед обработкой обновления
+    и закрывает их после нее. Обработчики выполняются в пуле потоков TeleBot, а подключения peewee
+    принадлежат потоку, поэтому каждый обработчик работает с собственными подключениями, не удерживая
+    их между обновлениями.
+
+    Attributes:
+        update_types (List[str]): Типы обновлений, для которых выполняется промежуточный обработчик.
+        databases (List[SqliteDatabase]): Базы данных, подключения к которым открываются и закрываются.
+    """
+    def __init__(self, databases: List[SqliteDatabase] | None = None) -> None:
+        super().__init__()
+        self.update_types = ["message", "callback_query"]
+        self.databases = databases if databases is not None else [db, db_image, db_api_cache, db_states]
+
+    def pre_process(self, message: Any, data: Dict[str, Any]) -> None:
+        """
+        Открывает подключения к базам данных в потоке обработчика.
+
+        Args:
+            message (Any): Обновление (Message или CallbackQuery).
+            data (Dict[str, Any]): Данные, передаваемые между промежуточным обработчиком и обработчиком.
+        """
+        for database in self.databases:
+            database.connect(reuse_if_open=True)
+
+    def post_process(self, message: Any, data: Dict[str, Any], exception: Exception | None) -> None:
+        """
+        Закрывает подключения к базам данных, открытые в потоке обработчика.
+
+        Args:
+            message (Any): Обновление (Message или CallbackQuery).
+            data (Dict[str, Any]): Данные, передаваемые между промежуточным обработчиком и обработчиком.
+            exception (Exception | None): Исключение, возникшее при обработке обновления.
+        """
+        for database in self.databases:
+            if not database.is_closed():
+                database.close()
@@ -0,0 +1,240 @@
+import multiprocessing
+import os
+import queue
+import signal
+import sys
+import time
+from typing import Any, Dict, List
+
+from requests.exceptions import RequestException
+from telebot import apihelper
+from telebot.apihelper import ApiTelegramException
+from telebot.types import Update
+
+from config_data.config import BOT_TOKEN
+from logs.logging_config import log
+from site_API.core import site
+
+
+# Обновления, относящиеся к сообщению в чате, и обновления, относящиеся к чату без сообщения
+MESSAGE_UPDATES = (
+    "message", "edited_message", "channel_post", "edited_channel_post", "business_message",
+    "edited_business_message",
+)
+CHAT_UPDATES = ("my_chat_member", "chat_member", "chat_join_request", "message_reaction", "message_reaction_count")
+# Интервал проверки процессов-обработчиков при ожидании места в заполненной очереди в секундах
+DISPATCH_CHECK_INTERVAL = 1
+
+
+def update_chat_id(update: Dict[str, Any]) -> int:
+    """
+    Определяет чат, к которому относится обновление Telegram. Для обновлений без чата (например, инлайн-запросов)
+    возвращается идентификатор пользователя, а если нет и его - идентификатор обновления.
+
+    Args:
+        update (Dict[str, Any]): Обновление в формате Telegram Bot API.
+
+    Returns:
+        int: Идентификатор чата, пользователя либо обновления.
+    """
+    for kind in MESSAGE_UPDATES + CHAT_UPDATES:
+        if kind in update:
+            return update[kind]["chat"]["id"]
+    callback = update.get("callback_query")
+    if callback:
+        message = callback.get("message")
+        return message["chat"]["id"] if message else callback["from"]["id"]
+    for value in update.values():
+        if isinstance(value, dict) and "from" in value:
+            return value["from"]["id"]
+    return update["update_id"]
+
+
+def worker_index(update: Dict[str, Any], workers: int) -> int:
+    """
+    Выбирает процесс-обработчик для обновления по идентификатору чата: обновления одного чата всегда
+    обрабатываются одним процессом.
+
+    Args:
+        update (Dict[str, Any]): Обновление в формате Telegram Bot API.
+        workers (int): Количество процессов-обработчиков.
+
+    Returns:
+        int: Номер процесса-обработчика.
+    """
+    return hash(update_chat_id(update)) % workers
+
+
+def run_worker(index: int, updates: multiprocessing.Queue) -> None:
+    """
+    Точка входа процесса-обработчика: обрабатывает обновления из очереди по одному в порядке поступления,
+    пока не получит None. Завершается также при завершении процесса-получателя.
+
+    Args:
+        index (int): Номер процесса-обработчика.
+        updates (multiprocessing.Queue): Очередь обновлений процесса-обработчика.
+    """
+    from loader import bot
+    import handlers  # noqa: F401 (регистрация обработчиков)
+    from utils.bot_setup import setup_bot
+    from utils.telegram_scheduler import telegram_scheduler
+
+    setup_bot(bot)
+    # Обновления одного чата обрабатываются последовательно, чтобы сохранить их порядок
+    bot.threaded = False
+    log.info(f"Процесс-обработчик {index} запущен (pid {os.getpid()}).")
+
+    parent = multiprocessing.parent_process()
+    while True:
+        try:
+            update = updates.get(timeout=1)
+        except queue.Empty:
+            if parent is not None and not parent.is_alive():
+                break
+            continue
+        if update is None:
+            break
+        try:
+            bot.process_new_updates([Update.de_json(update)])
+        except Exception as exc:
+            log.error(
+                f"Процесс-обработчик {index}: ошибка обработки обновления {update.get('update_id')} "
+                f"{type(exc).__name__}: {exc}"
+            )
+    telegram_scheduler.flush(timeout=5)
+    log.info(f"Процесс-обработчик {index} остановлен.")
+
+
+class Supervisor:
+    """
+    Режим супервизора: процесс-получатель запрашивает обновления методом `getUpdates` и распределяет их
+    между процессами-обработчиками по идентификатору чата, поэтому обновления одного чата обрабатываются
+    одним процессом в порядке поступления. Очереди процессов-обработчиков ограничены: при заполнении очереди
+    получатель ожидает ее освобождения и не запрашивает новые обновления. Завершившийся процесс-обработчик
+    перезапускается.
+
+    Состояния пользователей хранятся в общем хранилище SQLite (STATE_STORAGE=sqlite), расход суточного лимита
+    API - в общей базе данных, а ограничение частоты запросов к API делится между процессами-обработчиками.
+    Кэши, привязанные к чату (загруженные заранее страницы, сессии), остаются в процессе-обработчике чата.
+
+    Attributes:
+        workers (int): Количество процессов-обработчиков.
+        queue_size (int): Максимальное количество обновлений в очереди процесса-обработчика.
+        poll_timeout (int): Время ожидания обновлений методом `getUpdates` в секундах.
+        routed (int): Количество распределенных обновлений.
+        restarts (int): Количество перезапусков процессов-обработчиков.
+    """
+    def __init__(self, workers: int, queue_size: int, poll_timeout: int = 20) -> None:
+        self.workers = workers
+        self.queue_size = queue_size
+        self.poll_timeout = poll_timeout
+        self.routed = 0
+        self.restarts = 0
+        self._context = multiprocessing.get_context("spawn")
+        self._queues = [self._context.Queue(maxsize=queue_size) for _ in range(workers)]
+        self._processes: List[multiprocessing.Process] = []
+        self._running = False
+
+    def _spawn(self, index: int) -> multiprocessing.Process:
+        process = self._context.Process(
+            target=run_worker, args=(index, self._queues[index]), name=f"bot-worker-{index}", daemon=True
+        )
+        process.start()
+        return process
+
+    def start(self) -> None:
+        """
+        Запускает процессы-обработчики. Ограничение частоты запросов к API делится между ними поровну
+        через переменные окружения, которые наследуют процессы-обработчики.
+        """
+        os.environ["API_RATE_LIMIT"] = str(site.api_rate_limit / self.workers)
+        os.environ["API_RATE_BURST"] = str(max(site.api_rate_burst // self.workers, 1))
+        self._processes = [self._spawn(index) for index in range(self.workers)]
+        log.info(f"Запущен режим супервизора: {self.workers} процессов-обработчиков.")
+
+    def check_workers(self) -> None:
+        """
+        Перезапускает завершившиеся процессы-обработчики.
+        """
+        for index, process in enumerate(self._processes):
+            if not process.is_alive():
+                log.error(f"Процесс-обработчик {index} завершился с кодом {process.exitcode} и будет перезапущен.")
+                self._processes[index] = self._spawn(index)
+                self.restarts += 1
+
+    def dispatch(self, updates: List[Dict[str, Any]]) -> None:
+        """
+        Передает обновления в очереди процессов-обработчиков. При заполненной очереди ожидает ее освобождения,
+        перезапуская завершившиеся процессы-обработчики: иначе очередь завершившегося процесса не освободилась бы.
+
+        Args:
+            updates (List[Dict[str, Any]]): Обновления в формате Telegram Bot API.
+        """
+        for update in updates:
+            worker_queue = self._queues[worker_index(update, self.workers)]
+            while True:
+                try:
+                    worker_queue.put(update, timeout=DISPATCH_CHECK_INTERVAL)
+                    break
+                except queue.Full:
+                    self.check_workers()
+            self.routed += 1
+
+    def run(self, skip_pending: bool = True) -> None:
+        """
+        Запускает процессы-обработчики и получает обновления, пока супервизор не будет остановлен. При получении
+        SIGTERM процессы-обработчики завершаются после обработки полученных обновлений.
+
+        Args:
+            skip_pending (bool): Пропустить обновления, полученные до запуска. По умолчанию True.
+
+        Raises:
+            ApiTelegramException: Если Telegram отклонил токен бота.
+        """
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        self.start()
+        offset = None
+        if skip_pending:
+            pending = apihelper.get_updates(BOT_TOKEN, offset=-1)
+            offset = pending[-1]["update_id"] + 1 if pending else None
+
+        self._running = True
+        try:
+            while self._running:
+                self.check_workers()
+                try:
+                    updates = apihelper.get_updates(BOT_TOKEN, offset=offset, long_polling_timeout=self.poll_timeout)
+                except ApiTelegramException as exc:
+                    if exc.error_code == 401:
+                        raise
+                    log.error(f"Ошибка получения обновлений: {exc}")
+                    time.sleep(3)
+                    continue
+                except RequestException as exc:
+                    log.error(f"Ошибка соединения при получении обновлений: {type(exc).__name__}: {exc}")
+                    time.sleep(3)
+                    continue
+                if updates:
+                    self.dispatch(updates)
+                    offset = updates[-1]["update_id"] + 1
+        finally:
+            self.stop()
+
+    def stop(self, timeout: float = 10) -> None:
+        """
+        Останавливает получение обновлений и процессы-обработчики после обработки уже полученных обновлений.
+
+        Args:
+            timeout (float): Время ожидания завершения каждого процесса-обработчика в секундах.
+        """
+        self._running = False
+        for index, worker_queue in enumerate(self._queues):
+            try:
+                worker_queue.put(None, timeout=timeout)
+            except queue.Full:
+                log.error(f"Очередь процесса-обработчика {index} заполнена, процесс будет остановлен принудительно.")
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
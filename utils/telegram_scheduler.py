@@ -0,0 +1,411 @@
+import json
+import time
+from collections import OrderedDict
+from io import BytesIO
+from threading import Condition, Event, Lock, Thread
+from typing import Any, Dict, List, Tuple
+from urllib.parse import urlparse
+
+from requests import RequestException, Response
+from telebot import apihelper
+
+from config_data.config import (
+    BOT_WORKERS,
+    TELEGRAM_CHAT_BURST,
+    TELEGRAM_CHAT_RATE,
+    TELEGRAM_GLOBAL_BURST,
+    TELEGRAM_GLOBAL_RATE,
+    TELEGRAM_MAX_RETRIES,
+    TELEGRAM_QUEUE_TIMEOUT,
+)
+from logs.exceptions import ApiRateLimitError
+from logs.logging_config import log
+from site_API.rate_limiter import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, TokenBucketLimiter
+
+
+# Методы, которые отправляют или изменяют сообщения в чате: ограничиваются частотой в чате и общей частотой бота
+CHAT_METHOD_PREFIXES = ("send", "edit", "copy", "forward")
+# Методы удаления сообщений: результат обработчику не нужен, поэтому удаление выполняется в фоне
+# с низким приоритетом, объединяя удаления сообщений одного чата в один вызов `deleteMessages`
+DELETE_METHODS = ("deleteMessage", "deleteMessages")
+# Максимальное количество сообщений в одном вызове `deleteMessages` (ограничение Telegram)
+MAX_DELETE_BATCH = 100
+# Время накопления удалений сообщений чата перед отправкой в секундах
+DELETE_BATCH_DELAY = 0.05
+# Количество фоновых потоков удаления сообщений
+DELETE_WORKERS = 4
+# Методы, которые полностью заменяют содержимое сообщения: из нескольких ожидающих редактирований одного
+# сообщения одним методом выполняется только последнее
+EDIT_METHODS = ("editMessageText", "editMessageCaption", "editMessageMedia", "editMessageReplyMarkup")
+# Максимальное количество корзин токенов чатов в памяти (корзины давно неактивных чатов удаляются)
+MAX_CHAT_BUCKETS = 10000
+
+
+class _Call:
+    """
+    Вызов метода Telegram Bot API, ожидающий отправки.
+
+    Attributes:
+        response (Response | None): Ответ Telegram.
+        superseded_by (_Call | None): Более позднее редактирование того же сообщения, заменившее вызов.
+        done (Event): Событие завершения вызова.
+    """
+    def __init__(self) -> None:
+        self.response: Response | None = None
+        self.superseded_by: "_Call | None" = None
+        self.done = Event()
+
+
+class _Deletions:
+    """
+    Сообщения чата, ожидающие удаления.
+
+    Attributes:
+        method (str): HTTP-метод запроса.
+        base_url (str): Адрес методов Telegram Bot API без названия метода.
+        kwargs (Dict[str, Any]): Параметры запроса `requests` без параметров метода (timeout, proxies).
+        message_ids (List[int]): Идентификаторы сообщений.
+        created (float): Время добавления первого сообщения (time.monotonic).
+    """
+    def __init__(self, method: str, base_url: str, kwargs: Dict[str, Any]) -> None:
+        self.method = method
+        self.base_url = base_url
+        self.kwargs = kwargs
+        self.message_ids: List[int] = []
+        self.created = time.monotonic()
+
+
+def method_name(url: str) -> str:
+    """
+    Возвращает название метода Telegram Bot API из адреса запроса.
+
+    Args:
+        url (str): Адрес запроса.
+
+    Returns:
+        str: Название метода.
+    """
+    return urlparse(url).path.rsplit("/", 1)[-1]
+
+
+def ok_response(result: Any = True) -> Response:
+    """
+    Формирует успешный ответ Telegram для вызова, выполняемого в фоне.
+
+    Args:
+        result (Any): Значение поля `result` ответа. По умолчанию True.
+
+    Returns:
+        Response: Ответ в формате Telegram Bot API.
+    """
+    response = Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response.raw = BytesIO(f'{{"ok": true, "result": {str(result).lower()}}}'.encode())
+    return response
+
+
+def retry_after(response: Response) -> float | None:
+    """
+    Возвращает время, через которое Telegram разрешает повторить запрос, отклоненный из-за превышения частоты
+    запросов (ответ 429).
+
+    Args:
+        response (Response): Ответ Telegram.
+
+    Returns:
+        float | None: Время ожидания в секундах либо None, если запрос не отклонен по частоте.
+    """
+    if response.status_code != 429:
+        return None
+    try:
+        return float(response.json().get("parameters", {}).get("retry_after", 1))
+    except ValueError:
+        return 1.0
+
+
+class TelegramScheduler:
+    """
+    Планировщик исходящих запросов к Telegram Bot API. Подключается к telebot через
+    `apihelper.CUSTOM_REQUEST_SENDER`, поэтому через него проходят все вызовы методов бота:
+        - отправка и редактирование сообщений ожидают токен в корзине чата (ограничение Telegram - около
+        одного сообщения в секунду в чате) и в общей корзине бота (около 30 сообщений в секунду);
+        - удаление сообщений выполняется в фоновом потоке с низким приоритетом: обработчик получает успешный
+        ответ сразу, а удаление не забирает токены у ожидающих отправок. Удаления сообщений одного чата
+        объединяются в вызов `deleteMessages` (до 100 сообщений), при сетевых ошибках и ответах 5xx удаление
+        повторяется, а уже удаленные или не найденные сообщения (ответ 400) пропускаются без ошибки;
+        - из нескольких ожидающих редактирований одного сообщения одним методом выполняется только последнее,
+        более ранние вызовы возвращают его ответ;
+        - на ответ 429 запросы в чат (или все запросы, если чат не указан) приостанавливаются на время
+        `retry_after` из ответа, и запрос повторяется не более `max_retries` раз.
+    Остальные методы (получение обновлений, ответы на нажатия кнопок и т.п.) выполняются без ограничений.
+
+    Attributes:
+        chat_rate (float): Скорость пополнения корзины чата (сообщений в секунду).
+        chat_burst (int): Вместимость корзины чата.
+        max_retries (int): Максимальное количество повторов запроса после ответа 429 (и повторов удаления
+            сообщений после сетевых ошибок).
+        queue_timeout (float): Максимальное время ожидания токена в секундах.
+        global_limiter (TokenBucketLimiter): Общая корзина токенов бота.
+        sent (int): Количество выполненных запросов.
+        coalesced (int): Количество редактирований, замененных более поздним редактированием.
+        throttled (int): Количество ответов 429.
+        deleted (int): Количество удаленных сообщений.
+        delete_batches (int): Количество вызовов удаления сообщений.
+        dropped (int): Количество сообщений, которые Telegram не нашел или не смог удалить.
+        failed (int): Количество сообщений, не удаленных после всех повторов.
+    """
+    def __init__(
+        self,
+        global_rate: float,
+        global_burst: int,
+        chat_rate: float,
+        chat_burst: int,
+        max_retries: int = 3,
+        queue_timeout: float = 30,
+    ) -> None:
+        self.chat_rate = chat_rate
+        self.chat_burst = chat_burst
+        self.max_retries = max_retries
+        self.queue_timeout = queue_timeout
+        self.global_limiter = TokenBucketLimiter(global_rate, global_burst)
+        self.sent = 0
+        self.coalesced = 0
+        self.throttled = 0
+        self.deleted = 0
+        self.delete_batches = 0
+        self.dropped = 0
+        self.failed = 0
+        self._chat_limiters: OrderedDict[str, TokenBucketLimiter] = OrderedDict()
+        self._pending_edits: Dict[Tuple[str, str, str], _Call] = {}
+        self._paused_until: Dict[str | None, float] = {}
+        self._deletions: OrderedDict[str, _Deletions] = OrderedDict()
+        # Количество сообщений в очереди удаления и в выполняемых вызовах удаления
+        self._deleting = 0
+        self._workers: List[Thread] = []
+        self._lock = Lock()
+        self._deletions_changed = Condition(self._lock)
+
+    def _chat_limiter(self, chat_id: str) -> TokenBucketLimiter:
+        with self._lock:
+            limiter = self._chat_limiters.get(chat_id)
+            if limiter is None:
+                limiter = self._chat_limiters[chat_id] = TokenBucketLimiter(self.chat_rate, self.chat_burst)
+                while len(self._chat_limiters) > MAX_CHAT_BUCKETS:
+                    self._chat_limiters.popitem(last=False)
+            self._chat_limiters.move_to_end(chat_id)
+            return limiter
+
+    def _wait_pause(self, chat_id: str | None) -> None:
+        with self._lock:
+            resume_at = max(self._paused_until.get(None, 0), self._paused_until.get(chat_id, 0))
+        delay = resume_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _pause(self, chat_id: str | None, delay: float) -> None:
+        with self._lock:
+            self.throttled += 1
+            self._paused_until[chat_id] = max(self._paused_until.get(chat_id, 0), time.monotonic() + delay)
+
+    def _send(self, chat_id: str | None, method: str, url: str, **kwargs: Any) -> Response:
+        for attempt in range(self.max_retries + 1):
+            self._wait_pause(chat_id)
+            response = apihelper._get_req_session().request(method, url, **kwargs)
+            with self._lock:
+                self.sent += 1
+            delay = retry_after(response)
+            if delay is None or attempt == self.max_retries:
+                return response
+            log.warning(f"Telegram ограничил частоту запросов `{method_name(url)}`: повтор через {delay} с.")
+            self._pause(chat_id, delay)
+            for file in (kwargs.get("files") or {}).values():
+                file = file[1] if isinstance(file, tuple) else file
+                if hasattr(file, "seek"):
+                    file.seek(0)
+        return response
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Response:
+        """
+        Выполняет запрос к Telegram Bot API с учетом ограничений частоты (сигнатура
+        `apihelper.CUSTOM_REQUEST_SENDER`).
+
+        Args:
+            method (str): HTTP-метод запроса.
+            url (str): Адрес метода Telegram Bot API.
+            **kwargs (Any): Параметры запроса `requests` (params, files, timeout, proxies).
+
+        Returns:
+            Response: Ответ Telegram либо успешный ответ для вызова, выполняемого в фоне.
+
+        Raises:
+            ApiRateLimitError: Если запрос не дождался токена за время `queue_timeout`.
+        """
+        name = method_name(url)
+        params = kwargs.get("params") or {}
+        chat_id = str(params["chat_id"]) if "chat_id" in params else None
+
+        if name in DELETE_METHODS and chat_id is not None:
+            if "message_ids" in params:
+                message_ids = json.loads(params["message_ids"])
+            else:
+                message_ids = [params["message_id"]]
+            self._submit_deletion(method, url, chat_id, [int(message_id) for message_id in message_ids], kwargs)
+            return ok_response()
+        if not name.startswith(CHAT_METHOD_PREFIXES) or chat_id is None:
+            return self._send(chat_id, method, url, **kwargs)
+
+        call = _Call()
+        key = (name, chat_id, str(params.get("message_id")))
+        if name in EDIT_METHODS:
+            with self._lock:
+                previous = self._pending_edits.get(key)
+                if previous is not None:
+                    previous.superseded_by = call
+                self._pending_edits[key] = call
+        try:
+            self._chat_limiter(chat_id).acquire(PRIORITY_INTERACTIVE, self.queue_timeout)
+            if call.superseded_by is None:
+                self.global_limiter.acquire(PRIORITY_INTERACTIVE, self.queue_timeout)
+            with self._lock:
+                if self._pending_edits.get(key) is call:
+                    del self._pending_edits[key]
+                superseded_by = call.superseded_by
+            if superseded_by is not None:
+                with self._lock:
+                    self.coalesced += 1
+                superseded_by.done.wait()
+                call.response = superseded_by.response
+            else:
+                call.response = self._send(chat_id, method, url, **kwargs)
+        finally:
+            with self._lock:
+                if self._pending_edits.get(key) is call:
+                    del self._pending_edits[key]
+            call.done.set()
+        if call.response is None:
+            raise ApiRateLimitError
+        return call.response
+
+    def _submit_deletion(
+        self, method: str, url: str, chat_id: str, message_ids: List[int], kwargs: Dict[str, Any]
+    ) -> None:
+        with self._deletions_changed:
+            deletions = self._deletions.get(chat_id)
+            if deletions is None:
+                request_kwargs = {name: value for name, value in kwargs.items() if name not in ("params", "files")}
+                deletions = self._deletions[chat_id] = _Deletions(method, url.rsplit("/", 1)[0], request_kwargs)
+            deletions.message_ids.extend(message_ids)
+            self._deleting += len(message_ids)
+            if not self._workers:
+                for index in range(DELETE_WORKERS):
+                    worker = Thread(target=self._run_deletions, name=f"telegram-deletions-{index}", daemon=True)
+                    worker.start()
+                    self._workers.append(worker)
+            self._deletions_changed.notify_all()
+
+    def _run_deletions(self) -> None:
+        while True:
+            with self._deletions_changed:
+                self._deletions_changed.wait_for(lambda: self._deletions)
+                chat_id, deletions = next(iter(self._deletions.items()))
+                delay = deletions.created + DELETE_BATCH_DELAY - time.monotonic()
+                if delay > 0:
+                    # Удаления сообщений чата еще накапливаются
+                    self._deletions_changed.wait(delay)
+                    continue
+                del self._deletions[chat_id]
+                message_ids = deletions.message_ids[:MAX_DELETE_BATCH]
+                if len(deletions.message_ids) > MAX_DELETE_BATCH:
+                    deletions.message_ids = deletions.message_ids[MAX_DELETE_BATCH:]
+                    self._deletions[chat_id] = deletions
+            try:
+                self._delete_messages(chat_id, deletions, message_ids)
+            except Exception as exc:
+                log.error(f"Ошибка удаления сообщений в чате {chat_id}: {type(exc).__name__} - {exc}.")
+            finally:
+                with self._deletions_changed:
+                    self._deleting -= len(message_ids)
+                    self._deletions_changed.notify_all()
+
+    def _delete_messages(self, chat_id: str, deletions: _Deletions, message_ids: List[int]) -> None:
+        if len(message_ids) == 1:
+            name, params = "deleteMessage", {"chat_id": chat_id, "message_id": message_ids[0]}
+        else:
+            name, params = "deleteMessages", {"chat_id": chat_id, "message_ids": json.dumps(message_ids)}
+        url = f"{deletions.base_url}/{name}"
+
+        error = ""
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(min(0.5 * 2 ** (attempt - 1), 5))
+            try:
+                self.global_limiter.acquire(PRIORITY_BACKGROUND, self.queue_timeout)
+                response = self._send(chat_id, deletions.method, url, params=params, **deletions.kwargs)
+            except (ApiRateLimitError, RequestException) as exc:
+                error = f"{type(exc).__name__} - {exc}"
+                continue
+            with self._lock:
+                self.delete_batches += 1
+            if response.status_code == 200:
+                with self._lock:
+                    self.deleted += len(message_ids)
+                return
+            if 400 <= response.status_code < 500 and response.status_code != 429:
+                # Сообщение уже удалено, не найдено либо не может быть удалено ботом
+                with self._lock:
+                    self.dropped += len(message_ids)
+                log.debug(f"Telegram не удалил сообщения {message_ids} в чате {chat_id}: {response.text}")
+                return
+            error = response.text
+        with self._lock:
+            self.failed += len(message_ids)
+        log.warning(f"Не удалось удалить сообщения {message_ids} в чате {chat_id}: {error}")
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Ожидает удаления сообщений из очереди удаления (например, перед остановкой бота).
+
+        Args:
+            timeout (float | None): Максимальное время ожидания в секундах. По умолчанию без ограничения.
+
+        Returns:
+            bool: True, если очередь удаления пуста.
+        """
+        with self._deletions_changed:
+            return self._deletions_changed.wait_for(lambda: not self._deleting, timeout)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Возвращает статистику планировщика.
+
+        Returns:
+            Dict[str, float]: Количество выполненных, объединенных и отклоненных по частоте запросов, количество
+                удаленных, пропущенных и не удаленных сообщений, вызовов удаления, размер очереди удаления
+                и статистика общей корзины токенов.
+        """
+        with self._lock:
+            stats = {
+                "sent": self.sent,
+                "coalesced": self.coalesced,
+                "throttled": self.throttled,
+                "deleted": self.deleted,
+                "delete_batches": self.delete_batches,
+                "dropped": self.dropped,
+                "failed": self.failed,
+                "queued": self._deleting,
+            }
+        stats.update({f"global_{name}": value for name, value in self.global_limiter.stats().items()})
+        return stats
+
+
+# В режиме супервизора каждый процесс-обработчик получает свою долю общего ограничения бота,
+# а ограничения чатов соблюдаются в процессе, который обслуживает чат
+telegram_scheduler = TelegramScheduler(
+    global_rate=TELEGRAM_GLOBAL_RATE / BOT_WORKERS,
+    global_burst=max(TELEGRAM_GLOBAL_BURST // BOT_WORKERS, 1),
+    chat_rate=TELEGRAM_CHAT_RATE,
+    chat_burst=TELEGRAM_CHAT_BURST,
+    max_retries=TELEGRAM_MAX_RETRIES,
+    queue_timeout=TELEGRAM_QUEUE_TIMEOUT,
+)
@@ -0,0 +1,218 @@
+import json
+import signal
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from queue import Full, Queue
+from threading import Lock, Thread
+from typing import Any, Dict, List
+
+from telebot import TeleBot
+from telebot.types import Update
+
+from logs.logging_config import log
+from utils.supervisor import worker_index
+
+
+# Заголовок, в котором Telegram передает секретный токен вебхука
+SECRET_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+
+class _WebhookRequestHandler(BaseHTTPRequestHandler):
+    """
+    Обработчик HTTP-запросов сервера вебхука.
+    """
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "_WebhookHTTPServer"
+
+    def _reply(self, status: int, headers: Dict[str, str] | None = None) -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self) -> None:
+        webhook = self.server.webhook
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.path != webhook.path:
+            return self._reply(404)
+        if webhook.secret_token and self.headers.get(SECRET_HEADER) != webhook.secret_token:
+            return self._reply(403)
+        try:
+            update = json.loads(body)
+        except ValueError:
+            return self._reply(400)
+        if webhook.enqueue(update):
+            return self._reply(200)
+        self._reply(503, {"Retry-After": "1"})
+
+    def log_message(self, format: str, *args: Any) -> None:
+        log.debug(f"Вебхук: {format % args}")
+
+
+class _WebhookHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Telegram открывает до 40 параллельных соединений (max_connections вебхука)
+    request_queue_size = 128
+    webhook: "WebhookServer"
+
+
+class WebhookServer:
+    """
+    Сервер вебхука Telegram для работы за обратным прокси. Принимает обновления методом POST, подтверждает
+    их ответом 200 сразу после постановки в очередь и обрабатывает в пуле потоков-обработчиков. Обновления
+    распределяются между потоками по идентификатору чата, поэтому обновления одного чата обрабатываются
+    по порядку. Очереди потоков ограничены: если место в очереди не освободилось за `enqueue_timeout` секунд,
+    обновление отклоняется ответом 503, и Telegram повторяет его доставку позже.
+
+    Attributes:
+        bot (TeleBot): Экземпляр бота.
+        path (str): Путь, по которому принимаются обновления.
+        secret_token (str | None): Секретный токен вебхука.
+        workers (int): Количество потоков-обработчиков.
+        queue_size (int): Максимальное количество обновлений в очереди потока-обработчика.
+        enqueue_timeout (float): Время ожидания места в заполненной очереди в секундах.
+        accepted (int): Количество принятых обновлений.
+        rejected (int): Количество обновлений, отклоненных из-за заполненной очереди.
+        processed (int): Количество обработанных обновлений.
+        errors (int): Количество обновлений, при обработке которых возникла ошибка.
+    """
+    def __init__(
+        self,
+        bot: TeleBot,
+        path: str = "/",
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        secret_token: str | None = None,
+        workers: int = 4,
+        queue_size: int = 100,
+        enqueue_timeout: float = 1.0,
+    ) -> None:
+        self.bot = bot
+        self.path = path
+        self.secret_token = secret_token
+        self.workers = workers
+        self.queue_size = queue_size
+        self.enqueue_timeout = enqueue_timeout
+        self.accepted = 0
+        self.rejected = 0
+        self.processed = 0
+        self.errors = 0
+        self._queues: List[Queue] = [Queue(maxsize=queue_size) for _ in range(workers)]
+        self._threads: List[Thread] = []
+        self._lock = Lock()
+        self._httpd = _WebhookHTTPServer((host, port), _WebhookRequestHandler)
+        self._httpd.webhook = self
+        self._http_thread: Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """
+        str: Локальный адрес, по которому сервер принимает обновления.
+        """
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{self.path}"
+
+    def enqueue(self, update: Dict[str, Any]) -> bool:
+        """
+        Ставит обновление в очередь потока-обработчика его чата.
+
+        Args:
+            update (Dict[str, Any]): Обновление в формате Telegram Bot API.
+
+        Returns:
+            bool: True, если обновление принято; False, если очередь осталась заполненной.
+        """
+        try:
+            self._queues[worker_index(update, self.workers)].put(update, timeout=self.enqueue_timeout)
+        except Full:
+            with self._lock:
+                self.rejected += 1
+            log.warning(f"Очередь вебхука заполнена, обновление {update.get('update_id')} отклонено.")
+            return False
+        with self._lock:
+            self.accepted += 1
+        return True
+
+    def _work(self, index: int) -> None:
+        updates = self._queues[index]
+        while True:
+            update = updates.get()
+            if update is None:
+                break
+            try:
+                self.bot.process_new_updates([Update.de_json(update)])
+            except Exception as exc:
+                with self._lock:
+                    self.errors += 1
+                log.error(
+                    f"Вебхук: ошибка обработки обновления {update.get('update_id')} {type(exc).__name__}: {exc}"
+                )
+            with self._lock:
+                self.processed += 1
+
+    def start(self) -> "WebhookServer":
+        """
+        Запускает потоки-обработчики и HTTP-сервер в фоновых потоках. Обработчики бота выполняются
+        в потоках-обработчиках сервера, а не в пуле потоков TeleBot.
+
+        Returns:
+            WebhookServer: Запущенный сервер.
+        """
+        self.bot.threaded = False
+        self._threads = [
+            Thread(target=self._work, args=(index,), name=f"webhook-worker-{index}", daemon=True)
+            for index in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+        self._http_thread = Thread(target=self._httpd.serve_forever, name="webhook-http", daemon=True)
+        self._http_thread.start()
+        log.info(f"Сервер вебхука принимает обновления по адресу {self.url} ({self.workers} потоков-обработчиков).")
+        return self
+
+    def serve_forever(self) -> None:
+        """
+        Запускает сервер и работает до прерывания (Ctrl+C или SIGTERM), после чего останавливает его.
+        """
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        self.start()
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """
+        Прекращает прием обновлений и останавливает потоки-обработчики после обработки принятых обновлений.
+        """
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        for updates in self._queues:
+            updates.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        log.info(f"Сервер вебхука остановлен: {self.stats()}.")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Возвращает статистику работы сервера.
+
+        Returns:
+            Dict[str, int]: Количество принятых, отклоненных, обработанных обновлений, ошибок обработки
+                и текущее количество обновлений в очередях.
+        """
+        with self._lock:
+            return {
+                "accepted": self.accepted,
+                "rejected": self.rejected,
+                "processed": self.processed,
+                "errors": self.errors,
+                "queued": sum(updates.qsize() for updates in self._queues),
+            }